@@ -0,0 +1,221 @@
+import random
+from typing import Dict, Iterator, List, Tuple
+
+from lxml import etree
+from pydantic import BaseModel
+
+from marcdantic.constants import MARC_NS
+from marcdantic.context import MarcContext
+from marcdantic.from_xml import from_xml
+
+#: Clark notation prefix of the MARCXML namespace
+_NS = f"{{{MARC_NS['marc']}}}"
+
+#: Default number of occurrences of each data field per record
+DEFAULT_TAG_MIX: Dict[str, float] = {
+    "020": 1.0,
+    "040": 1.0,
+    "100": 0.8,
+    "245": 1.0,
+    "250": 0.3,
+    "264": 1.0,
+    "300": 1.0,
+    "500": 1.5,
+    "650": 3.0,
+    "700": 1.2,
+    "910": 1.0,
+}
+
+_WORDS = (
+    "history chemistry poetry music atlas letters theory practice "
+    "introduction survey studies essays lectures notes documents "
+    "Bohemia Moravia Prague Brno Europe century modern ancient "
+    "library archive collection edition volume society science art"
+).split()
+
+_NAMES = (
+    "Novák Svoboda Dvořák Černý Procházka Kučera Veselý Horák "
+    "Němec Marek Pokorný Král Růžička Beneš Fiala Sedláček"
+).split()
+
+_SUBJECTS = (
+    "Dějiny Chemie Poezie Hudba Filozofie Fyzika Ekonomie Právo "
+    "Architektura Geografie Literatura Pedagogika"
+).split()
+
+
+class CorpusConfig(BaseModel):
+    """
+    Parameters of a synthetic corpus.
+
+    Attributes
+    ----------
+    records : int
+        Number of generated records.
+    seed : int
+        Seed of the random generator, equal seeds give equal corpora.
+    tag_mix : Dict[str, float]
+        Mean number of occurrences of each data field per record.
+    value_words : int
+        Mean number of words of a free text subfield.
+    holdings : int
+        Mean number of 996 holdings fields per record.
+    """
+
+    records: int = 1000
+    seed: int = 2024
+    tag_mix: Dict[str, float] = DEFAULT_TAG_MIX
+    value_words: int = 5
+    holdings: int = 3
+
+
+class CorpusGenerator:
+    """
+    Deterministic generator of realistic MARC bibliographic records.
+
+    Records contain the mandatory control fields (001, 005, 008), data
+    fields according to `CorpusConfig.tag_mix` and 996 holdings fields
+    with barcodes, volumes and years, serialized as MARCXML or MRC.
+
+    Examples
+    --------
+    >>> generator = CorpusGenerator(CorpusConfig(records=100, seed=1))
+    >>> data = generator.mrc()
+    """
+
+    def __init__(self, config: CorpusConfig = CorpusConfig()):
+        self.config = config
+
+    def _text(self, generator: random.Random, words: int = 0) -> str:
+        mean = self.config.value_words
+        count = words or max(1, round(generator.gauss(mean, 2)))
+        return " ".join(generator.choice(_WORDS) for _ in range(count))
+
+    def _occurrences(self, generator: random.Random, mean: float) -> int:
+        whole = int(mean)
+        return whole + (generator.random() < mean - whole)
+
+    def _subfields(
+        self, generator: random.Random, tag: str, number: int
+    ) -> List[Tuple[str, str]]:
+        if tag == "020":
+            return [("a", f"978-80-{generator.randrange(10**6):06d}-0")]
+        if tag == "040":
+            return [("a", "BOA001"), ("b", "cze"), ("e", "rda")]
+        if tag in ("100", "700"):
+            return [
+                (
+                    "a",
+                    f"{generator.choice(_NAMES)}, "
+                    f"{generator.choice(_NAMES)[0]}.",
+                ),
+                ("d", f"{generator.randrange(1800, 1990)}-"),
+                ("4", "aut"),
+            ]
+        if tag == "245":
+            return [
+                ("a", self._text(generator).capitalize()),
+                ("b", self._text(generator)),
+                ("c", generator.choice(_NAMES)),
+            ]
+        if tag == "264":
+            return [
+                ("a", generator.choice(["Praha", "Brno", "Olomouc"])),
+                ("b", self._text(generator, 2).title()),
+                ("c", str(generator.randrange(1900, 2025))),
+            ]
+        if tag == "300":
+            return [("a", f"{generator.randrange(20, 900)} stran")]
+        if tag == "650":
+            return [
+                ("a", generator.choice(_SUBJECTS)),
+                ("7", f"ph{generator.randrange(10**6):06d}"),
+                ("2", "czenas"),
+            ]
+        if tag == "910":
+            return [("a", "BOA001"), ("b", f"{number % 1000}")]
+        return [("a", self._text(generator))]
+
+    def _holdings(
+        self, generator: random.Random, number: int, position: int
+    ) -> List[Tuple[str, str]]:
+        year = generator.randrange(1950, 2025)
+        return [
+            ("b", f"2610{number:07d}{position:03d}"),
+            ("s", generator.choice(["P", "M", "N"])),
+            ("v", str(position + 1)),
+            ("y", str(year)),
+            ("i", f"{generator.randrange(1, 50)}"),
+        ]
+
+    def _record(self, generator: random.Random, number: int) -> etree._Element:
+        record = etree.Element(_NS + "record", nsmap={None: MARC_NS["marc"]})
+        etree.SubElement(record, _NS + "leader").text = (
+            "00000nam a2200000 i 4500"
+        )
+
+        year = generator.randrange(1950, 2025)
+        for tag, value in (
+            ("001", f"{number:09d}"),
+            ("003", "CZ-BrMZK"),
+            ("005", f"{year}0101120000.0"),
+            (
+                "008",
+                f"{year % 100:02d}0101s{year}    xr            000 0 cze d",
+            ),
+        ):
+            field = etree.SubElement(record, _NS + "controlfield", tag=tag)
+            field.text = value
+
+        fields: List[Tuple[str, List[Tuple[str, str]]]] = []
+        for tag, mean in sorted(self.config.tag_mix.items()):
+            for _ in range(self._occurrences(generator, mean)):
+                fields.append((tag, self._subfields(generator, tag, number)))
+
+        holdings = max(0, round(generator.gauss(self.config.holdings, 1)))
+        for position in range(holdings):
+            fields.append(
+                ("996", self._holdings(generator, number, position))
+            )
+
+        for tag, subfields in fields:
+            field = etree.SubElement(
+                record,
+                _NS + "datafield",
+                tag=tag,
+                ind1=generator.choice(["1", "0", " "]),
+                ind2=generator.choice(["0", "4", " "]),
+            )
+            for code, value in subfields:
+                subfield = etree.SubElement(field, _NS + "subfield", code=code)
+                subfield.text = value
+
+        return record
+
+    def iter_elements(self) -> Iterator[etree._Element]:
+        """Yield the MARCXML record elements of the corpus."""
+        generator = random.Random(self.config.seed)
+        for number in range(1, self.config.records + 1):
+            yield self._record(generator, number)
+
+    def xml(self) -> bytes:
+        """Return the corpus as a MARCXML collection."""
+        collection = etree.Element(
+            _NS + "collection", nsmap={None: MARC_NS["marc"]}
+        )
+        collection.extend(self.iter_elements())
+        return etree.tostring(
+            collection, xml_declaration=True, encoding="UTF-8"
+        )
+
+    def mrc_records(self) -> List[bytes]:
+        """Return the raw ISO 2709 records of the corpus."""
+        context = MarcContext()
+        return [
+            from_xml(element, context)["marc"]
+            for element in self.iter_elements()
+        ]
+
+    def mrc(self) -> bytes:
+        """Return the corpus as concatenated ISO 2709 records."""
+        return b"".join(self.mrc_records())
@@ -0,0 +1,286 @@
+import argparse
+import io
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List
+
+from lxml import etree
+
+from marcdantic.context import MarcContext
+from marcdantic.index import MarcIndex
+from marcdantic.matcher import compile_query
+from marcdantic.query import (
+    MarcBoolQuery,
+    MarcCondition,
+    MarcSearchRequest,
+    SearchOperator,
+)
+from marcdantic.readers import iter_mrc, iter_xml
+from marcdantic.record import MarcRecord
+
+from .corpus import CorpusConfig, CorpusGenerator
+
+#: Benchmark: function processing the prepared corpus and returning
+#: the number of processed records
+Benchmark = Callable[[], int]
+
+
+class Corpus:
+    """Generated data shared by the benchmarks."""
+
+    def __init__(self, config: CorpusConfig):
+        generator = CorpusGenerator(config)
+        self.mrc_records = generator.mrc_records()
+        self.mrc = b"".join(self.mrc_records)
+        self.xml = generator.xml()
+        self.xml_elements = list(generator.iter_elements())
+
+        context = MarcContext()
+        self.records = [
+            MarcRecord.from_mrc(data, context) for data in self.mrc_records
+        ]
+        self.dumps = [record.model_dump() for record in self.records]
+        self.json = [record.model_dump_json() for record in self.records]
+        self.barcodes = [
+            (issue.barcode if issue else None)
+            for issue in (
+                (record.issues_selector.all or [None])[-1]
+                for record in self.records
+            )
+        ]
+
+
+def build_benchmarks(corpus: Corpus) -> Dict[str, Benchmark]:
+    """Return the benchmarks of the parsing and query paths."""
+    context = MarcContext()
+    lazy_context = MarcContext(lazy_fields=True)
+    trusted_context = MarcContext(trusted=True)
+    query = MarcBoolQuery(
+        must=[MarcCondition(field="650", subfield="a", value="Chemie")],
+        must_not=[
+            MarcCondition(
+                field="245",
+                value=r"\bhistory\b",
+                operator=SearchOperator.Regex,
+            )
+        ],
+    )
+
+    def parse_mrc(parse_context: MarcContext) -> Benchmark:
+        def benchmark() -> int:
+            for data in corpus.mrc_records:
+                MarcRecord.from_mrc(data, parse_context)
+            return len(corpus.mrc_records)
+
+        return benchmark
+
+    def parse_xml() -> int:
+        for element in corpus.xml_elements:
+            MarcRecord.from_xml(element, context)
+        return len(corpus.xml_elements)
+
+    def stream_mrc() -> int:
+        return sum(1 for _ in iter_mrc(io.BytesIO(corpus.mrc), context))
+
+    def stream_xml() -> int:
+        return sum(1 for _ in iter_xml(io.BytesIO(corpus.xml), context))
+
+    def model_validate() -> int:
+        for data in corpus.dumps:
+            MarcRecord.model_validate(data, context={"marc_context": context})
+        return len(corpus.dumps)
+
+    def model_validate_json() -> int:
+        for data in corpus.json:
+            MarcRecord.model_validate_json(
+                data, context={"marc_context": context}
+            )
+        return len(corpus.json)
+
+    def query_subfield_values() -> int:
+        for record in corpus.records:
+            record.variable_fields.query_subfield_values(
+                '.["650"][]?.subfields.a[]?'
+            )
+        return len(corpus.records)
+
+    def query_jq() -> int:
+        for record in corpus.records:
+            record.variable_fields.query(
+                '[.["700"][]?.subfields.a[]? | ascii_downcase]'
+            )
+        return len(corpus.records)
+
+    def find_by_barcode() -> int:
+        for record, barcode in zip(corpus.records, corpus.barcodes):
+            if barcode is not None:
+                record.issues_selector.find_by_barcode(barcode)
+        return len(corpus.records)
+
+    def match_scan() -> int:
+        predicate = compile_query(query)
+        for record in corpus.records:
+            predicate(record)
+        return len(corpus.records)
+
+    def index_search() -> int:
+        index = MarcIndex(corpus.records)
+        index.search(MarcSearchRequest(query=query))
+        return len(corpus.records)
+
+    return {
+        "from_mrc": parse_mrc(context),
+        "from_mrc_lazy": parse_mrc(lazy_context),
+        "from_mrc_trusted": parse_mrc(trusted_context),
+        "from_xml": parse_xml,
+        "iter_mrc": stream_mrc,
+        "iter_xml": stream_xml,
+        "model_validate": model_validate,
+        "model_validate_json": model_validate_json,
+        "query_subfield_values": query_subfield_values,
+        "query_jq": query_jq,
+        "find_by_barcode": find_by_barcode,
+        "match_scan": match_scan,
+        "index_build_search": index_search,
+    }
+
+
+def measure(benchmark: Benchmark, repeat: int) -> Dict[str, Any]:
+    """
+    Run a benchmark `repeat` times and once more under `tracemalloc`.
+
+    The throughput is taken from the fastest run; tracing slows down
+    the code, so the peak memory is measured in a separate run.
+    """
+    best = float("inf")
+    records = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        records = benchmark()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        benchmark()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "records": records,
+        "seconds": best,
+        "records_per_second": records / best if best else None,
+        "peak_memory_bytes": peak,
+    }
+
+
+def run(
+    config: CorpusConfig, repeat: int = 3, only: List[str] | None = None
+) -> Dict[str, Any]:
+    """
+    Run the benchmarks and return the results with run metadata.
+    """
+    corpus = Corpus(config)
+    benchmarks = build_benchmarks(corpus)
+
+    results = {}
+    for name, benchmark in benchmarks.items():
+        if only and name not in only:
+            continue
+        results[name] = measure(benchmark, repeat)
+
+    return {
+        "created": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "lxml": ".".join(map(str, etree.LXML_VERSION)),
+        "corpus": config.model_dump(),
+        "repeat": repeat,
+        "mrc_bytes": len(corpus.mrc),
+        "xml_bytes": len(corpus.xml),
+        "results": results,
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any]) -> List[str]:
+    """
+    Describe the throughput change of each benchmark against
+    a baseline run.
+    """
+    lines = []
+    for name, result in current["results"].items():
+        previous = baseline.get("results", {}).get(name)
+        if not previous or not previous.get("records_per_second"):
+            lines.append(f"{name}: no baseline")
+            continue
+        change = (
+            result["records_per_second"] / previous["records_per_second"] - 1
+        )
+        lines.append(
+            f"{name}: {result['records_per_second']:.0f} records/s "
+            f"({change:+.1%})"
+        )
+    return lines
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Measure the throughput of marcdantic parsing "
+        "and query paths on a synthetic corpus."
+    )
+    parser.add_argument("--records", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=2024)
+    parser.add_argument(
+        "--holdings",
+        type=int,
+        default=3,
+        help="Mean number of 996 fields per record.",
+    )
+    parser.add_argument(
+        "--value-words",
+        type=int,
+        default=5,
+        help="Mean number of words of free text subfields.",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--only", nargs="+", help="Names of the benchmarks to run."
+    )
+    parser.add_argument(
+        "-o", "--output", help="Path of the JSON file with the results."
+    )
+    parser.add_argument(
+        "--compare", help="Path of a previous result file to compare with."
+    )
+    args = parser.parse_args(argv)
+
+    config = CorpusConfig(
+        records=args.records,
+        seed=args.seed,
+        holdings=args.holdings,
+        value_words=args.value_words,
+    )
+    results = run(config, args.repeat, args.only)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            lines = compare(results, json.load(file))
+    else:
+        lines = [
+            f"{name}: {result['records_per_second']:.0f} records/s, "
+            f"peak {result['peak_memory_bytes'] / 1024:.0f} KiB"
+            for name, result in results["results"].items()
+        ]
+    print("\n".join(lines))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,70 @@
-from . import context, fields, query, selectors
+from . import (
+    collection,
+    context,
+    fields,
+    index,
+    instrumentation,
+    jq_cache,
+    marc8,
+    matcher,
+    oai,
+    parallel,
+    paths,
+    percolator,
+    planner,
+    query,
+    readers,
+    selectors,
+    sqlite_index,
+    to_mrc,
+    to_xml,
+    writers,
+)
+from .collection import MrcCollection
+from .index import MarcIndex
+from .instrumentation import Instrumentation
 from .issue import MarcIssue
+from .oai import OaiListRecords
+from .parallel import parse_many
+from .percolator import MarcPercolator
+from .readers import iter_mrc, iter_xml
 from .record import MarcRecord
+from .sqlite_index import SqliteMarcIndex
+from .writers import MrcWriter, XmlWriter
 
 __all__ = [
+    "collection",
     "context",
     "fields",
+    "index",
+    "instrumentation",
+    "Instrumentation",
+    "iter_mrc",
+    "iter_xml",
+    "jq_cache",
+    "marc8",
+    "MarcIndex",
     "MarcIssue",
     "MarcIssueMapping",
+    "MarcPercolator",
     "MarcRecord",
+    "matcher",
+    "MrcCollection",
+    "MrcWriter",
+    "oai",
+    "OaiListRecords",
+    "parallel",
+    "parse_many",
+    "paths",
+    "percolator",
+    "planner",
     "query",
+    "readers",
     "selectors",
+    "sqlite_index",
+    "SqliteMarcIndex",
+    "to_mrc",
+    "to_xml",
+    "writers",
+    "XmlWriter",
 ]
@@ -1,60 +1,182 @@
 import argparse
 import os
+import sys
+from bisect import bisect_right
+from typing import IO, Iterable, Iterator, List, Tuple
 
 from lxml import etree
 
-from .record import MarcRecord
+from .context import MarcContext
+from .parallel import DEFAULT_PARSE_CHUNK_SIZE, RawRecord, parse_many
+from .readers import iter_mrc_data, iter_xml_data, open_input
 
+#: Extensions of the files processed when walking directories
+SUPPORTED_EXTENSIONS = (".mrc", ".xml", ".json")
 
-def process_file(file_path: str) -> None:
+#: Suffixes of compressed files, ignored when choosing the format
+COMPRESSION_SUFFIXES = (".gz", ".bz2", ".xz")
+
+#: Number of records between two progress reports
+PROGRESS_INTERVAL = 10000
+
+
+class RecordSource:
     """
-    Processes a single file by reading its content
-    and validating it using MarcRecord.
+    Raw records of a sequence of files, remembering which file each
+    record comes from and counting the files that cannot be read.
 
     Parameters
     ----------
-    file_path : str
-        The path to the file to be processed.
+    paths : iterable of str
+        Paths of the files to read.
+    log : IO[str]
+        Stream receiving progress and error messages.
     """
-    try:
-        with open(file_path, "rb") as file:
-            content = file.read()
-            # Validate and print the JSON output from MarcRecord
-            print(f"Processing file: {file_path}")
 
-            record: MarcRecord | None = None
+    def __init__(self, paths: Iterable[str], log: IO[str]):
+        self._paths = paths
+        self._log = log
+        self._starts: List[int] = []
+        self._files: List[str] = []
+        self.record_count = 0
+        self.file_errors = 0
+
+    def __iter__(self) -> Iterator[RawRecord]:
+        for file_path in self._paths:
+            print(f"Processing file: {file_path}", file=self._log)
+            self._starts.append(self.record_count)
+            self._files.append(file_path)
 
-            if file_path.endswith(".json"):
-                MarcRecord.model_validate(content)
-            elif file_path.endswith(".mrc"):
-                record = MarcRecord.from_mrc(content)
-            elif file_path.endswith(".xml"):
-                record = MarcRecord.from_xml(etree.fromstring(content))
+            try:
+                for data in iter_file_records(file_path):
+                    self.record_count += 1
+                    yield data
+            except (OSError, ValueError, etree.LxmlError) as error:
+                self.file_errors += 1
+                print(
+                    f"Error processing file {file_path}: {error}",
+                    file=self._log,
+                )
+
+    def locate(self, index: int) -> Tuple[str, int]:
+        """
+        Return the path of the file containing the record at `index`
+        and the position of the record within the file.
+        """
+        position = bisect_right(self._starts, index) - 1
+        return self._files[position], index - self._starts[position]
+
+
+def iter_file_records(file_path: str) -> Iterator[RawRecord]:
+    """
+    Iterate over the raw records of a file.
+
+    Multi-record `.mrc` and `.xml` files are streamed record by record;
+    a `.json` file holds a single record. Files compressed with gzip,
+    bz2 or xz (e.g. `dump.mrc.gz`) are decompressed on the fly.
+    """
+    name = strip_compression_suffix(file_path)
+    with open_input(file_path) as file:
+        if name.endswith(".mrc"):
+            yield from iter_mrc_data(file)
+        elif name.endswith(".xml"):
+            yield from iter_xml_data(file)
+        elif name.endswith(".json"):
+            yield file.read()
+
+
+def strip_compression_suffix(file_path: str) -> str:
+    """Return the file path without its compression suffix, if any."""
+    root, extension = os.path.splitext(file_path)
+    return root if extension in COMPRESSION_SUFFIXES else file_path
+
+
+def iter_paths(
+    files: List[str] | None, directories: List[str] | None
+) -> Iterator[str]:
+    """
+    Yield the given files and the supported files of the directories.
+    """
+    yield from files or []
 
-            print(record.model_dump_json(exclude_none=True, indent=2))
-    except NotADirectoryError as e:
-        print(f"Error processing file {file_path}: {e}")
+    for directory_path in directories or []:
+        for root, _, names in os.walk(directory_path):
+            for name in sorted(names):
+                if strip_compression_suffix(name).endswith(
+                    SUPPORTED_EXTENSIONS
+                ):
+                    yield os.path.join(root, name)
 
 
-def process_directory(directory_path: str) -> None:
+def process(
+    paths: Iterable[str],
+    output: IO[str],
+    log: IO[str] | None = None,
+    output_format: str = "json",
+    jobs: int | None = 1,
+    chunk_size: int = DEFAULT_PARSE_CHUNK_SIZE,
+    context: MarcContext = MarcContext(),
+) -> int:
     """
-    Processes all files in a directory by validating them using MarcRecord.
+    Parse the records of the files and write them as JSON.
 
     Parameters
     ----------
-    directory_path : str
-        The path to the directory containing files to be processed.
+    paths : iterable of str
+        Paths of the files to process.
+    output : IO[str]
+        Stream receiving the records.
+    log : IO[str] or None
+        Stream receiving progress and error messages,
+        standard error by default.
+    output_format : str
+        'json' for indented records, 'ndjson' for one compact record
+        per line.
+    jobs : int or None
+        Number of worker processes parsing the records,
+        None for one per CPU.
+    chunk_size : int
+        Number of records sent to a worker at once.
+    context : MarcContext
+        Parsing context of the records.
+
+    Returns
+    -------
+    int
+        Number of records and files that failed to be processed.
     """
-    try:
-        for root, _, files in os.walk(directory_path):
-            for file in files:
-                file_path = os.path.join(root, file)
-                process_file(file_path)
-    except Exception as e:
-        print(f"Error processing directory {directory_path}: {e}")
+    log = log or sys.stderr
+    indent = None if output_format == "ndjson" else 2
+    source = RecordSource(paths, log)
+    parsed = 0
+    errors = 0
 
+    for result in parse_many(source, context, jobs, chunk_size):
+        if result.record is None:
+            errors += 1
+            file_path, position = source.locate(result.index)
+            print(
+                f"Error processing record {position} of {file_path}: "
+                f"{result.error}",
+                file=log,
+            )
+            continue
 
-if __name__ == "__main__":
+        output.write(
+            result.record.model_dump_json(exclude_none=True, indent=indent)
+        )
+        output.write("\n")
+
+        parsed += 1
+        if parsed % PROGRESS_INTERVAL == 0:
+            print(f"Processed {parsed} records", file=log)
+
+    errors += source.file_errors
+    print(f"Processed {parsed} records, {errors} errors", file=log)
+    return errors
+
+
+def main(argv: List[str] | None = None) -> int:
     parser = argparse.ArgumentParser(
         description="Process MARC files or directories."
     )
@@ -65,14 +187,52 @@ if __name__ == "__main__":
     group.add_argument(
         "-d", "--dirs", nargs="+", help="One or more directories to process."
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes, 0 for one per CPU.",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_PARSE_CHUNK_SIZE,
+        help="Number of records sent to a worker at once.",
+    )
+    parser.add_argument(
+        "--output",
+        choices=["json", "ndjson"],
+        default="json",
+        help="Indented JSON records or one compact record per line.",
+    )
+    parser.add_argument(
+        "-o",
+        "--output-file",
+        help="Write the records to a file instead of standard output.",
+    )
+
+    args = parser.parse_args(argv)
+
+    output = (
+        open(args.output_file, "w", encoding="utf-8")
+        if args.output_file
+        else sys.stdout
+    )
+    try:
+        errors = process(
+            iter_paths(args.files, args.dirs),
+            output,
+            output_format=args.output,
+            jobs=args.jobs or None,
+            chunk_size=args.chunk_size,
+        )
+    finally:
+        if output is not sys.stdout:
+            output.close()
 
-    args = parser.parse_args()
+    return 1 if errors else 0
 
-    if args.files:
-        # Process each file in the list of provided files
-        for file_path in args.files:
-            process_file(file_path)
-    elif args.dirs:
-        # Process each directory, and process all files within them
-        for directory_path in args.dirs:
-            process_directory(directory_path)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,263 @@
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Dict, Iterator, List
+
+from .constants import DIRECTORY_ENTRY_LENGTH, FIELD_TERMINATOR, LEADER_LENGTH
+from .context import MarcContext
+from .from_mrc import resolve_encoding
+from .readers import RECORD_SEPARATORS, find_record_end
+from .record import MarcRecord
+
+#: Suffix of the offset index file stored next to the collection
+INDEX_SUFFIX = ".idx"
+
+_INDEX_MAGIC = b"MRCIDX1\n"
+_INDEX_HEADER = struct.Struct("<QQQ")
+
+
+class MrcCollection:
+    """
+    Random access to the records of a multi-record ISO 2709 file.
+
+    The file is memory-mapped and scanned once to build an offset table
+    of its records and a mapping of control numbers (001) to record
+    positions. Records are then sliced out of the mapping and parsed
+    only when requested.
+
+    Parameters
+    ----------
+    path : str
+        Path to the `.mrc` file.
+    context : MarcContext
+        Parsing context passed to `MarcRecord.from_mrc`.
+    index_path : str or None
+        Path of the offset index file. Defaults to `path` with
+        the `.idx` suffix appended. An existing index is reused when it
+        matches the size and modification time of the collection file.
+
+    Examples
+    --------
+    >>> with MrcCollection("dump.mrc") as collection:
+    ...     collection.save_index()
+    ...     record = collection[1000]
+    ...     other = collection.get("000123456")
+    """
+
+    def __init__(
+        self,
+        path: str,
+        context: MarcContext = MarcContext(),
+        index_path: str | None = None,
+    ):
+        self._path = path
+        self._context = context
+        self._index_path = index_path or path + INDEX_SUFFIX
+
+        self._offsets = array("Q")
+        self._lengths = array("I")
+        self._control_numbers: Dict[str, int] = {}
+
+        self._file = open(path, "rb")
+        self._mmap: mmap.mmap | bytes = b""
+        try:
+            stat = os.fstat(self._file.fileno())
+            self._size = stat.st_size
+            self._mtime = stat.st_mtime_ns
+
+            if self._size:
+                self._mmap = mmap.mmap(
+                    self._file.fileno(), 0, access=mmap.ACCESS_READ
+                )
+
+            if not self._load_index():
+                self._build_index()
+        except BaseException:
+            # e.g. a truncated file, the caller gets no object to close
+            self.close()
+            raise
+
+    # --- Context manager ---
+    def __enter__(self) -> "MrcCollection":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the memory mapping and the underlying file."""
+        if isinstance(self._mmap, mmap.mmap):
+            self._mmap.close()
+        self._file.close()
+
+    # --- Access ---
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __getitem__(self, position: int) -> MarcRecord:
+        return MarcRecord.from_mrc(self.get_data(position), self._context)
+
+    def __iter__(self) -> Iterator[MarcRecord]:
+        for position in range(len(self)):
+            yield self[position]
+
+    def __contains__(self, control_number: str) -> bool:
+        return control_number in self._control_numbers
+
+    def get_data(self, position: int) -> bytes:
+        """
+        Return the raw bytes of the record at `position`.
+
+        Raises
+        ------
+        IndexError
+            If `position` is out of range.
+        """
+        offset = self._offsets[position]
+        return self._mmap[offset : offset + self._lengths[position]]
+
+    def position_of(self, control_number: str) -> int | None:
+        """
+        Return the position of the first record with the given 001 value.
+        """
+        return self._control_numbers.get(control_number)
+
+    def get(self, control_number: str) -> MarcRecord | None:
+        """
+        Return the first record with the given control number (001),
+        or None if the collection contains no such record.
+        """
+        position = self._control_numbers.get(control_number)
+        if position is None:
+            return None
+        return self[position]
+
+    # --- Index ---
+    def _build_index(self) -> None:
+        data = self._mmap
+        size = self._size
+        position = 0
+
+        offsets = self._offsets
+        lengths = self._lengths
+        control_numbers = self._control_numbers
+
+        while position < size:
+            if data[position] in RECORD_SEPARATORS:
+                position += 1
+                continue
+
+            end = find_record_end(data, position)
+            if end == -1:
+                raise ValueError(
+                    f"Record at offset {position} of '{self._path}' "
+                    "is missing the record terminator."
+                )
+
+            control_number = self._read_control_number(position, end)
+            if control_number is not None:
+                control_numbers.setdefault(control_number, len(offsets))
+
+            offsets.append(position)
+            lengths.append(end - position)
+            position = end
+
+    def _read_control_number(self, start: int, end: int) -> str | None:
+        data = self._mmap
+
+        base_digits = data[start + 12 : start + 17]
+        if not base_digits.isdigit():
+            return None
+        base_address = start + int(base_digits)
+
+        entry = start + LEADER_LENGTH
+        while entry + DIRECTORY_ENTRY_LENGTH < base_address:
+            if data[entry : entry + 3] == b"001":
+                length_digits = data[entry + 3 : entry + 7]
+                offset_digits = data[entry + 7 : entry + 12]
+                if not (length_digits.isdigit() and offset_digits.isdigit()):
+                    return None
+
+                length = int(length_digits)
+                offset = base_address + int(offset_digits)
+                value = data[offset : min(offset + length, end)]
+                encoding = resolve_encoding(
+                    data[start : start + LEADER_LENGTH],
+                    self._context.mrc_encoding,
+                )
+                return (
+                    value.rstrip(FIELD_TERMINATOR).decode(encoding).strip()
+                )
+            entry += DIRECTORY_ENTRY_LENGTH
+
+        return None
+
+    def save_index(self, index_path: str | None = None) -> str:
+        """
+        Store the offset index next to the collection file.
+
+        Parameters
+        ----------
+        index_path : str or None
+            Target path, defaults to the index path of the collection.
+
+        Returns
+        -------
+        str
+            The path of the written index file.
+        """
+        index_path = index_path or self._index_path
+
+        positions: List[str] = [""] * len(self)
+        for control_number, position in self._control_numbers.items():
+            positions[position] = control_number
+
+        offsets = array("Q", self._offsets)
+        lengths = array("I", self._lengths)
+        if sys.byteorder != "little":
+            offsets.byteswap()
+            lengths.byteswap()
+
+        with open(index_path, "wb") as file:
+            file.write(_INDEX_MAGIC)
+            file.write(_INDEX_HEADER.pack(len(self), self._size, self._mtime))
+            offsets.tofile(file)
+            lengths.tofile(file)
+            file.write("\n".join(positions).encode("utf-8"))
+
+        return index_path
+
+    def _load_index(self) -> bool:
+        try:
+            with open(self._index_path, "rb") as file:
+                if file.read(len(_INDEX_MAGIC)) != _INDEX_MAGIC:
+                    return False
+
+                count, size, mtime = _INDEX_HEADER.unpack(
+                    file.read(_INDEX_HEADER.size)
+                )
+                if size != self._size or mtime != self._mtime:
+                    return False
+
+                offsets = array("Q")
+                lengths = array("I")
+                offsets.fromfile(file, count)
+                lengths.fromfile(file, count)
+                positions = file.read().decode("utf-8").split("\n")
+        except (OSError, EOFError, struct.error):
+            return False
+
+        if sys.byteorder != "little":
+            offsets.byteswap()
+            lengths.byteswap()
+
+        self._offsets = offsets
+        self._lengths = lengths
+        self._control_numbers = {}
+        for position, control_number in enumerate(positions[:count]):
+            if control_number:
+                self._control_numbers.setdefault(control_number, position)
+
+        return True
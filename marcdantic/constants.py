@@ -3,6 +3,12 @@ DIRECTORY_ENTRY_LENGTH = 12
 
 MARC_NS = {"marc": "http://www.loc.gov/MARC21/slim"}
 
+OAI_NS = {"oai": "http://www.openarchives.org/OAI/2.0/"}
+
 CONTROL_FIELDS = ["001", "003", "005", "006", "007", "008", "009"]
 
 MAX_RECORD_LENGTH = 99999
+
+SUBFIELD_DELIMITER = b"\x1f"
+FIELD_TERMINATOR = b"\x1e"
+RECORD_TERMINATOR = b"\x1d"
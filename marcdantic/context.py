@@ -1,12 +1,45 @@
-from typing import Dict, List, Literal
+from typing import Annotated, Any, Dict, FrozenSet, List, Literal, Self
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
+from .constants import CONTROL_FIELDS
 from .fields import FieldTag, MarcFieldSelector, SubfieldCode
+from .instrumentation import Instrumentation
 
 SkipTag = Literal["skip"]
 TagAliasMapping = Dict[str, FieldTag | MarcFieldSelector | SkipTag]
 
+#: Tag or tag range, 'X' matches any digit (e.g., '245', '9XX', '6X0')
+TagPattern = Annotated[str, Field(..., pattern=r"^[0-9Xx]{3}$")]
+
+#: Every syntactically valid MARC field tag
+ALL_TAGS: FrozenSet[str] = frozenset(f"{tag:03d}" for tag in range(1000))
+
+
+def expand_tag_patterns(patterns: List[str]) -> FrozenSet[str]:
+    """
+    Expand tag patterns with 'X' wildcards to the set of matching tags.
+
+    Parameters
+    ----------
+    patterns : list of str
+        Tags or tag ranges, e.g. ['001', '245', '9XX'].
+
+    Returns
+    -------
+    frozenset of str
+        All three digit tags matched by at least one pattern.
+    """
+    return frozenset(
+        tag
+        for tag in ALL_TAGS
+        for pattern in patterns
+        if all(
+            expected in "Xx" or expected == actual
+            for expected, actual in zip(pattern, tag)
+        )
+    )
+
 
 class MarcIssueMapping(BaseModel):
     """
@@ -27,7 +60,38 @@ class TagAlias(BaseModel):
     code: SubfieldCode | None = None
 
 
+class CompiledContext(BaseModel):
+    """
+    Immutable lookup tables derived from a `MarcContext`, used by
+    the parsers for constant time decisions on every field.
+
+    Attributes
+    ----------
+    skip_tags : FrozenSet[str]
+        Tags dropped before alias resolution.
+    aliases : Dict[str, TagAlias]
+        Tag aliases keyed by their source tag; the first alias of
+        a source tag wins.
+    valid_tags : FrozenSet[str]
+        Syntactically valid tags after alias resolution.
+    selected_tags : FrozenSet[str]
+        Tags kept according to `include_tags` and `exclude_tags`.
+    control_fields : FrozenSet[str]
+        Tags of the control fields.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    skip_tags: FrozenSet[str]
+    aliases: Dict[str, TagAlias]
+    valid_tags: FrozenSet[str]
+    selected_tags: FrozenSet[str]
+    control_fields: FrozenSet[str]
+
+
 class MarcContext(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     skip_tags: List[str] = ["LDR"]
     tag_aliases: List[TagAlias] = [
         TagAlias(from_tag="FMT", tag="990", code="a"),
@@ -42,5 +106,81 @@ class MarcContext(BaseModel):
         bundle="i",
     )
     ignore_unknown_tags: bool = True
+    #: Codec of ISO 2709 records, e.g. 'utf-8' or 'marc8';
+    #: 'auto' chooses UTF-8 or MARC-8 per record from leader/09
     mrc_encoding: str = "utf-8"
+    lazy_fields: bool = False
+    trusted: bool = False
     mandatory_fields: List[FieldTag] = ["001", "005", "008"]
+    #: Tag patterns (e.g. '245', '6XX') of the fields kept by the
+    #: parsers, all tags if None; `mandatory_fields` are checked after
+    #: the projection, so they must be included (or cleared)
+    include_tags: List[TagPattern] | None = None
+    exclude_tags: List[TagPattern] = []
+    #: Opt-in collector of parsing timings and counters
+    instrumentation: Instrumentation | None = Field(default=None, exclude=True)
+
+    _compiled: CompiledContext | None = PrivateAttr(default=None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in type(self).model_fields:
+            self._compiled = None
+
+    def __copy__(self) -> Self:
+        # `model_copy(update=...)` writes the updated fields directly to
+        # the copy, bypassing `__setattr__`
+        copied = super().__copy__()
+        copied._compiled = None
+        return copied
+
+    def __deepcopy__(self, memo: Dict[int, Any] | None = None) -> Self:
+        copied = super().__deepcopy__(memo)
+        copied._compiled = None
+        return copied
+
+    @property
+    def compiled(self) -> CompiledContext:
+        """
+        Lookup tables of the context, built on first use and cached on
+        the instance.
+
+        The cache is reset when a field is assigned and is not shared
+        by copies; lists modified in place after the first parse are
+        not picked up.
+        """
+        if self._compiled is None:
+            aliases: Dict[str, TagAlias] = {}
+            for alias in self.tag_aliases:
+                aliases.setdefault(alias.from_tag, alias)
+
+            selected = (
+                ALL_TAGS
+                if self.include_tags is None
+                else expand_tag_patterns(self.include_tags)
+            )
+            self._compiled = CompiledContext(
+                skip_tags=frozenset(self.skip_tags),
+                aliases=aliases,
+                valid_tags=ALL_TAGS,
+                selected_tags=selected
+                - expand_tag_patterns(self.exclude_tags),
+                control_fields=frozenset(CONTROL_FIELDS),
+            )
+        return self._compiled
+
+    @property
+    def selected_tags(self) -> FrozenSet[str]:
+        """
+        Tags kept by the parsers according to `include_tags`
+        and `exclude_tags`.
+
+        Patterns are matched against the tag after alias resolution,
+        so excluding '9XX' also drops fields aliased to 990 or 991.
+
+        `MarcRecord` checks `mandatory_fields` on the projected record:
+        with the default ['001', '005', '008'], an `include_tags` (or
+        `exclude_tags`) dropping any of them makes every record fail
+        validation unless `mandatory_fields` is adjusted as well.
+        """
+        return self.compiled.selected_tags
@@ -1,7 +1,17 @@
-from typing import Annotated, Any, Dict, List
+from typing import Annotated, Any, Callable, Dict, List, Type, TypeVar
 
-import jq
-from pydantic import BaseModel, Field, PrivateAttr, RootModel, model_validator
+from pydantic import (
+    BaseModel,
+    Field,
+    PrivateAttr,
+    RootModel,
+    SerializerFunctionWrapHandler,
+    model_serializer,
+    model_validator,
+)
+
+from .jq_cache import compile_jq
+from .paths import PathProgram
 
 #: Pattern used to validate field tags (must be exactly three digits)
 FIELD_TAG_PATTERN = r"^\d{3}$"
@@ -13,6 +23,44 @@ SubfieldCode = Annotated[str, Field(..., pattern=r"^[a-zA-Z0-9]$")]
 #: MARC indicator (one character: digit, letter, or space)
 Indicator = Annotated[str | None, Field(None, pattern=r"^[0-9a-z\? ]?$")]
 
+_object_setattr = object.__setattr__
+
+ModelType = TypeVar("ModelType", bound=BaseModel)
+
+
+def construct_model(
+    model_cls: Type[ModelType],
+    values: Dict[str, Any],
+    private: Dict[str, Any] | None = None,
+) -> ModelType:
+    """
+    Create a model instance from trusted values without validation.
+
+    This is a leaner equivalent of `BaseModel.model_construct`: `values`
+    is adopted as the instance `__dict__` without copying, no defaults
+    are filled in and private attribute factories are not called.
+
+    Parameters
+    ----------
+    model_cls : type of BaseModel
+        The model class to instantiate.
+    values : dict of str to Any
+        Values of all the model fields, already in their final form.
+    private : dict of str to Any or None
+        Values of all the private attributes of the model, if any.
+
+    Returns
+    -------
+    BaseModel
+        The constructed model instance.
+    """
+    model = model_cls.__new__(model_cls)
+    _object_setattr(model, "__dict__", values)
+    _object_setattr(model, "__pydantic_fields_set__", set(values))
+    _object_setattr(model, "__pydantic_extra__", None)
+    _object_setattr(model, "__pydantic_private__", private)
+    return model
+
 
 class VariableField(BaseModel):
     """
@@ -58,17 +106,205 @@ class VariableField(BaseModel):
         Any
             The result of the jq query (list, string, number, etc.)
         """
-        compiled = jq.compile(jq_filter)
+        compiled = compile_jq(jq_filter)
+        if isinstance(compiled, PathProgram):
+            return compiled.all(self)
         return compiled.input(self.model_dump()).all()
 
 
+def construct_variable_field(data: Dict[str, Any]) -> VariableField:
+    """
+    Create a `VariableField` from trusted parser output.
+
+    Parameters
+    ----------
+    data : dict of str to Any
+        Dictionary with exactly the 'ind1', 'ind2' and 'subfields' keys,
+        blank indicators already normalized to None.
+
+    Returns
+    -------
+    VariableField
+        The field, built without running validation.
+    """
+    return construct_model(VariableField, data)
+
+
 class FixedFields(RootModel[Dict[FieldTag, str]]):
     pass
 
 
+class LazyVariableFieldsDict(dict):
+    """
+    Variable fields mapping that decodes the fields of a tag on demand.
+
+    The mapping is created by `from_mrc` in lazy mode with the still
+    undecoded directory entries of every tag. The first lookup of a tag runs
+    `load` on its entries and stores the resulting `VariableField` list
+    in the dictionary itself, so later lookups cost a plain dict access.
+
+    Membership tests and `len` never decode anything. Operations that
+    need every value (iteration, `items`, `values`, comparison,
+    serialization, pickling) decode all remaining tags first and restore
+    the original tag order.
+
+    Parameters
+    ----------
+    pending : dict of str to Any
+        Undecoded entries keyed by tag, in the order of the record.
+        Membership tests trust every pending tag to load at least one
+        field; a tag loading none is dropped once decoded.
+    load : callable
+        Function turning the entries of a single tag into a list of
+        `VariableField` instances.
+    """
+
+    __slots__ = ("_pending", "_load", "_order")
+
+    def __init__(
+        self,
+        pending: Dict[str, Any],
+        load: Callable[[Any], List[VariableField]],
+    ):
+        super().__init__()
+        self._pending = pending
+        self._load = load
+        self._order = list(pending)
+
+    @property
+    def pending_tags(self) -> List[str]:
+        """Tags whose fields have not been decoded yet."""
+        return list(self._pending)
+
+    def _load_tag(self, tag: str) -> None:
+        fields = self._load(self._pending.pop(tag))
+        # A tag without any field is left out, as in eager parsing
+        if fields:
+            dict.__setitem__(self, tag, fields)
+
+    def materialize(self) -> None:
+        """
+        Decode all pending tags, keeping the order of the record.
+        """
+        if not self._pending:
+            return
+
+        for tag in list(self._pending):
+            self._load_tag(tag)
+
+        ordered = {
+            tag: dict.__getitem__(self, tag)
+            for tag in self._order
+            if dict.__contains__(self, tag)
+        }
+        for tag, fields in dict.items(self):
+            ordered.setdefault(tag, fields)
+
+        dict.clear(self)
+        dict.update(self, ordered)
+
+    # --- Lookups decoding a single tag ---
+    def __getitem__(self, tag: str) -> List[VariableField]:
+        if tag in self._pending:
+            self._load_tag(tag)
+        return dict.__getitem__(self, tag)
+
+    def get(self, tag: str, default: Any = None) -> Any:
+        if tag in self._pending:
+            self._load_tag(tag)
+        return dict.get(self, tag, default)
+
+    def setdefault(self, tag: str, default: Any = None) -> Any:
+        if tag in self._pending:
+            self._load_tag(tag)
+        return dict.setdefault(self, tag, default)
+
+    def pop(self, tag: str, *default: Any) -> Any:
+        if tag in self._pending:
+            self._load_tag(tag)
+        return dict.pop(self, tag, *default)
+
+    def __contains__(self, tag: object) -> bool:
+        return dict.__contains__(self, tag) or tag in self._pending
+
+    def __len__(self) -> int:
+        return dict.__len__(self) + len(self._pending)
+
+    # --- Updates dropping the pending entries of a tag ---
+    def __setitem__(self, tag: str, fields: List[VariableField]) -> None:
+        self._pending.pop(tag, None)
+        dict.__setitem__(self, tag, fields)
+
+    def __delitem__(self, tag: str) -> None:
+        if self._pending.pop(tag, None) is None:
+            dict.__delitem__(self, tag)
+        else:
+            dict.pop(self, tag, None)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for tag, fields in dict(*args, **kwargs).items():
+            self[tag] = fields
+
+    def clear(self) -> None:
+        self._pending.clear()
+        dict.clear(self)
+
+    # --- Operations requiring all values ---
+    def __iter__(self):
+        self.materialize()
+        return dict.__iter__(self)
+
+    def keys(self):
+        self.materialize()
+        return dict.keys(self)
+
+    def values(self):
+        self.materialize()
+        return dict.values(self)
+
+    def items(self):
+        self.materialize()
+        return dict.items(self)
+
+    def popitem(self):
+        self.materialize()
+        return dict.popitem(self)
+
+    def copy(self) -> Dict[str, List[VariableField]]:
+        self.materialize()
+        return dict(dict.items(self))
+
+    def __eq__(self, other: object) -> bool:
+        self.materialize()
+        if isinstance(other, LazyVariableFieldsDict):
+            other.materialize()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    def __repr__(self) -> str:
+        self.materialize()
+        return dict.__repr__(self)
+
+    def __reduce__(self):
+        return (dict, (self.copy(),))
+
+
 class VariableFields(RootModel[Dict[FieldTag, List[VariableField]]]):
     _plain_root: Dict[str, Any] | None = PrivateAttr(default=None)
 
+    @model_serializer(mode="wrap")
+    def materialize_lazy_fields(
+        self, handler: SerializerFunctionWrapHandler
+    ) -> Any:
+        """
+        Decodes pending fields of lazily parsed records before export.
+        """
+        if isinstance(self.root, LazyVariableFieldsDict):
+            self.root.materialize()
+        return handler(self)
+
     def query(self, jq_filter: str) -> Any:
         """
         Execute a jq query on the variable fields.
@@ -83,7 +319,9 @@ class VariableFields(RootModel[Dict[FieldTag, List[VariableField]]]):
         Any
             The result of the jq query (list, string, number, etc.)
         """
-        compiled = jq.compile(jq_filter)
+        compiled = compile_jq(jq_filter)
+        if isinstance(compiled, PathProgram):
+            return compiled.all(self.root)
 
         if self._plain_root is None:
             self._plain_root = {
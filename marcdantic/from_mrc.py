@@ -1,12 +1,39 @@
-import re
-from typing import Any, Dict
+from functools import partial
+from time import perf_counter
+from typing import Any, Dict, List, Tuple
 
-from .constants import CONTROL_FIELDS, DIRECTORY_ENTRY_LENGTH, LEADER_LENGTH
+from . import marc8  # registers the "marc8" codec
+from .constants import DIRECTORY_ENTRY_LENGTH, LEADER_LENGTH
 from .context import MarcContext
-from .fields import FIELD_TAG_PATTERN
+from .fields import (
+    LazyVariableFieldsDict,
+    VariableField,
+    construct_variable_field,
+)
+from .instrumentation import get_instrumentation
 
+#: `MarcContext.mrc_encoding` choosing the codec of every record
+#: from its leader
+AUTO_ENCODING = "auto"
 
-def from_mrc(data: bytes, context: MarcContext) -> Dict[str, Any]:
+
+def resolve_encoding(data: bytes, encoding: str) -> str:
+    """
+    Return the codec of a record.
+
+    With the 'auto' encoding, the codec is chosen from the character
+    coding scheme in the leader (position 09): 'a' stands for UTF-8,
+    anything else (normally blank) for MARC-8. Other encodings are
+    returned unchanged.
+    """
+    if encoding != AUTO_ENCODING:
+        return encoding
+    return "utf-8" if data[9:10] == b"a" else marc8.MARC8_CODEC_NAME
+
+
+def from_mrc(
+    data: bytes | bytearray | memoryview, context: MarcContext
+) -> Dict[str, Any]:
     """
     Parses a raw MARC21 record from its binary representation into
     a structured dictionary.
@@ -17,11 +44,15 @@ def from_mrc(data: bytes, context: MarcContext) -> Dict[str, Any]:
 
     Parameters
     ----------
-    data : bytes
-        The raw MARC21 record bytes.
-    encoding : str
-        The character encoding used for decoding the MARC data fields
-        (commonly 'utf-8' or 'marc8').
+    data : bytes, bytearray or memoryview
+        The raw MARC21 record, e.g. a memoryview of a memory-mapped
+        file. Buffers other than bytes are copied once, as the record
+        keeps its raw bytes.
+    context : MarcContext
+        The parsing context, providing the character encoding
+        (`mrc_encoding`) used for decoding the field data. With 'auto',
+        the encoding is chosen per record by `resolve_encoding` before
+        anything is decoded.
 
     Returns
     -------
@@ -29,6 +60,8 @@ def from_mrc(data: bytes, context: MarcContext) -> Dict[str, Any]:
         A dictionary with the following keys:
         - "marc": bytes
             The original raw MARC record bytes.
+        - "encoding": str
+            The codec the record was decoded with.
         - "leader": str
             The leader string extracted from the record
             (usually 24 characters).
@@ -36,8 +69,8 @@ def from_mrc(data: bytes, context: MarcContext) -> Dict[str, Any]:
             Fixed fields without subfields, keyed by tag.
         - "variable_fields": Dict[str, List[Dict[str, Any]]]
             Variable fields keyed by tag, each containing:
-              - 'ind1': first indicator character,
-              - 'ind2': second indicator character,
+              - 'ind1': first indicator character (None if blank),
+              - 'ind2': second indicator character (None if blank),
               - 'subfields': dictionary of subfield codes mapped to
                 lists of subfield values.
 
@@ -50,39 +83,66 @@ def from_mrc(data: bytes, context: MarcContext) -> Dict[str, Any]:
     Notes
     -----
     - The MARC directory is parsed to locate field tags, lengths, and offsets.
-    - Tags are validated with a regex and mapped using `MARC_MAPPER` aliases
-      if necessary.
+    - Tags are skipped, mapped using the tag aliases and validated with
+      the lookup tables of `context.compiled`.
+    - Fields whose (aliased) tag is not in `context.selected_tags` are
+      skipped using the directory entry only, before any of their data
+      is sliced or decoded.
     - Control fields (in CONTROL_FIELDS) are parsed as simple text values.
     - Variable fields include indicators and are split into subfields using
       the subfield delimiter (0x1F).
+    - The data of each field is decoded once and split into subfields
+      as text, without slicing every subfield out of the bytes.
     - The function does not explicitly validate every MARC rule but assumes
       a well-formed input.
+    - The directory is resolved to the kept fields before any field
+      data is decoded; with `context.instrumentation` (or an active
+      `Instrumentation`), both stages are timed separately.
+    - With `context.lazy_fields` enabled, only the leader, the directory
+      and the control fields are decoded. "variable_fields" is then
+      a `LazyVariableFieldsDict` keeping the offsets of the fields, which
+      are decoded and validated per tag on first access.
     """
+    if not isinstance(data, bytes):
+        # The record keeps its raw bytes, copied once out of the buffer
+        data = memoryview(data).cast("B").tobytes()
 
-    def ascii(data: bytes) -> str:
-        return data.decode("ascii")
-
-    def ascii_slice(data: bytes, start: int, end: int) -> str:
-        return ascii(data[start:end])
+    encoding = resolve_encoding(data, context.mrc_encoding)
 
-    def decode(data: bytes) -> str:
-        return data.decode(context.mrc_encoding)
-
-    def decode_slice(data: bytes, start: int, end: int) -> str:
-        return decode(data[start:end])
+    instrumentation = get_instrumentation(context)
+    if instrumentation is not None:
+        started = perf_counter()
+        if context.mrc_encoding == AUTO_ENCODING:
+            instrumentation.count(f"encoding.{encoding}")
 
     record = {
         "marc": data,
-        "leader": decode_slice(data, 0, LEADER_LENGTH),
+        "encoding": encoding,
+        "leader": data[:LEADER_LENGTH].decode(encoding),
         "fixed_fields": {},
         "variable_fields": {},
     }
 
+    # Directory entries per tag, decoded on first access in lazy mode
+    lazy_fields: Dict[str, List[Tuple[str | None, int, int]]] | None = (
+        {} if context.lazy_fields else None
+    )
+
+    compiled = context.compiled
+    skip_tags = compiled.skip_tags
+    aliases = compiled.aliases
+    valid_tags = compiled.valid_tags
+    selected_tags = compiled.selected_tags
+    control_fields = compiled.control_fields
+
     base_address = int(record["leader"][12:17].strip() or 0)
-    directory = ascii_slice(data, LEADER_LENGTH, base_address - 1)
+    directory = data[LEADER_LENGTH : base_address - 1].decode("ascii")
     field_total = len(directory) // DIRECTORY_ENTRY_LENGTH
 
-    # Process Fields
+    # Resolved directory entries: (tag, alias code, data start, data end)
+    entries: List[Tuple[str, str | None, int, int]] = []
+
+    # Process Directory
     for field_count in range(field_total):
         entry_start = field_count * DIRECTORY_ENTRY_LENGTH
         entry_end = entry_start + DIRECTORY_ENTRY_LENGTH
@@ -96,59 +156,187 @@ def from_mrc(data: bytes, context: MarcContext) -> Dict[str, Any]:
         data_start = base_address + entry_offset
         data_end = data_start + entry_length - 1
 
-        entry_data = data[data_start:data_end]
-
-        if entry_tag in context.skip_tags:
+        if entry_tag in skip_tags:
+            if instrumentation is not None:
+                instrumentation.count("skipped_tags")
             continue
 
-        tag_alias = next(
-            (
-                alias
-                for alias in context.tag_aliases
-                if alias.from_tag == entry_tag
-            ),
-            None,
-        )
+        tag_alias = aliases.get(entry_tag)
         entry_code = None
 
         if tag_alias:
             entry_tag = tag_alias.tag
             entry_code = tag_alias.code
+            if instrumentation is not None:
+                instrumentation.count("aliased_tags")
 
-        if not re.match(FIELD_TAG_PATTERN, entry_tag):
+        if entry_tag not in valid_tags:
             if context.ignore_unknown_tags:
+                if instrumentation is not None:
+                    instrumentation.count("unknown_tags")
                 continue
             raise ValueError(f"Invalid MARC tag '{entry_tag}' encountered.")
 
-        if entry_tag in CONTROL_FIELDS:
-            record["fixed_fields"][entry_tag] = decode(entry_data)
-        elif entry_code:
-            entry_text = decode(entry_data)
-            if not entry_text.strip():
+        if entry_tag not in selected_tags:
+            if instrumentation is not None:
+                instrumentation.count("excluded_tags")
+            continue
+
+        entries.append((entry_tag, entry_code, data_start, data_end))
+
+    if instrumentation is not None:
+        decoding = perf_counter()
+        instrumentation.add_time("mrc.directory", decoding - started)
+
+    # Process Fields
+    for entry_tag, entry_code, data_start, data_end in entries:
+        if entry_tag in control_fields:
+            record["fixed_fields"][entry_tag] = data[
+                data_start:data_end
+            ].decode(encoding)
+        elif lazy_fields is not None:
+            # Blank aliased fields are dropped by the eager path; drop them
+            # here already so every pending tag decodes to some field
+            if (
+                entry_code
+                and not data[data_start:data_end].decode(encoding).strip()
+            ):
                 continue
-            record["variable_fields"].setdefault(entry_tag, []).append(
-                {
-                    "ind1": " ",
-                    "ind2": " ",
-                    "subfields": {entry_code: [decode(entry_data)]},
-                }
+            lazy_fields.setdefault(entry_tag, []).append(
+                (entry_code, data_start, data_end)
             )
         else:
-            variable_field = {
-                "ind1": ascii_slice(entry_data, 0, 1),
-                "ind2": ascii_slice(entry_data, 1, 2),
-            }
-
-            subfields = {}
-            for subfield_entry in entry_data[3:].split(b"\x1f"):
-                subfields.setdefault(decode(subfield_entry[0:1]), []).append(
-                    decode(subfield_entry[1:])
-                )
-
-            variable_field["subfields"] = subfields
+            variable_field = parse_variable_field(
+                data[data_start:data_end], entry_code, context, encoding
+            )
+            if variable_field is None:
+                continue
 
             record["variable_fields"].setdefault(entry_tag, []).append(
                 variable_field
             )
 
+    if instrumentation is not None:
+        instrumentation.add_time("mrc.decode", perf_counter() - decoding)
+        instrumentation.count("records")
+        instrumentation.count("fields", len(entries))
+        if lazy_fields is None:
+            instrumentation.count("bytes_decoded", len(data))
+        else:
+            # Only the leader, the directory and control fields so far
+            instrumentation.count(
+                "bytes_decoded",
+                base_address
+                + sum(
+                    data_end - data_start
+                    for tag, _, data_start, data_end in entries
+                    if tag in control_fields
+                ),
+            )
+
+    if lazy_fields is not None:
+        record["variable_fields"] = LazyVariableFieldsDict(
+            lazy_fields,
+            partial(_load_variable_fields, data, context, encoding),
+        )
+
     return record
+
+
+def parse_variable_field(
+    entry_data: bytes,
+    entry_code: str | None,
+    context: MarcContext,
+    encoding: str | None = None,
+) -> Dict[str, Any] | None:
+    """
+    Parses the data of a single variable field.
+
+    Parameters
+    ----------
+    entry_data : bytes
+        The field data without the field terminator.
+    entry_code : str or None
+        Subfield code of a tag alias mapping the whole field data
+        to a single subfield, or None for regular data fields.
+    context : MarcContext
+        The parsing context providing the record encoding.
+    encoding : str or None
+        Codec of the record resolved by `resolve_encoding`,
+        `context.mrc_encoding` by default.
+
+    Returns
+    -------
+    dict[str, Any] or None
+        A dictionary with 'ind1', 'ind2' and 'subfields' keys,
+        or None if an aliased field contains only whitespace.
+        Blank indicators are normalized to None.
+    """
+    # The delimiter (0x1F) cannot occur inside multi-byte characters,
+    # so the whole field is decoded once and split as text
+    entry_text = entry_data.decode(encoding or context.mrc_encoding)
+
+    if entry_code:
+        if not entry_text.strip():
+            return None
+        return {
+            "ind1": None,
+            "ind2": None,
+            "subfields": {entry_code: [entry_text]},
+        }
+
+    ind1 = entry_text[0:1]
+    ind2 = entry_text[1:2]
+    if not (ind1 + ind2).isascii():
+        raise ValueError(f"Invalid MARC indicators '{ind1}{ind2}'.")
+
+    subfields: Dict[str, List[str]] = {}
+    for subfield_entry in entry_text[3:].split("\x1f"):
+        subfields.setdefault(subfield_entry[0:1], []).append(
+            subfield_entry[1:]
+        )
+
+    return {
+        "ind1": None if ind1 == " " else ind1,
+        "ind2": None if ind2 == " " else ind2,
+        "subfields": subfields,
+    }
+
+
+def _load_variable_fields(
+    data: bytes,
+    context: MarcContext,
+    encoding: str,
+    entries: List[Tuple[str | None, int, int]],
+) -> List[VariableField]:
+    """
+    Decodes and validates the variable fields of a single tag
+    from the directory entries kept by a lazily parsed record.
+    Validation is skipped for trusted contexts.
+    """
+    create = (
+        construct_variable_field
+        if context.trusted
+        else VariableField.model_validate
+    )
+
+    instrumentation = get_instrumentation(context)
+    if instrumentation is not None:
+        started = perf_counter()
+
+    fields = []
+    for entry_code, data_start, data_end in entries:
+        variable_field = parse_variable_field(
+            data[data_start:data_end], entry_code, context, encoding
+        )
+        if variable_field is not None:
+            fields.append(create(variable_field))
+
+    if instrumentation is not None:
+        instrumentation.add_time("mrc.decode", perf_counter() - started)
+        instrumentation.count("lazy_loads")
+        instrumentation.count(
+            "bytes_decoded",
+            sum(data_end - data_start for _, data_start, data_end in entries),
+        )
+    return fields
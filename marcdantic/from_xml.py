@@ -1,11 +1,19 @@
-import re
-from typing import Any, Dict, List
+from time import perf_counter
+from typing import Any, Dict, List, Tuple
 
 from lxml.etree import _Element
 
-from .constants import LEADER_LENGTH, MARC_NS, MAX_RECORD_LENGTH
+from .constants import LEADER_LENGTH, MARC_NS
 from .context import MarcContext
-from .fields import FIELD_TAG_PATTERN
+from .instrumentation import get_instrumentation
+from .to_mrc import build_marc
+
+_COLLECTION = f"{{{MARC_NS['marc']}}}collection"
+_RECORD = f"{{{MARC_NS['marc']}}}record"
+_LEADER = f"{{{MARC_NS['marc']}}}leader"
+_CONTROLFIELD = f"{{{MARC_NS['marc']}}}controlfield"
+_DATAFIELD = f"{{{MARC_NS['marc']}}}datafield"
+_SUBFIELD = f"{{{MARC_NS['marc']}}}subfield"
 
 
 def from_xml(root: _Element, context: MarcContext) -> Dict[str, Any]:
@@ -24,7 +32,9 @@ def from_xml(root: _Element, context: MarcContext) -> Dict[str, Any]:
     ----------
     root : lxml.etree._Element
         The root XML element of the MARC record
-        (expected to use MARC XML namespace).
+        (expected to use MARC XML namespace), or a `collection` element
+        wrapping a single record, as returned by
+        `etree.parse("record.xml").getroot()` for such files.
 
     Returns
     -------
@@ -36,178 +46,173 @@ def from_xml(root: _Element, context: MarcContext) -> Dict[str, Any]:
             Fixed fields with no subfields, keyed by their MARC tag.
         - "variable_fields": Dict[str, List[Dict[str, Any]]]
             Variable fields keyed by MARC tag; each field contains indicators
-            and subfields.
+            (None if blank) and subfields.
         - "marc": bytes
             The reconstructed raw MARC21 byte sequence representing
             the full record.
+        - "encoding": str
+            The codec of the raw bytes, always 'utf-8'.
 
     Raises
     ------
     ValueError
-        If the leader string length is not equal to the expected LEADER_LENGTH.
+        If the leader is missing or its length is not equal to
+        the expected LEADER_LENGTH.
+        If a `collection` does not hold exactly one record.
         If a MARC tag does not have exactly 3 characters.
 
     Notes
     -----
-    - The function validates tags against a pattern and substitutes aliases
-      using `MARC_MAPPER`.
-    - The leader and directory are rebuilt to reflect the reconstructed
-      raw MARC bytes.
+    - Tags are skipped, mapped using the tag aliases and validated with
+      the lookup tables of `context.compiled`.
+    - Fields whose (aliased) tag is not in `context.selected_tags` are
+      skipped before their subfields are iterated and are left out of
+      the reconstructed raw MARC bytes.
+    - The children of the record are visited in a single pass; each
+      field is encoded once and the raw MARC bytes are assembled by
+      `build_marc`, which rebuilds the leader and the directory.
     - Fixed fields are stored in `fixed_fields` and variable data fields
       with indicators and subfields are stored in `variable_fields`.
-    - The function builds the MARC record raw bytes
-      with proper directory entries and field terminators
-      as per MARC21 specification.
+    - Control fields precede data fields in the raw MARC bytes,
+      regardless of their order in the XML.
     """
+    if root.tag == _COLLECTION:
+        records = list(root.iterchildren(_RECORD))
+        if len(records) != 1:
+            raise ValueError(
+                f"Expected a single MARC record in the collection, "
+                f"found {len(records)}."
+            )
+        root = records[0]
+
+    instrumentation = get_instrumentation(context)
+    if instrumentation is not None:
+        started = perf_counter()
+
     record: Dict[str, Any] = {
         "fixed_fields": {},
         "variable_fields": {},
     }
-    directory: List[bytes] = []
-    data: List[bytes] = []
-
-    data_length = 0
-
-    # Extract and Process Leader
-    leader_text = root.find(".//marc:leader", MARC_NS).text
-
-    if len(leader_text) != LEADER_LENGTH:
-        raise ValueError(
-            f"Invalid leader length: {len(leader_text)} "
-            f"(expected {LEADER_LENGTH})"
-        )
-
-    record["leader"] = leader_text
-
-    # Define a function to append data to the MARC bytes data
-    def append_field_data(tag: str, field_data: bytes) -> int:
-        if data_length > MAX_RECORD_LENGTH:
-            raise ValueError(
-                "MARC record exceeds maximum allowed length of 99,999 bytes."
-            )
+    fixed_fields = record["fixed_fields"]
+    variable_fields = record["variable_fields"]
+
+    # Encoded data of the kept fields, control fields first
+    control_data: List[Tuple[str, bytes]] = []
+    field_data: List[Tuple[str, bytes]] = []
+
+    compiled = context.compiled
+    skip_tags = compiled.skip_tags
+    aliases = compiled.aliases
+    valid_tags = compiled.valid_tags
+    selected_tags = compiled.selected_tags
+    leader_text = None
+
+    def is_kept(tag: str) -> bool:
+        if tag not in valid_tags:
+            if context.ignore_unknown_tags:
+                if instrumentation is not None:
+                    instrumentation.count("unknown_tags")
+                return False
+            raise ValueError(f"Invalid MARC tag '{tag}' encountered.")
 
-        directory.append(tag.encode("utf-8"))
-        directory.append(f"{len(field_data) + 1:04d}".encode("utf-8"))
-        directory.append(f"{data_length:05d}".encode("utf-8"))
+        if tag not in selected_tags:
+            if instrumentation is not None:
+                instrumentation.count("excluded_tags")
+            return False
+        return True
 
-        data_inc = len(field_data) + 1
+    # Single pass over the fields of the record
+    for element in root:
+        element_type = element.tag
 
-        data.append(field_data)
+        if element_type == _LEADER:
+            leader_text = element.text
+            continue
 
-        return data_inc
+        if element_type != _CONTROLFIELD and element_type != _DATAFIELD:
+            continue
 
-    # Process Control Fields
-    for controlfield in root.findall(".//marc:controlfield", MARC_NS):
-        tag = controlfield.get("tag")
+        tag = element.get("tag")
 
-        if tag in context.skip_tags:
+        if tag in skip_tags:
+            if instrumentation is not None:
+                instrumentation.count("skipped_tags")
             continue
 
-        tag_alias = next(
-            (alias for alias in context.tag_aliases if alias.from_tag == tag),
-            None,
-        )
-
+        tag_alias = aliases.get(tag)
         if tag_alias:
             tag = tag_alias.tag
+            if instrumentation is not None:
+                instrumentation.count("aliased_tags")
 
-        if not re.match(FIELD_TAG_PATTERN, tag):
-            if context.ignore_unknown_tags:
-                continue
-            raise ValueError(f"Invalid MARC tag '{tag}' encountered.")
-
-        text = controlfield.text
-        data_length += append_field_data(tag, text.encode("utf-8"))
-        record["fixed_fields"][tag] = text
-
-    # Process Data Fields
-    for datafield in root.findall(".//marc:datafield", MARC_NS):
-        tag = datafield.get("tag")
-
-        if tag in context.skip_tags:
+        if not is_kept(tag):
             continue
 
-        tag_alias = next(
-            (alias for alias in context.tag_aliases if alias.from_tag == tag),
-            None,
-        )
+        if element_type == _CONTROLFIELD:
+            text = element.text
+            control_data.append((tag, text.encode("utf-8")))
+            fixed_fields[tag] = text
+            continue
 
         if tag_alias:
-            tag = tag_alias.tag
             code = tag_alias.code
-            value = datafield.text
-
-            if not re.match(FIELD_TAG_PATTERN, tag):
-                if context.ignore_unknown_tags:
-                    continue
-                raise ValueError(f"Invalid MARC tag '{tag}' encountered.")
-
-            marc_data = " ".encode("ascii") + " ".encode("ascii")
-            marc_data += "\x1f".encode("utf-8")
-            marc_data += f"{code}".encode("ascii")
-            marc_data += f"{value}".encode("utf-8")
-
-            variable_field = {
-                "ind1": " ",
-                "ind2": " ",
-                "subfields": {code: [value]},
-            }
-
-            data_length += append_field_data(tag, marc_data)
-            record["variable_fields"].setdefault(tag, []).append(
-                variable_field
+            value = element.text
+            field_data.append(
+                (tag, f"  \x1f{code}{value or ''}".encode("utf-8"))
+            )
+            variable_fields.setdefault(tag, []).append(
+                {"ind1": None, "ind2": None, "subfields": {code: [value]}}
             )
             continue
 
-        if not re.match(FIELD_TAG_PATTERN, tag):
-            if context.ignore_unknown_tags:
-                continue
-            raise ValueError(f"Invalid MARC tag '{tag}' encountered.")
-
-        ind1 = datafield.get("ind1", " ")
-        ind2 = datafield.get("ind2", " ")
+        ind1 = element.get("ind1", " ")
+        ind2 = element.get("ind2", " ")
 
-        variable_field = {"ind1": ind1, "ind2": ind2}
+        subfields: Dict[str, List[str]] = {}
+        parts = [ind1, ind2]
 
-        marc_data = ind1.encode("ascii") + ind2.encode("ascii")
-
-        subfields = {}
-
-        for subfield in datafield.findall("marc:subfield", MARC_NS):
+        for subfield in element.iterchildren(_SUBFIELD):
             code = subfield.get("code")
             value = subfield.text
 
             subfields.setdefault(code, []).append(value)
+            parts.append("\x1f")
+            parts.append(code)
+            parts.append(value or "")
+
+        # The field is encoded at once, the indicators must be ASCII
+        if not (ind1 + ind2).isascii():
+            raise ValueError(f"Invalid MARC indicators '{ind1}{ind2}'.")
+        field_data.append((tag, "".join(parts).encode("utf-8")))
+        variable_fields.setdefault(tag, []).append(
+            {
+                "ind1": None if ind1 == " " else ind1,
+                "ind2": None if ind2 == " " else ind2,
+                "subfields": subfields,
+            }
+        )
 
-            marc_data += "\x1f".encode("utf-8")
-            marc_data += f"{code}".encode("ascii")
-            marc_data += f"{value}".encode("utf-8")
-
-        data_length += append_field_data(tag, marc_data)
-        variable_field["subfields"] = subfields
-        record["variable_fields"].setdefault(tag, []).append(variable_field)
-
-    directory.append(b"\x1e")
-    marc_directory = b"".join(directory)
-    marc_data = b"\x1e".join(data)
-
-    base_address = LEADER_LENGTH + len(marc_directory)
-    record_length = base_address + len(marc_data) + 1
+    if leader_text is None:
+        raise ValueError("MARC record has no leader.")
 
-    if record_length > MAX_RECORD_LENGTH:
+    if len(leader_text) != LEADER_LENGTH:
         raise ValueError(
-            "MARC record exceeds maximum allowed length of 99,999 bytes."
+            f"Invalid leader length: {len(leader_text)} "
+            f"(expected {LEADER_LENGTH})"
         )
 
-    new_leader_text = (
-        str(record_length).zfill(5)
-        + leader_text[5:12]
-        + str(base_address).zfill(5)
-        + leader_text[17:]
-    )
-    new_leader = new_leader_text.encode("ascii")
+    if instrumentation is not None:
+        assembling = perf_counter()
+        instrumentation.add_time("xml.fields", assembling - started)
+
+    record["marc"] = build_marc(leader_text, control_data + field_data)
+    record["encoding"] = "utf-8"
+    record["leader"] = record["marc"][:LEADER_LENGTH].decode("ascii")
 
-    record["marc"] = new_leader + marc_directory + marc_data + b"\x1d"
-    record["leader"] = new_leader.decode("utf-8")
+    if instrumentation is not None:
+        instrumentation.add_time("xml.marc", perf_counter() - assembling)
+        instrumentation.count("records")
+        instrumentation.count("fields", len(control_data) + len(field_data))
 
     return record
+
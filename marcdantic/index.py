@@ -0,0 +1,254 @@
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Set, Tuple
+
+from .constants import CONTROL_FIELDS
+from .matcher import (
+    compile_condition,
+    compile_value_matcher,
+    normalize_indicator,
+)
+from .planner import IndexStatistics, QueryPlan, QueryPlanner
+from .query import (
+    MarcBoolQuery,
+    MarcCondition,
+    MarcSearchRequest,
+    MarcSearchResult,
+    MarcTerm,
+    SearchOperator,
+)
+from .record import MarcRecord
+
+#: Postings key: field tag and subfield code (None for any subfield)
+PostingsKey = Tuple[str, str | None]
+
+
+class MarcIndex:
+    """
+    In-memory inverted index over a collection of `MarcRecord` instances.
+
+    Every field value is posted under its tag and subfield code and,
+    for conditions without a subfield, under its tag alone. Indicators
+    are posted per tag. `MarcBoolQuery` terms are then evaluated as set
+    operations over the postings, and only the records of the requested
+    page are returned.
+
+    Conditions are resolved as follows:
+
+    - `Exact` is a single postings lookup.
+    - `StartsWith` uses a sorted list of the distinct values of
+      the field and reads only the matching range.
+    - `EndsWith`, `Contains` and `Regex` scan the distinct values of
+      the field (not the records).
+    - Conditions restricting indicators are checked against the records
+      of the candidate set, so that the value and the indicators come
+      from the same field occurrence.
+
+    Queries are rewritten by a `QueryPlanner` using the cardinality
+    statistics collected while indexing, see `explain`.
+
+    Parameters
+    ----------
+    records : iterable of MarcRecord
+        Records to index initially.
+
+    Examples
+    --------
+    >>> index = MarcIndex(iter_mrc(stream))
+    >>> result = index.search(request)
+    >>> result.total, result.records
+    """
+
+    def __init__(self, records: Iterable[MarcRecord] = ()):
+        self._records: List[MarcRecord] = []
+        self._postings: Dict[PostingsKey, Dict[str, Set[int]]] = {}
+        self._indicators: Dict[Tuple[str, int, str | None], Set[int]] = {}
+        self._sorted_values: Dict[PostingsKey, List[str]] = {}
+        self.statistics = IndexStatistics(self._postings)
+
+        for record in records:
+            self.add(record)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def add(self, record: MarcRecord) -> int:
+        """
+        Index a record.
+
+        Returns
+        -------
+        int
+            The identifier of the record within the index.
+        """
+        record_id = len(self._records)
+        self._records.append(record)
+        keys: Set[PostingsKey] = set()
+
+        for tag, value in record.fixed_fields.root.items():
+            keys.add((tag, None))
+            self._post((tag, None), value, record_id)
+
+        for tag, fields in record.variable_fields.root.items():
+            for field in fields:
+                self._indicators.setdefault((tag, 1, field.ind1), set()).add(
+                    record_id
+                )
+                self._indicators.setdefault((tag, 2, field.ind2), set()).add(
+                    record_id
+                )
+                for code, values in field.subfields.items():
+                    if values:
+                        keys.add((tag, code))
+                        keys.add((tag, None))
+                    for value in values:
+                        self._post((tag, code), value, record_id)
+                        self._post((tag, None), value, record_id)
+
+        self.statistics.add(keys)
+        return record_id
+
+    def _post(self, key: PostingsKey, value: str, record_id: int) -> None:
+        values = self._postings.get(key)
+        if values is None:
+            values = self._postings[key] = {}
+
+        postings = values.get(value)
+        if postings is None:
+            postings = values[value] = set()
+            # The sorted value list of the field is rebuilt on demand
+            self._sorted_values.pop(key, None)
+
+        postings.add(record_id)
+
+    # --- Search ---
+    def search(self, request: MarcSearchRequest) -> MarcSearchResult:
+        """
+        Return the requested page of records matching the query.
+
+        Records are ordered by the order in which they were indexed.
+        """
+        record_ids = sorted(self.evaluate(request.query))
+
+        start = (request.page - 1) * request.page_size
+        page_ids = record_ids[start : start + request.page_size]
+
+        return MarcSearchResult(
+            total=len(record_ids),
+            page=request.page,
+            page_size=request.page_size,
+            records=[self._records[record_id] for record_id in page_ids],
+        )
+
+    def plan(self, query: MarcBoolQuery) -> QueryPlan:
+        """Return the evaluation plan of the query."""
+        return QueryPlanner(self.statistics).plan(query)
+
+    def explain(self, query: MarcBoolQuery) -> str:
+        """Describe the evaluation plan of the query and its costs."""
+        return self.plan(query).explain()
+
+    def evaluate(self, query: MarcBoolQuery) -> Set[int]:
+        """
+        Return the identifiers of all records matching the query.
+        """
+        return self._evaluate_query(self.plan(query).query)
+
+    def _evaluate_query(self, query: MarcBoolQuery) -> Set[int]:
+        result: Set[int] | None = None
+
+        # Terms are ordered by the planner, the evaluation stops as soon
+        # as the intermediate result is empty
+        for term in query.must or []:
+            record_ids = self._evaluate_term(term)
+            result = record_ids if result is None else result & record_ids
+            if not result:
+                return set()
+
+        if query.should:
+            matching: Set[int] = set()
+            for term in query.should:
+                matching |= self._evaluate_term(term)
+            result = matching if result is None else result & matching
+
+        if result is None:
+            result = set(range(len(self._records)))
+
+        for term in query.must_not or []:
+            if not result:
+                break
+            result = result - self._evaluate_term(term)
+
+        return result
+
+    def _evaluate_term(self, term: MarcTerm) -> Set[int]:
+        if isinstance(term, MarcCondition):
+            return self._evaluate_condition(term)
+        return self._evaluate_query(term)
+
+    def _evaluate_condition(self, condition: MarcCondition) -> Set[int]:
+        # Control fields have no subfields, their whole value is matched
+        key = (
+            condition.field,
+            None if condition.field in CONTROL_FIELDS else condition.subfield,
+        )
+        values = self._postings.get(key)
+        if not values:
+            return set()
+
+        operator = condition.operator
+        result: Set[int] = set()
+
+        if operator == SearchOperator.Exact:
+            result = set(values.get(condition.value, ()))
+        elif operator == SearchOperator.StartsWith:
+            prefix = condition.value
+            sorted_values = self._get_sorted_values(key)
+            # Index from the bisected position, islice would walk the
+            # values before it
+            for position in range(
+                bisect_left(sorted_values, prefix), len(sorted_values)
+            ):
+                value = sorted_values[position]
+                if not value.startswith(prefix):
+                    break
+                result |= values[value]
+        else:
+            match_value = compile_value_matcher(operator, condition.value)
+            for value, record_ids in values.items():
+                if match_value(value):
+                    result |= record_ids
+
+        # Like the subfield, indicators do not apply to control fields
+        if (
+            condition.ind1 or condition.ind2
+        ) and condition.field not in CONTROL_FIELDS:
+            result = self._filter_indicators(condition, result)
+
+        return result
+
+    def _filter_indicators(
+        self, condition: MarcCondition, record_ids: Set[int]
+    ) -> Set[int]:
+        # Narrow the candidates with the indicator postings first
+        for position, indicator in ((1, condition.ind1), (2, condition.ind2)):
+            if not indicator:
+                continue
+            record_ids = record_ids & self._indicators.get(
+                (condition.field, position, normalize_indicator(indicator)),
+                set(),
+            )
+
+        predicate = compile_condition(condition)
+        return {
+            record_id
+            for record_id in record_ids
+            if predicate(self._records[record_id])
+        }
+
+    def _get_sorted_values(self, key: PostingsKey) -> List[str]:
+        sorted_values = self._sorted_values.get(key)
+        if sorted_values is None:
+            sorted_values = self._sorted_values[key] = sorted(
+                self._postings[key]
+            )
+        return sorted_values
@@ -0,0 +1,135 @@
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from time import perf_counter
+from typing import Any, Dict, Iterator, List
+
+#: Instrumentation activated with the `with` statement
+_active: ContextVar["Instrumentation | None"] = ContextVar(
+    "marcdantic_instrumentation", default=None
+)
+
+
+class Instrumentation:
+    """
+    Collector of cumulative per-stage timings and counters.
+
+    Instrumentation is opt-in: either attach the collector to the
+    parsing context (`MarcContext(instrumentation=...)`) or activate it
+    for a block of code with the `with` statement, which also covers
+    code without a context such as jq compiles. When no collector is
+    active, the instrumented code only checks for its absence once per
+    record, without reading the clock.
+
+    Stages
+    ------
+    mrc.directory
+        Parsing the leader and the directory of ISO 2709 records,
+        including tag skipping, alias resolution and projection.
+    mrc.decode
+        Decoding the field data of ISO 2709 records, including the
+        validation of tags loaded from lazily parsed records.
+    xml.fields
+        Reading the fields of MARCXML records.
+    xml.marc
+        Building the raw ISO 2709 bytes of MARCXML records.
+    validation
+        Building the pydantic models of records, with or without
+        validation depending on the context.
+    jq.compile
+        Compiling jq filters missing from the program cache.
+
+    Counters
+    --------
+    records, fields, skipped_tags, aliased_tags, unknown_tags,
+    excluded_tags, bytes_decoded, lazy_loads, jq_compiles, and
+    encoding.<codec> counting the records decoded with each codec
+    chosen with `mrc_encoding="auto"`
+
+    Notes
+    -----
+    A collector is not thread-safe, use one per thread. Collectors
+    attached to a context sent to worker processes (e.g. by
+    `parse_many`) are copied, so the counts of the workers are not
+    merged back.
+
+    Examples
+    --------
+    >>> with Instrumentation() as instrumentation:
+    ...     records = list(iter_mrc(stream))
+    >>> instrumentation.snapshot()["timings"]["mrc.decode"]
+    """
+
+    def __init__(self):
+        self.timings: Dict[str, float] = Counter()
+        self.calls: Dict[str, int] = Counter()
+        self.counters: Dict[str, int] = Counter()
+        self._tokens: List[Token] = []
+
+    # --- Context manager ---
+    def __enter__(self) -> "Instrumentation":
+        self._tokens.append(_active.set(self))
+        return self
+
+    def __exit__(self, *args) -> None:
+        _active.reset(self._tokens.pop())
+
+    # --- Collection ---
+    def count(self, counter: str, value: int = 1) -> None:
+        """Increase a counter."""
+        self.counters[counter] += value
+
+    def add_time(self, stage: str, seconds: float) -> None:
+        """Add the duration of one execution of a stage."""
+        self.timings[stage] += seconds
+        self.calls[stage] += 1
+
+    @contextmanager
+    def measure(self, stage: str) -> Iterator[None]:
+        """Measure the duration of the enclosed block as a stage."""
+        started = perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(stage, perf_counter() - started)
+
+    def reset(self) -> None:
+        """Clear all timings and counters."""
+        self.timings.clear()
+        self.calls.clear()
+        self.counters.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Return a copy of the collected data.
+
+        Returns
+        -------
+        dict
+            'timings' maps stages to cumulative seconds, 'calls' maps
+            stages to the number of measured executions and 'counters'
+            maps counter names to values.
+        """
+        return {
+            "timings": dict(self.timings),
+            "calls": dict(self.calls),
+            "counters": dict(self.counters),
+        }
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Activation tokens belong to the current process
+        return {**self.__dict__, "_tokens": []}
+
+
+def get_instrumentation(
+    context: Any = None,
+) -> Instrumentation | None:
+    """
+    Return the collector attached to `context` (a `MarcContext`),
+    or the collector activated with the `with` statement, if any.
+    """
+    if context is not None:
+        instrumentation = context.instrumentation
+        if instrumentation is not None:
+            return instrumentation
+    return _active.get()
@@ -0,0 +1,172 @@
+from collections import OrderedDict
+from threading import Lock
+from time import perf_counter
+from typing import Any, Callable
+
+import jq
+from pydantic import BaseModel
+
+from .instrumentation import get_instrumentation
+from .paths import compile_program
+
+#: Default number of compiled programs kept by the shared cache
+DEFAULT_JQ_CACHE_SIZE = 256
+
+
+class JqCacheInfo(BaseModel):
+    """
+    Snapshot of the statistics of a `JqProgramCache`.
+
+    Attributes
+    ----------
+    hits : int
+        Number of lookups served by an already compiled program.
+    misses : int
+        Number of lookups that had to compile the filter.
+    evictions : int
+        Number of programs dropped to respect `maxsize`.
+    size : int
+        Number of programs currently cached.
+    maxsize : int
+        Maximum number of cached programs.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+
+class JqProgramCache:
+    """
+    Bounded LRU cache of compiled jq programs keyed by filter string.
+
+    The cache is safe to use from multiple threads. Compilation runs
+    outside of the lock, so a slow compile does not block lookups of
+    other filters; when two threads compile the same filter at once,
+    the first stored program wins.
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of cached programs, must be positive.
+    compiler : callable
+        Function compiling a filter string, `jq.compile` by default.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_JQ_CACHE_SIZE,
+        compiler: Callable[[str], Any] = jq.compile,
+    ):
+        if maxsize < 1:
+            raise ValueError("Cache size must be a positive number.")
+
+        self._maxsize = maxsize
+        self._compiler = compiler
+        self._programs: OrderedDict[str, Any] = OrderedDict()
+        self._lock = Lock()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    def compile(self, jq_filter: str) -> Any:
+        """
+        Return the compiled program for `jq_filter`, compiling it
+        on the first request.
+
+        Parameters
+        ----------
+        jq_filter : str
+            A jq filter string, e.g., '.["245"][].subfields.a[]'
+
+        Returns
+        -------
+        Any
+            The compiled program.
+
+        Raises
+        ------
+        ValueError
+            If the filter cannot be compiled.
+        """
+        with self._lock:
+            program = self._programs.get(jq_filter)
+            if program is not None:
+                self._programs.move_to_end(jq_filter)
+                self._hits += 1
+                return program
+            self._misses += 1
+
+        instrumentation = get_instrumentation()
+        if instrumentation is None:
+            program = self._compiler(jq_filter)
+        else:
+            started = perf_counter()
+            program = self._compiler(jq_filter)
+            instrumentation.add_time("jq.compile", perf_counter() - started)
+            instrumentation.count("jq_compiles")
+
+        with self._lock:
+            cached = self._programs.setdefault(jq_filter, program)
+            self._programs.move_to_end(jq_filter)
+            self._evict()
+
+        return cached
+
+    def resize(self, maxsize: int) -> None:
+        """
+        Change the maximum number of cached programs, evicting the least
+        recently used ones if needed.
+        """
+        if maxsize < 1:
+            raise ValueError("Cache size must be a positive number.")
+
+        with self._lock:
+            self._maxsize = maxsize
+            self._evict()
+
+    def clear(self) -> None:
+        """Drop all cached programs and reset the statistics."""
+        with self._lock:
+            self._programs.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def cache_info(self) -> JqCacheInfo:
+        """Return the current statistics of the cache."""
+        with self._lock:
+            return JqCacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._programs),
+                maxsize=self._maxsize,
+            )
+
+    def _evict(self) -> None:
+        while len(self._programs) > self._maxsize:
+            self._programs.popitem(last=False)
+            self._evictions += 1
+
+
+#: Cache shared by all query methods of the package, simple path
+#: filters are compiled to native `PathProgram` instances
+jq_cache = JqProgramCache(compiler=compile_program)
+
+
+def compile_jq(jq_filter: str) -> Any:
+    """
+    Compile `jq_filter` through the shared program cache.
+
+    Returns a `PathProgram` for simple path filters
+    and a jq program otherwise.
+    """
+    return jq_cache.compile(jq_filter)
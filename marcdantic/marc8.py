@@ -0,0 +1,244 @@
+import codecs
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+from .marc8_tables import (
+    BASIC_LATIN,
+    CHARACTER_SETS,
+    EXTENDED_LATIN,
+    CharacterSet,
+)
+
+#: Name of the registered codec, usable as `MarcContext.mrc_encoding`
+MARC8_CODEC_NAME = "marc8"
+
+#: Final characters of the default G0 and G1 character sets
+BASIC_LATIN_SET = 0x42
+EXTENDED_LATIN_SET = 0x45
+
+#: Final characters of the sets selected by a single escape character
+#: (ESC g, ESC b, ESC p), replacing only a few characters of G0
+_TECHNIQUE_1_SETS = {0x67, 0x62, 0x70}
+
+_ESCAPE = b"\x1b"
+
+# ESC [$](,)- [!]F designates G0 or G1, ESC g/b/p/s switches G0
+_ESCAPE_SEQUENCE = re.compile(
+    rb"\x1b(?:(\$?[(,)\-]|\$)!?([\x21-\x7e])|([gbps]))"
+)
+
+# Charmap decoding tables mark undefined bytes with U+FFFE
+_UNDEFINED = "\ufffe"
+
+_MARKS = "".join(
+    sorted(
+        {
+            chr(code_point)
+            for character_set in CHARACTER_SETS.values()
+            for code_point, combining in character_set.values()
+            if combining
+        }
+    )
+)
+
+# MARC-8 places combining marks before the base character
+_MARK_RUNS = re.compile(f"([{_MARKS}]+)")
+
+
+@lru_cache(maxsize=None)
+def _decoding_table(g0: int, g1: int) -> str:
+    """
+    Return the `codecs.charmap_decode` table of the given G0 and G1
+    character sets.
+    """
+    g0_set: CharacterSet = CHARACTER_SETS.get(g0, {})
+    g1_set: CharacterSet = CHARACTER_SETS.get(g1, {})
+    # Technique 1 sets define a few characters, the rest stays ASCII
+    fallback = BASIC_LATIN if g0 in _TECHNIQUE_1_SETS else {}
+
+    def lookup(character_set: CharacterSet, byte: int) -> str | None:
+        entry = character_set.get(byte) or character_set.get(byte ^ 0x80)
+        return None if entry is None else chr(entry[0])
+
+    table: List[str] = []
+    for byte in range(0x100):
+        if byte < 0x21 or byte == 0x7F:
+            character = chr(byte)
+        elif byte < 0x7F:
+            character = lookup(g0_set, byte) or lookup(fallback, byte)
+        elif byte < 0xA1:
+            # Control characters of the G1 set (e.g. ANSEL 0x88, 0x8D)
+            entry = g1_set.get(byte)
+            character = None if entry is None else chr(entry[0])
+        else:
+            character = lookup(g1_set, byte)
+        table.append(_UNDEFINED if character is None else character)
+    return "".join(table)
+
+
+def _decode_run(
+    data: bytes, start: int, end: int, g0: int, g1: int, errors: str
+) -> str:
+    run = data[start:end]
+    if g0 == BASIC_LATIN_SET and run.isascii():
+        return run.decode("ascii")
+
+    try:
+        return codecs.charmap_decode(run, errors, _decoding_table(g0, g1))[0]
+    except UnicodeDecodeError as error:
+        raise UnicodeDecodeError(
+            MARC8_CODEC_NAME,
+            data,
+            start + error.start,
+            start + error.end,
+            f"byte not defined in character sets "
+            f"G0 {g0:#04x} and G1 {g1:#04x}",
+        ) from None
+
+
+def decode(data: bytes, errors: str = "strict") -> Tuple[str, int]:
+    """
+    Decode MARC-8 bytes to text.
+
+    Parameters
+    ----------
+    data : bytes
+        MARC-8 encoded data, starting with Basic Latin as G0 and
+        Extended Latin (ANSEL) as G1.
+    errors : str
+        Name of the error handler for bytes without a character in
+        the designated sets, e.g. 'strict', 'replace' or 'ignore'.
+
+    Returns
+    -------
+    tuple of (str, int)
+        The NFC normalized text and the number of consumed bytes.
+
+    Raises
+    ------
+    UnicodeDecodeError
+        For undefined bytes with the 'strict' error handler.
+
+    Notes
+    -----
+    - Data without escape sequences and non-ASCII bytes is decoded
+      as ASCII. Otherwise, the runs between escape sequences are
+      decoded with `codecs.charmap_decode` tables, built once per pair
+      of G0 and G1 character sets.
+    - Combining marks, which precede their base character in MARC-8,
+      are moved after it and the text is composed to NFC.
+    - The East Asian (EACC) set is not supported; its bytes are
+      reported to the error handler.
+    """
+    data = bytes(data)
+    if data.isascii() and _ESCAPE not in data:
+        return data.decode("ascii"), len(data)
+
+    g0 = BASIC_LATIN_SET
+    g1 = EXTENDED_LATIN_SET
+    parts: List[str] = []
+    position = 0
+
+    if _ESCAPE in data:
+        for match in _ESCAPE_SEQUENCE.finditer(data):
+            parts.append(
+                _decode_run(data, position, match.start(), g0, g1, errors)
+            )
+            designator, final, technique = match.groups()
+            if technique is not None:
+                g0 = (
+                    BASIC_LATIN_SET
+                    if technique == b"s"
+                    else ord(technique)
+                )
+            elif designator[-1:] in b"(,$":
+                g0 = final[0]
+            else:
+                g1 = final[0]
+            position = match.end()
+    parts.append(_decode_run(data, position, len(data), g0, g1, errors))
+
+    text = "".join(parts)
+    if not text.isascii():
+        if _MARK_RUNS.search(text) is not None:
+            text = _reorder_marks(text)
+        text = unicodedata.normalize("NFC", text)
+    return text, len(data)
+
+
+def _reorder_marks(text: str) -> str:
+    """Move combining marks after the character following them."""
+    # Text and mark runs alternate, starting with text
+    parts = _MARK_RUNS.split(text)
+    for index in range(1, len(parts) - 1, 2):
+        following = parts[index + 1]
+        if following:
+            parts[index], parts[index + 1] = (
+                following[0],
+                parts[index] + following[1:],
+            )
+    return "".join(parts)
+
+
+_ENCODING_TABLE: Dict[str, int] = {
+    chr(code_point): byte
+    for character_set in (BASIC_LATIN, EXTENDED_LATIN)
+    for byte, (code_point, _) in character_set.items()
+}
+_ENCODING_TABLE.update({chr(byte): byte for byte in range(0x20)})
+
+
+def encode(text: str, errors: str = "strict") -> Tuple[bytes, int]:
+    """
+    Encode text to MARC-8 using Basic Latin and Extended Latin (ANSEL)
+    only, without escape sequences.
+
+    The text is decomposed to NFD and combining marks are placed before
+    their base character. Characters outside of these sets are reported
+    to the error handler.
+    """
+    decomposed = unicodedata.normalize("NFD", text)
+    encoded = bytearray()
+    marks = bytearray()
+    base: bytes = b""
+
+    for position, character in enumerate(decomposed):
+        byte = _ENCODING_TABLE.get(character)
+        if byte is None:
+            replacement, _ = codecs.lookup_error(errors)(
+                UnicodeEncodeError(
+                    MARC8_CODEC_NAME,
+                    decomposed,
+                    position,
+                    position + 1,
+                    "character not in Basic or Extended Latin",
+                )
+            )
+            if isinstance(replacement, str):
+                replacement = replacement.encode("ascii")
+            encoded += marks + base
+            marks.clear()
+            base = b""
+            encoded += replacement
+        elif unicodedata.combining(character):
+            marks.append(byte)
+        else:
+            encoded += marks + base
+            marks.clear()
+            base = bytes((byte,))
+
+    encoded += marks + base
+    return bytes(encoded), len(text)
+
+
+def _search(name: str) -> codecs.CodecInfo | None:
+    if name.replace("-", "_") in ("marc8", "marc_8"):
+        return codecs.CodecInfo(
+            name=MARC8_CODEC_NAME, encode=encode, decode=decode
+        )
+    return None
+
+
+codecs.register(_search)
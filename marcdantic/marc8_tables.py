@@ -0,0 +1,732 @@
+"""
+MARC-8 character sets, as published in the code tables of the Library
+of Congress (https://www.loc.gov/marc/specifications/codetables.xml).
+
+Every set maps a byte to the Unicode code point of the character and
+a flag telling whether the character is a combining mark. Bytes are
+listed as in the code tables, in the G0 (0x21-0x7E) or in the G1
+(0xA1-0xFE) range; a few sets also list control characters.
+"""
+
+from typing import Dict, Tuple
+
+#: Character set: byte -> (code point, combining flag)
+CharacterSet = Dict[int, Tuple[int, int]]
+
+#: Final character 0x42: Basic Latin (ASCII)
+BASIC_LATIN: CharacterSet = {
+    0x1B: (0x001B, 0),
+    0x1D: (0x001D, 0),
+    0x1E: (0x001E, 0),
+    0x1F: (0x001F, 0),
+    0x20: (0x0020, 0),
+    0x21: (0x0021, 0),
+    0x22: (0x0022, 0),
+    0x23: (0x0023, 0),
+    0x24: (0x0024, 0),
+    0x25: (0x0025, 0),
+    0x26: (0x0026, 0),
+    0x27: (0x0027, 0),
+    0x28: (0x0028, 0),
+    0x29: (0x0029, 0),
+    0x2A: (0x002A, 0),
+    0x2B: (0x002B, 0),
+    0x2C: (0x002C, 0),
+    0x2D: (0x002D, 0),
+    0x2E: (0x002E, 0),
+    0x2F: (0x002F, 0),
+    0x30: (0x0030, 0),
+    0x31: (0x0031, 0),
+    0x32: (0x0032, 0),
+    0x33: (0x0033, 0),
+    0x34: (0x0034, 0),
+    0x35: (0x0035, 0),
+    0x36: (0x0036, 0),
+    0x37: (0x0037, 0),
+    0x38: (0x0038, 0),
+    0x39: (0x0039, 0),
+    0x3A: (0x003A, 0),
+    0x3B: (0x003B, 0),
+    0x3C: (0x003C, 0),
+    0x3D: (0x003D, 0),
+    0x3E: (0x003E, 0),
+    0x3F: (0x003F, 0),
+    0x40: (0x0040, 0),
+    0x41: (0x0041, 0),
+    0x42: (0x0042, 0),
+    0x43: (0x0043, 0),
+    0x44: (0x0044, 0),
+    0x45: (0x0045, 0),
+    0x46: (0x0046, 0),
+    0x47: (0x0047, 0),
+    0x48: (0x0048, 0),
+    0x49: (0x0049, 0),
+    0x4A: (0x004A, 0),
+    0x4B: (0x004B, 0),
+    0x4C: (0x004C, 0),
+    0x4D: (0x004D, 0),
+    0x4E: (0x004E, 0),
+    0x4F: (0x004F, 0),
+    0x50: (0x0050, 0),
+    0x51: (0x0051, 0),
+    0x52: (0x0052, 0),
+    0x53: (0x0053, 0),
+    0x54: (0x0054, 0),
+    0x55: (0x0055, 0),
+    0x56: (0x0056, 0),
+    0x57: (0x0057, 0),
+    0x58: (0x0058, 0),
+    0x59: (0x0059, 0),
+    0x5A: (0x005A, 0),
+    0x5B: (0x005B, 0),
+    0x5C: (0x005C, 0),
+    0x5D: (0x005D, 0),
+    0x5E: (0x005E, 0),
+    0x5F: (0x005F, 0),
+    0x60: (0x0060, 0),
+    0x61: (0x0061, 0),
+    0x62: (0x0062, 0),
+    0x63: (0x0063, 0),
+    0x64: (0x0064, 0),
+    0x65: (0x0065, 0),
+    0x66: (0x0066, 0),
+    0x67: (0x0067, 0),
+    0x68: (0x0068, 0),
+    0x69: (0x0069, 0),
+    0x6A: (0x006A, 0),
+    0x6B: (0x006B, 0),
+    0x6C: (0x006C, 0),
+    0x6D: (0x006D, 0),
+    0x6E: (0x006E, 0),
+    0x6F: (0x006F, 0),
+    0x70: (0x0070, 0),
+    0x71: (0x0071, 0),
+    0x72: (0x0072, 0),
+    0x73: (0x0073, 0),
+    0x74: (0x0074, 0),
+    0x75: (0x0075, 0),
+    0x76: (0x0076, 0),
+    0x77: (0x0077, 0),
+    0x78: (0x0078, 0),
+    0x79: (0x0079, 0),
+    0x7A: (0x007A, 0),
+    0x7B: (0x007B, 0),
+    0x7C: (0x007C, 0),
+    0x7D: (0x007D, 0),
+    0x7E: (0x007E, 0),
+}
+
+#: Final character 0x45: Extended Latin (ANSEL)
+EXTENDED_LATIN: CharacterSet = {
+    0x88: (0x0098, 0),
+    0x89: (0x009C, 0),
+    0x8D: (0x200D, 0),
+    0x8E: (0x200C, 0),
+    0xA1: (0x0141, 0),
+    0xA2: (0x00D8, 0),
+    0xA3: (0x0110, 0),
+    0xA4: (0x00DE, 0),
+    0xA5: (0x00C6, 0),
+    0xA6: (0x0152, 0),
+    0xA7: (0x02B9, 0),
+    0xA8: (0x00B7, 0),
+    0xA9: (0x266D, 0),
+    0xAA: (0x00AE, 0),
+    0xAB: (0x00B1, 0),
+    0xAC: (0x01A0, 0),
+    0xAD: (0x01AF, 0),
+    0xAE: (0x02BC, 0),
+    0xB0: (0x02BB, 0),
+    0xB1: (0x0142, 0),
+    0xB2: (0x00F8, 0),
+    0xB3: (0x0111, 0),
+    0xB4: (0x00FE, 0),
+    0xB5: (0x00E6, 0),
+    0xB6: (0x0153, 0),
+    0xB7: (0x02BA, 0),
+    0xB8: (0x0131, 0),
+    0xB9: (0x00A3, 0),
+    0xBA: (0x00F0, 0),
+    0xBC: (0x01A1, 0),
+    0xBD: (0x01B0, 0),
+    0xC0: (0x00B0, 0),
+    0xC1: (0x2113, 0),
+    0xC2: (0x2117, 0),
+    0xC3: (0x00A9, 0),
+    0xC4: (0x266F, 0),
+    0xC5: (0x00BF, 0),
+    0xC6: (0x00A1, 0),
+    0xC7: (0x00DF, 0),
+    0xC8: (0x20AC, 0),
+    0xE0: (0x0309, 1),
+    0xE1: (0x0300, 1),
+    0xE2: (0x0301, 1),
+    0xE3: (0x0302, 1),
+    0xE4: (0x0303, 1),
+    0xE5: (0x0304, 1),
+    0xE6: (0x0306, 1),
+    0xE7: (0x0307, 1),
+    0xE8: (0x0308, 1),
+    0xE9: (0x030C, 1),
+    0xEA: (0x030A, 1),
+    0xEB: (0xFE20, 1),
+    0xEC: (0xFE21, 1),
+    0xED: (0x0315, 1),
+    0xEE: (0x030B, 1),
+    0xEF: (0x0310, 1),
+    0xF0: (0x0327, 1),
+    0xF1: (0x0328, 1),
+    0xF2: (0x0323, 1),
+    0xF3: (0x0324, 1),
+    0xF4: (0x0325, 1),
+    0xF5: (0x0333, 1),
+    0xF6: (0x0332, 1),
+    0xF7: (0x0326, 1),
+    0xF8: (0x031C, 1),
+    0xF9: (0x032E, 1),
+    0xFA: (0xFE22, 1),
+    0xFB: (0xFE23, 1),
+    0xFE: (0x0313, 1),
+}
+
+#: Final character 0x67: Greek symbols
+GREEK_SYMBOLS: CharacterSet = {
+    0x61: (0x03B1, 0),
+    0x62: (0x03B2, 0),
+    0x63: (0x03B3, 0),
+}
+
+#: Final character 0x62: Subscripts
+SUBSCRIPTS: CharacterSet = {
+    0x28: (0x208D, 0),
+    0x29: (0x208E, 0),
+    0x2B: (0x208A, 0),
+    0x2D: (0x208B, 0),
+    0x30: (0x2080, 0),
+    0x31: (0x2081, 0),
+    0x32: (0x2082, 0),
+    0x33: (0x2083, 0),
+    0x34: (0x2084, 0),
+    0x35: (0x2085, 0),
+    0x36: (0x2086, 0),
+    0x37: (0x2087, 0),
+    0x38: (0x2088, 0),
+    0x39: (0x2089, 0),
+}
+
+#: Final character 0x70: Superscripts
+SUPERSCRIPTS: CharacterSet = {
+    0x28: (0x207D, 0),
+    0x29: (0x207E, 0),
+    0x2B: (0x207A, 0),
+    0x2D: (0x207B, 0),
+    0x30: (0x2070, 0),
+    0x31: (0x00B9, 0),
+    0x32: (0x00B2, 0),
+    0x33: (0x00B3, 0),
+    0x34: (0x2074, 0),
+    0x35: (0x2075, 0),
+    0x36: (0x2076, 0),
+    0x37: (0x2077, 0),
+    0x38: (0x2078, 0),
+    0x39: (0x2079, 0),
+}
+
+#: Final character 0x53: Basic Greek
+BASIC_GREEK: CharacterSet = {
+    0x21: (0x0300, 1),
+    0x22: (0x0301, 1),
+    0x23: (0x0308, 1),
+    0x24: (0x0342, 1),
+    0x25: (0x0313, 1),
+    0x26: (0x0314, 1),
+    0x27: (0x0345, 1),
+    0x30: (0x00AB, 0),
+    0x31: (0x00BB, 0),
+    0x32: (0x201C, 0),
+    0x33: (0x201D, 0),
+    0x34: (0x0374, 0),
+    0x35: (0x0375, 0),
+    0x3B: (0x0387, 0),
+    0x3F: (0x037E, 0),
+    0x41: (0x0391, 0),
+    0x42: (0x0392, 0),
+    0x44: (0x0393, 0),
+    0x45: (0x0394, 0),
+    0x46: (0x0395, 0),
+    0x47: (0x03DA, 0),
+    0x48: (0x03DC, 0),
+    0x49: (0x0396, 0),
+    0x4A: (0x0397, 0),
+    0x4B: (0x0398, 0),
+    0x4C: (0x0399, 0),
+    0x4D: (0x039A, 0),
+    0x4E: (0x039B, 0),
+    0x4F: (0x039C, 0),
+    0x50: (0x039D, 0),
+    0x51: (0x039E, 0),
+    0x52: (0x039F, 0),
+    0x53: (0x03A0, 0),
+    0x54: (0x03DE, 0),
+    0x55: (0x03A1, 0),
+    0x56: (0x03A3, 0),
+    0x58: (0x03A4, 0),
+    0x59: (0x03A5, 0),
+    0x5A: (0x03A6, 0),
+    0x5B: (0x03A7, 0),
+    0x5C: (0x03A8, 0),
+    0x5D: (0x03A9, 0),
+    0x5E: (0x03E0, 0),
+    0x61: (0x03B1, 0),
+    0x62: (0x03B2, 0),
+    0x63: (0x03D0, 0),
+    0x64: (0x03B3, 0),
+    0x65: (0x03B4, 0),
+    0x66: (0x03B5, 0),
+    0x67: (0x03DB, 0),
+    0x68: (0x03DD, 0),
+    0x69: (0x03B6, 0),
+    0x6A: (0x03B7, 0),
+    0x6B: (0x03B8, 0),
+    0x6C: (0x03B9, 0),
+    0x6D: (0x03BA, 0),
+    0x6E: (0x03BB, 0),
+    0x6F: (0x03BC, 0),
+    0x70: (0x03BD, 0),
+    0x71: (0x03BE, 0),
+    0x72: (0x03BF, 0),
+    0x73: (0x03C0, 0),
+    0x74: (0x03DF, 0),
+    0x75: (0x03C1, 0),
+    0x76: (0x03C3, 0),
+    0x77: (0x03C2, 0),
+    0x78: (0x03C4, 0),
+    0x79: (0x03C5, 0),
+    0x7A: (0x03C6, 0),
+    0x7B: (0x03C7, 0),
+    0x7C: (0x03C8, 0),
+    0x7D: (0x03C9, 0),
+    0x7E: (0x03E1, 0),
+}
+
+#: Final character 0x4e: Basic Cyrillic
+BASIC_CYRILLIC: CharacterSet = {
+    0x21: (0x0021, 0),
+    0x22: (0x0022, 0),
+    0x23: (0x0023, 0),
+    0x24: (0x0024, 0),
+    0x25: (0x0025, 0),
+    0x26: (0x0026, 0),
+    0x27: (0x0027, 0),
+    0x28: (0x0028, 0),
+    0x29: (0x0029, 0),
+    0x2A: (0x002A, 0),
+    0x2B: (0x002B, 0),
+    0x2C: (0x002C, 0),
+    0x2D: (0x002D, 0),
+    0x2E: (0x002E, 0),
+    0x2F: (0x002F, 0),
+    0x30: (0x0030, 0),
+    0x31: (0x0031, 0),
+    0x32: (0x0032, 0),
+    0x33: (0x0033, 0),
+    0x34: (0x0034, 0),
+    0x35: (0x0035, 0),
+    0x36: (0x0036, 0),
+    0x37: (0x0037, 0),
+    0x38: (0x0038, 0),
+    0x39: (0x0039, 0),
+    0x3A: (0x003A, 0),
+    0x3B: (0x003B, 0),
+    0x3C: (0x003C, 0),
+    0x3D: (0x003D, 0),
+    0x3E: (0x003E, 0),
+    0x3F: (0x003F, 0),
+    0x40: (0x044E, 0),
+    0x41: (0x0430, 0),
+    0x42: (0x0431, 0),
+    0x43: (0x0446, 0),
+    0x44: (0x0434, 0),
+    0x45: (0x0435, 0),
+    0x46: (0x0444, 0),
+    0x47: (0x0433, 0),
+    0x48: (0x0445, 0),
+    0x49: (0x0438, 0),
+    0x4A: (0x0439, 0),
+    0x4B: (0x043A, 0),
+    0x4C: (0x043B, 0),
+    0x4D: (0x043C, 0),
+    0x4E: (0x043D, 0),
+    0x4F: (0x043E, 0),
+    0x50: (0x043F, 0),
+    0x51: (0x044F, 0),
+    0x52: (0x0440, 0),
+    0x53: (0x0441, 0),
+    0x54: (0x0442, 0),
+    0x55: (0x0443, 0),
+    0x56: (0x0436, 0),
+    0x57: (0x0432, 0),
+    0x58: (0x044C, 0),
+    0x59: (0x044B, 0),
+    0x5A: (0x0437, 0),
+    0x5B: (0x0448, 0),
+    0x5C: (0x044D, 0),
+    0x5D: (0x0449, 0),
+    0x5E: (0x0447, 0),
+    0x5F: (0x044A, 0),
+    0x60: (0x042E, 0),
+    0x61: (0x0410, 0),
+    0x62: (0x0411, 0),
+    0x63: (0x0426, 0),
+    0x64: (0x0414, 0),
+    0x65: (0x0415, 0),
+    0x66: (0x0424, 0),
+    0x67: (0x0413, 0),
+    0x68: (0x0425, 0),
+    0x69: (0x0418, 0),
+    0x6A: (0x0419, 0),
+    0x6B: (0x041A, 0),
+    0x6C: (0x041B, 0),
+    0x6D: (0x041C, 0),
+    0x6E: (0x041D, 0),
+    0x6F: (0x041E, 0),
+    0x70: (0x041F, 0),
+    0x71: (0x042F, 0),
+    0x72: (0x0420, 0),
+    0x73: (0x0421, 0),
+    0x74: (0x0422, 0),
+    0x75: (0x0423, 0),
+    0x76: (0x0416, 0),
+    0x77: (0x0412, 0),
+    0x78: (0x042C, 0),
+    0x79: (0x042B, 0),
+    0x7A: (0x0417, 0),
+    0x7B: (0x0428, 0),
+    0x7C: (0x042D, 0),
+    0x7D: (0x0429, 0),
+    0x7E: (0x0427, 0),
+}
+
+#: Final character 0x51: Extended Cyrillic
+EXTENDED_CYRILLIC: CharacterSet = {
+    0xC0: (0x0491, 0),
+    0xC1: (0x0452, 0),
+    0xC2: (0x0453, 0),
+    0xC3: (0x0454, 0),
+    0xC4: (0x0451, 0),
+    0xC5: (0x0455, 0),
+    0xC6: (0x0456, 0),
+    0xC7: (0x0457, 0),
+    0xC8: (0x0458, 0),
+    0xC9: (0x0459, 0),
+    0xCA: (0x045A, 0),
+    0xCB: (0x045B, 0),
+    0xCC: (0x045C, 0),
+    0xCD: (0x045E, 0),
+    0xCE: (0x045F, 0),
+    0xD0: (0x0463, 0),
+    0xD1: (0x0473, 0),
+    0xD2: (0x0475, 0),
+    0xD3: (0x046B, 0),
+    0xDB: (0x005B, 0),
+    0xDD: (0x005D, 0),
+    0xDF: (0x005F, 0),
+    0xE0: (0x0490, 0),
+    0xE1: (0x0402, 0),
+    0xE2: (0x0403, 0),
+    0xE3: (0x0404, 0),
+    0xE4: (0x0401, 0),
+    0xE5: (0x0405, 0),
+    0xE6: (0x0406, 0),
+    0xE7: (0x0407, 0),
+    0xE8: (0x0408, 0),
+    0xE9: (0x0409, 0),
+    0xEA: (0x040A, 0),
+    0xEB: (0x040B, 0),
+    0xEC: (0x040C, 0),
+    0xED: (0x040E, 0),
+    0xEE: (0x040F, 0),
+    0xEF: (0x042A, 0),
+    0xF0: (0x0462, 0),
+    0xF1: (0x0472, 0),
+    0xF2: (0x0474, 0),
+    0xF3: (0x046A, 0),
+}
+
+#: Final character 0x32: Basic Hebrew
+BASIC_HEBREW: CharacterSet = {
+    0x21: (0x0021, 0),
+    0x22: (0x05F4, 0),
+    0x23: (0x0023, 0),
+    0x24: (0x0024, 0),
+    0x25: (0x0025, 0),
+    0x26: (0x0026, 0),
+    0x27: (0x05F3, 0),
+    0x28: (0x0028, 0),
+    0x29: (0x0029, 0),
+    0x2A: (0x002A, 0),
+    0x2B: (0x002B, 0),
+    0x2C: (0x002C, 0),
+    0x2D: (0x05BE, 0),
+    0x2E: (0x002E, 0),
+    0x2F: (0x002F, 0),
+    0x30: (0x0030, 0),
+    0x31: (0x0031, 0),
+    0x32: (0x0032, 0),
+    0x33: (0x0033, 0),
+    0x34: (0x0034, 0),
+    0x35: (0x0035, 0),
+    0x36: (0x0036, 0),
+    0x37: (0x0037, 0),
+    0x38: (0x0038, 0),
+    0x39: (0x0039, 0),
+    0x3A: (0x003A, 0),
+    0x3B: (0x003B, 0),
+    0x3C: (0x003C, 0),
+    0x3D: (0x003D, 0),
+    0x3E: (0x003E, 0),
+    0x3F: (0x003F, 0),
+    0x40: (0x05B7, 1),
+    0x41: (0x05B8, 1),
+    0x42: (0x05B6, 1),
+    0x43: (0x05B5, 1),
+    0x44: (0x05B4, 1),
+    0x45: (0x05B9, 1),
+    0x46: (0x05BB, 1),
+    0x47: (0x05B0, 1),
+    0x48: (0x05B2, 1),
+    0x49: (0x05B3, 1),
+    0x4A: (0x05B1, 1),
+    0x4B: (0x05BC, 1),
+    0x4C: (0x05BF, 1),
+    0x4D: (0x05C1, 1),
+    0x4E: (0xFB1E, 1),
+    0x5B: (0x005B, 0),
+    0x5D: (0x005D, 0),
+    0x60: (0x05D0, 0),
+    0x61: (0x05D1, 0),
+    0x62: (0x05D2, 0),
+    0x63: (0x05D3, 0),
+    0x64: (0x05D4, 0),
+    0x65: (0x05D5, 0),
+    0x66: (0x05D6, 0),
+    0x67: (0x05D7, 0),
+    0x68: (0x05D8, 0),
+    0x69: (0x05D9, 0),
+    0x6A: (0x05DA, 0),
+    0x6B: (0x05DB, 0),
+    0x6C: (0x05DC, 0),
+    0x6D: (0x05DD, 0),
+    0x6E: (0x05DE, 0),
+    0x6F: (0x05DF, 0),
+    0x70: (0x05E0, 0),
+    0x71: (0x05E1, 0),
+    0x72: (0x05E2, 0),
+    0x73: (0x05E3, 0),
+    0x74: (0x05E4, 0),
+    0x75: (0x05E5, 0),
+    0x76: (0x05E6, 0),
+    0x77: (0x05E7, 0),
+    0x78: (0x05E8, 0),
+    0x79: (0x05E9, 0),
+    0x7A: (0x05EA, 0),
+    0x7B: (0x05F0, 0),
+    0x7C: (0x05F1, 0),
+    0x7D: (0x05F2, 0),
+}
+
+#: Final character 0x33: Basic Arabic
+BASIC_ARABIC: CharacterSet = {
+    0x21: (0x0021, 0),
+    0x22: (0x0022, 0),
+    0x23: (0x0023, 0),
+    0x24: (0x0024, 0),
+    0x25: (0x066A, 0),
+    0x26: (0x0026, 0),
+    0x27: (0x0027, 0),
+    0x28: (0x0028, 0),
+    0x29: (0x0029, 0),
+    0x2A: (0x066D, 0),
+    0x2B: (0x002B, 0),
+    0x2C: (0x060C, 0),
+    0x2D: (0x002D, 0),
+    0x2E: (0x002E, 0),
+    0x2F: (0x002F, 0),
+    0x30: (0x0660, 0),
+    0x31: (0x0661, 0),
+    0x32: (0x0662, 0),
+    0x33: (0x0663, 0),
+    0x34: (0x0664, 0),
+    0x35: (0x0665, 0),
+    0x36: (0x0666, 0),
+    0x37: (0x0667, 0),
+    0x38: (0x0668, 0),
+    0x39: (0x0669, 0),
+    0x3A: (0x003A, 0),
+    0x3B: (0x061B, 0),
+    0x3C: (0x003C, 0),
+    0x3D: (0x003D, 0),
+    0x3E: (0x003E, 0),
+    0x3F: (0x061F, 0),
+    0x41: (0x0621, 0),
+    0x42: (0x0622, 0),
+    0x43: (0x0623, 0),
+    0x44: (0x0624, 0),
+    0x45: (0x0625, 0),
+    0x46: (0x0626, 0),
+    0x47: (0x0627, 0),
+    0x48: (0x0628, 0),
+    0x49: (0x0629, 0),
+    0x4A: (0x062A, 0),
+    0x4B: (0x062B, 0),
+    0x4C: (0x062C, 0),
+    0x4D: (0x062D, 0),
+    0x4E: (0x062E, 0),
+    0x4F: (0x062F, 0),
+    0x50: (0x0630, 0),
+    0x51: (0x0631, 0),
+    0x52: (0x0632, 0),
+    0x53: (0x0633, 0),
+    0x54: (0x0634, 0),
+    0x55: (0x0635, 0),
+    0x56: (0x0636, 0),
+    0x57: (0x0637, 0),
+    0x58: (0x0638, 0),
+    0x59: (0x0639, 0),
+    0x5A: (0x063A, 0),
+    0x5B: (0x005B, 0),
+    0x5D: (0x005D, 0),
+    0x60: (0x0640, 0),
+    0x61: (0x0641, 0),
+    0x62: (0x0642, 0),
+    0x63: (0x0643, 0),
+    0x64: (0x0644, 0),
+    0x65: (0x0645, 0),
+    0x66: (0x0646, 0),
+    0x67: (0x0647, 0),
+    0x68: (0x0648, 0),
+    0x69: (0x0649, 0),
+    0x6A: (0x064A, 0),
+    0x6B: (0x064B, 1),
+    0x6C: (0x064C, 1),
+    0x6D: (0x064D, 1),
+    0x6E: (0x064E, 1),
+    0x6F: (0x064F, 1),
+    0x70: (0x0650, 1),
+    0x71: (0x0651, 1),
+    0x72: (0x0652, 1),
+    0x73: (0x0671, 0),
+    0x74: (0x0670, 0),
+    0x78: (0x066C, 0),
+    0x79: (0x201D, 0),
+    0x7A: (0x201C, 0),
+}
+
+#: Final character 0x34: Extended Arabic
+EXTENDED_ARABIC: CharacterSet = {
+    0xA1: (0x06FD, 0),
+    0xA2: (0x0672, 0),
+    0xA3: (0x0673, 0),
+    0xA4: (0x0679, 0),
+    0xA5: (0x067A, 0),
+    0xA6: (0x067B, 0),
+    0xA7: (0x067C, 0),
+    0xA8: (0x067D, 0),
+    0xA9: (0x067E, 0),
+    0xAA: (0x067F, 0),
+    0xAB: (0x0680, 0),
+    0xAC: (0x0681, 0),
+    0xAD: (0x0682, 0),
+    0xAE: (0x0683, 0),
+    0xAF: (0x0684, 0),
+    0xB0: (0x0685, 0),
+    0xB1: (0x0686, 0),
+    0xB2: (0x06BF, 0),
+    0xB3: (0x0687, 0),
+    0xB4: (0x0688, 0),
+    0xB5: (0x0689, 0),
+    0xB6: (0x068A, 0),
+    0xB7: (0x068B, 0),
+    0xB8: (0x068C, 0),
+    0xB9: (0x068D, 0),
+    0xBA: (0x068E, 0),
+    0xBB: (0x068F, 0),
+    0xBC: (0x0690, 0),
+    0xBD: (0x0691, 0),
+    0xBE: (0x0692, 0),
+    0xBF: (0x0693, 0),
+    0xC0: (0x0694, 0),
+    0xC1: (0x0695, 0),
+    0xC2: (0x0696, 0),
+    0xC3: (0x0697, 0),
+    0xC4: (0x0698, 0),
+    0xC5: (0x0699, 0),
+    0xC6: (0x069A, 0),
+    0xC7: (0x069B, 0),
+    0xC8: (0x069C, 0),
+    0xC9: (0x06FA, 0),
+    0xCA: (0x069D, 0),
+    0xCB: (0x069E, 0),
+    0xCC: (0x06FB, 0),
+    0xCD: (0x069F, 0),
+    0xCE: (0x06A0, 0),
+    0xCF: (0x06FC, 0),
+    0xD0: (0x06A1, 0),
+    0xD1: (0x06A2, 0),
+    0xD2: (0x06A3, 0),
+    0xD3: (0x06A4, 0),
+    0xD4: (0x06A5, 0),
+    0xD5: (0x06A6, 0),
+    0xD6: (0x06A7, 0),
+    0xD7: (0x06A8, 0),
+    0xD8: (0x06A9, 0),
+    0xD9: (0x06AA, 0),
+    0xDA: (0x06AB, 0),
+    0xDB: (0x06AC, 0),
+    0xDC: (0x06AD, 0),
+    0xDD: (0x06AE, 0),
+    0xDE: (0x06AF, 0),
+    0xDF: (0x06B0, 0),
+    0xE0: (0x06B1, 0),
+    0xE1: (0x06B2, 0),
+    0xE2: (0x06B3, 0),
+    0xE3: (0x06B4, 0),
+    0xE4: (0x06B5, 0),
+    0xE5: (0x06B6, 0),
+    0xE6: (0x06B7, 0),
+    0xE7: (0x06B8, 0),
+    0xE8: (0x06BA, 0),
+    0xE9: (0x06BB, 0),
+    0xEA: (0x06BC, 0),
+    0xEB: (0x06BD, 0),
+    0xEC: (0x06B9, 0),
+    0xED: (0x06BE, 0),
+    0xEE: (0x06C0, 0),
+    0xEF: (0x06C4, 0),
+    0xF0: (0x06C5, 0),
+    0xF1: (0x06C6, 0),
+    0xF2: (0x06CA, 0),
+    0xF3: (0x06CB, 0),
+    0xF4: (0x06CD, 0),
+    0xF5: (0x06CE, 0),
+    0xF6: (0x06D0, 0),
+    0xF7: (0x06D2, 0),
+    0xF8: (0x06D3, 0),
+    0xFD: (0x0306, 1),
+    0xFE: (0x030C, 1),
+}
+
+#: Single-byte character sets by their final character
+CHARACTER_SETS: Dict[int, CharacterSet] = {
+    0x42: BASIC_LATIN,
+    0x45: EXTENDED_LATIN,
+    0x67: GREEK_SYMBOLS,
+    0x62: SUBSCRIPTS,
+    0x70: SUPERSCRIPTS,
+    0x53: BASIC_GREEK,
+    0x4E: BASIC_CYRILLIC,
+    0x51: EXTENDED_CYRILLIC,
+    0x32: BASIC_HEBREW,
+    0x33: BASIC_ARABIC,
+    0x34: EXTENDED_ARABIC,
+}
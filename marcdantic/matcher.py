@@ -0,0 +1,183 @@
+import re
+from typing import Callable, Iterable, List
+
+from .query import MarcBoolQuery, MarcCondition, MarcTerm, SearchOperator
+from .record import MarcRecord
+
+#: Predicate testing a single record
+RecordPredicate = Callable[[MarcRecord], bool]
+#: Predicate testing a single field or subfield value
+ValuePredicate = Callable[[str], bool]
+#: Predicate testing a single indicator
+IndicatorPredicate = Callable[[str | None], bool]
+
+#: Indicator values of a condition standing for a blank indicator
+BLANK_INDICATORS = ("\\", "_", " ")
+
+
+def compile_value_matcher(
+    operator: SearchOperator, value: str
+) -> ValuePredicate:
+    """
+    Compile the value test of a condition.
+
+    Parameters
+    ----------
+    operator : SearchOperator
+        The operator used to match the value.
+    value : str
+        The searched value; a regular expression for
+        `SearchOperator.Regex`, which is matched with `re.search`.
+
+    Returns
+    -------
+    ValuePredicate
+        Function returning True for matching values.
+    """
+    if operator == SearchOperator.Exact:
+        return value.__eq__
+    if operator == SearchOperator.Contains:
+        return lambda candidate: value in candidate
+    if operator == SearchOperator.StartsWith:
+        return lambda candidate: candidate.startswith(value)
+    if operator == SearchOperator.EndsWith:
+        return lambda candidate: candidate.endswith(value)
+    if operator == SearchOperator.Regex:
+        return re.compile(value).search
+    raise ValueError(f"Unsupported search operator '{operator}'.")
+
+
+def normalize_indicator(indicator: str | None) -> str | None:
+    """
+    Resolve the indicator of a condition to the parsed indicator value.
+
+    The placeholders '\\', '_' and ' ' stand for a blank indicator,
+    which parsed records store as None.
+    """
+    if indicator is None or indicator == "":
+        return None
+    if indicator in BLANK_INDICATORS:
+        return None
+    return indicator
+
+
+def compile_indicator_matcher(
+    indicator: str | None,
+) -> IndicatorPredicate | None:
+    """
+    Compile the indicator test of a condition.
+
+    Returns None when the condition does not restrict the indicator.
+    """
+    if indicator is None or indicator == "":
+        return None
+
+    expected = normalize_indicator(indicator)
+    if expected is None:
+        return lambda actual: actual is None or actual == " "
+    return lambda actual: actual == expected
+
+
+def compile_condition(condition: MarcCondition) -> RecordPredicate:
+    """
+    Compile a `MarcCondition` into a record predicate.
+
+    A condition matches a record when any occurrence of `field` has
+    a matching value. Control fields are matched on their whole value,
+    ignoring the subfield and indicators of the condition. For data
+    fields, the values of `subfield` are tested, or the values of all
+    subfields when no subfield is given, and both indicators must match
+    when specified.
+    """
+    tag = condition.field
+    code = condition.subfield
+    match_value = compile_value_matcher(condition.operator, condition.value)
+    match_ind1 = compile_indicator_matcher(condition.ind1)
+    match_ind2 = compile_indicator_matcher(condition.ind2)
+
+    def field_values(field) -> Iterable[str]:
+        if code is not None:
+            return field.subfields.get(code, ())
+        return (
+            value for values in field.subfields.values() for value in values
+        )
+
+    def predicate(record: MarcRecord) -> bool:
+        fixed_value = record.fixed_fields.root.get(tag)
+        if fixed_value is not None and match_value(fixed_value):
+            return True
+
+        for field in record.variable_fields.root.get(tag, ()):
+            if match_ind1 is not None and not match_ind1(field.ind1):
+                continue
+            if match_ind2 is not None and not match_ind2(field.ind2):
+                continue
+            if any(match_value(value) for value in field_values(field)):
+                return True
+
+        return False
+
+    return predicate
+
+
+def compile_term(term: MarcTerm) -> RecordPredicate:
+    """Compile a condition or a nested boolean query."""
+    if isinstance(term, MarcCondition):
+        return compile_condition(term)
+    return compile_query(term)
+
+
+def compile_query(query: MarcBoolQuery) -> RecordPredicate:
+    """
+    Compile a `MarcBoolQuery` into a record predicate.
+
+    The query is compiled once into a tree of closures with regular
+    expressions compiled and indicator placeholders resolved. The
+    resulting predicate short-circuits: `must` terms are evaluated
+    first, then `must_not`, then `should`.
+
+    Parameters
+    ----------
+    query : MarcBoolQuery
+        The query to compile.
+
+    Returns
+    -------
+    RecordPredicate
+        Function returning True for matching records.
+
+    Notes
+    -----
+    - Every `must` term has to match.
+    - No `must_not` term may match.
+    - At least one `should` term has to match, if any are given.
+    - A query without terms matches every record.
+
+    Examples
+    --------
+    >>> predicate = compile_query(request.query)
+    >>> matching = [record for record in records if predicate(record)]
+    """
+    must: List[RecordPredicate] = [compile_term(t) for t in query.must or []]
+    must_not: List[RecordPredicate] = [
+        compile_term(t) for t in query.must_not or []
+    ]
+    should: List[RecordPredicate] = [
+        compile_term(t) for t in query.should or []
+    ]
+
+    def predicate(record: MarcRecord) -> bool:
+        for term in must:
+            if not term(record):
+                return False
+        for term in must_not:
+            if term(record):
+                return False
+        if should:
+            for term in should:
+                if term(record):
+                    return True
+            return False
+        return True
+
+    return predicate
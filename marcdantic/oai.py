@@ -0,0 +1,156 @@
+import os
+from typing import BinaryIO, Iterable, Iterator, Tuple
+
+from lxml import etree
+from lxml.etree import _Element
+
+from .constants import OAI_NS
+from .context import MarcContext
+from .readers import MARC_RECORD_TAG, open_input
+from .record import MarcRecord
+
+#: Harvested record: header identifier, datestamp, deleted flag and
+#: the MARC record (None for deleted records)
+OaiRecord = Tuple[str, str, bool, MarcRecord | None]
+
+#: OAI-PMH response document: a file name or a binary file object
+OaiSource = str | os.PathLike | BinaryIO
+
+_RECORD = f"{{{OAI_NS['oai']}}}record"
+_HEADER = f"{{{OAI_NS['oai']}}}header"
+_IDENTIFIER = f"{{{OAI_NS['oai']}}}identifier"
+_DATESTAMP = f"{{{OAI_NS['oai']}}}datestamp"
+_METADATA = f"{{{OAI_NS['oai']}}}metadata"
+_RESUMPTION_TOKEN = f"{{{OAI_NS['oai']}}}resumptionToken"
+_ERROR = f"{{{OAI_NS['oai']}}}error"
+
+#: OAI-PMH error code of an empty result, not reported as an error
+_NO_RECORDS_MATCH = "noRecordsMatch"
+
+
+class OaiListRecords:
+    """
+    Streaming reader of OAI-PMH ListRecords responses with MARCXML
+    metadata.
+
+    The responses are parsed incrementally with `lxml.etree.iterparse`.
+    Every OAI `record` envelope is cleared and detached as soon as the
+    consumer advances the iterator, so only a single record tree is held
+    in memory regardless of the size of the responses.
+
+    Parameters
+    ----------
+    sources : iterable of str, os.PathLike or BinaryIO
+        Response documents, read in order. They may be compressed
+        with gzip, bz2 or xz (see `readers.open_input`). The iterable
+        is consumed lazily, so a generator fetching the next response
+        can read `resumption_token` of the previous one.
+    context : MarcContext
+        Parsing context passed to `MarcRecord.from_xml`.
+
+    Attributes
+    ----------
+    resumption_token : str | None
+        Resumption token of the last fully read response, None before
+        the first response and after the last one of the list.
+    complete_list_size : int | None
+        Size of the complete list, as announced by the last response.
+
+    Examples
+    --------
+    >>> harvest = OaiListRecords(["page1.xml", "page2.xml"])
+    >>> for identifier, datestamp, deleted, record in harvest:
+    ...     ...
+    >>> harvest.resumption_token is None
+    True
+
+    Harvesting over HTTP, one response at a time:
+
+    >>> def responses():
+    ...     query = "verb=ListRecords&metadataPrefix=marc21"
+    ...     while query:
+    ...         yield urllib.request.urlopen(f"{base_url}?{query}")
+    ...         token = harvest.resumption_token
+    ...         query = token and f"verb=ListRecords&resumptionToken={token}"
+    >>> harvest = OaiListRecords(responses())
+    """
+
+    def __init__(
+        self,
+        sources: Iterable[OaiSource],
+        context: MarcContext = MarcContext(),
+    ):
+        self._sources = sources
+        self._context = context
+        self.resumption_token: str | None = None
+        self.complete_list_size: int | None = None
+
+    def __iter__(self) -> Iterator[OaiRecord]:
+        for source in self._sources:
+            yield from self.iter_response(source)
+
+    def iter_response(self, source: OaiSource) -> Iterator[OaiRecord]:
+        """
+        Iterate over the records of a single response document and
+        update `resumption_token` once it is read.
+
+        Raises
+        ------
+        ValueError
+            If the response reports an OAI-PMH error other than
+            'noRecordsMatch'.
+        """
+        token: str | None = None
+        stream = open_input(source)
+        try:
+            for _, element in etree.iterparse(
+                stream,
+                events=("end",),
+                tag=(_RECORD, _RESUMPTION_TOKEN, _ERROR),
+            ):
+                if element.tag == _RECORD:
+                    yield self._read_record(element)
+                elif element.tag == _RESUMPTION_TOKEN:
+                    # An empty token marks the last response of the list
+                    token = (element.text or "").strip() or None
+                    size = element.get("completeListSize")
+                    if size is not None and size.isdigit():
+                        self.complete_list_size = int(size)
+                else:
+                    code = element.get("code")
+                    if code != _NO_RECORDS_MATCH:
+                        raise ValueError(
+                            f"OAI-PMH error {code}: "
+                            f"{(element.text or '').strip()}"
+                        )
+
+                element.clear(keep_tail=True)
+                parent = element.getparent()
+                if parent is not None:
+                    while element.getprevious() is not None:
+                        del parent[0]
+        finally:
+            if stream is not source:
+                stream.close()
+
+        self.resumption_token = token
+
+    def _read_record(self, element: _Element) -> OaiRecord:
+        header = element.find(_HEADER)
+        if header is None:
+            raise ValueError("OAI-PMH record without header.")
+
+        identifier = header.findtext(_IDENTIFIER, "").strip()
+        datestamp = header.findtext(_DATESTAMP, "").strip()
+        deleted = header.get("status") == "deleted"
+
+        record: MarcRecord | None = None
+        if not deleted:
+            marc = element.find(f"{_METADATA}/{MARC_RECORD_TAG}")
+            if marc is None:
+                raise ValueError(
+                    f"OAI-PMH record {identifier} without MARCXML metadata."
+                )
+            record = MarcRecord.from_xml(marc, self._context)
+
+        return identifier, datestamp, deleted, record
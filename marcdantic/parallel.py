@@ -0,0 +1,220 @@
+import os
+import re
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
+from itertools import islice
+from typing import Deque, Iterable, Iterator, List, Set, Tuple
+
+from lxml import etree
+from pydantic import BaseModel
+
+from .context import MarcContext
+from .record import MarcRecord
+
+#: Default number of records sent to a worker at once
+DEFAULT_PARSE_CHUNK_SIZE = 200
+
+#: Raw record: ISO 2709 bytes, a serialized MARCXML record element
+#: or a JSON record
+RawRecord = bytes | str
+
+_XML_START = b"<"
+_JSON_START = b"{"
+# First byte after any leading whitespace or UTF-8 byte order mark
+_FIRST_BYTE = re.compile(rb"[ \t\r\n\xef\xbb\xbf]*(.)", re.DOTALL)
+
+
+class ParseResult(BaseModel):
+    """
+    Outcome of parsing a single raw record by `parse_many`.
+
+    Attributes
+    ----------
+    index : int
+        Position of the raw record in the input.
+    record : MarcRecord | None
+        The parsed record, None if parsing failed.
+    error : str | None
+        Description of the parsing error, None on success.
+    """
+
+    index: int
+    record: MarcRecord | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def parse_record(data: RawRecord, context: MarcContext) -> MarcRecord:
+    """
+    Parse a raw ISO 2709 record, a serialized MARCXML record
+    or a JSON record.
+
+    MARCXML is recognized by its leading '<' and JSON by its leading '{'.
+    """
+    raw = data.encode("utf-8") if isinstance(data, str) else data
+    match = _FIRST_BYTE.match(raw)
+    start = match.group(1) if match else b""
+    if start == _XML_START:
+        return MarcRecord.from_xml(etree.fromstring(raw), context)
+    if start == _JSON_START:
+        record = MarcRecord.model_validate_json(
+            raw, context={"marc_context": context}
+        )
+        record._context = context
+        return record
+    return MarcRecord.from_mrc(raw, context)
+
+
+def _parse_chunk(
+    start: int, chunk: List[RawRecord], context: MarcContext
+) -> List[ParseResult]:
+    results: List[ParseResult] = []
+    for index, data in enumerate(chunk, start):
+        try:
+            record = parse_record(data, context)
+        except Exception as error:
+            results.append(
+                ParseResult.model_construct(
+                    index=index, error=f"{type(error).__name__}: {error}"
+                )
+            )
+            continue
+
+        # The context is attached again by the parent process
+        record._context = None
+        # The record is already validated
+        results.append(ParseResult.model_construct(index=index, record=record))
+    return results
+
+
+def _iter_chunks(
+    items: Iterable[RawRecord], chunk_size: int
+) -> Iterator[Tuple[int, List[RawRecord]]]:
+    iterator = iter(items)
+    start = 0
+    while chunk := list(islice(iterator, chunk_size)):
+        yield start, chunk
+        start += len(chunk)
+
+
+def parse_many(
+    items: Iterable[RawRecord],
+    context: MarcContext = MarcContext(),
+    jobs: int | None = None,
+    chunk_size: int = DEFAULT_PARSE_CHUNK_SIZE,
+    ordered: bool = True,
+    executor: Executor | None = None,
+) -> Iterator[ParseResult]:
+    """
+    Parse raw records in worker processes.
+
+    The input is consumed lazily in chunks of `chunk_size` records and
+    at most two chunks per worker are in flight, so arbitrarily long
+    streams are parsed in bounded memory. A record that fails to parse
+    produces a `ParseResult` with an error instead of stopping
+    the batch.
+
+    Parameters
+    ----------
+    items : iterable of bytes or str
+        Raw ISO 2709 records (e.g. from `iter_mrc_data`), serialized
+        MARCXML record elements or JSON records, in any mix.
+    context : MarcContext
+        Parsing context, sent to the workers with every chunk and
+        attached to the returned records.
+    jobs : int or None
+        Number of worker processes, `os.cpu_count()` by default.
+        With a single job, records are parsed in the calling process.
+    chunk_size : int
+        Number of records sent to a worker at once. Larger chunks
+        lower the inter-process overhead of small records.
+    ordered : bool
+        Yield results in input order; otherwise yield each chunk
+        as soon as it is parsed.
+    executor : Executor or None
+        Executor to use instead of a new `ProcessPoolExecutor`;
+        it is not shut down afterwards.
+
+    Yields
+    ------
+    ParseResult
+        One result per input record.
+
+    Examples
+    --------
+    >>> with open("dump.mrc", "rb") as stream:
+    ...     for result in parse_many(iter_mrc_data(stream), jobs=8):
+    ...         if result.ok:
+    ...             load(result.record)
+    ...         else:
+    ...             log(result.index, result.error)
+    """
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be a positive number.")
+
+    jobs = jobs or os.cpu_count() or 1
+    chunks = _iter_chunks(items, chunk_size)
+
+    if executor is None and jobs == 1:
+        for start, chunk in chunks:
+            for result in _parse_chunk(start, chunk, context):
+                if result.record is not None:
+                    result.record._context = context
+                yield result
+        return
+
+    pool = executor or ProcessPoolExecutor(max_workers=jobs)
+    try:
+        yield from _collect(pool, chunks, context, 2 * jobs, ordered)
+    finally:
+        if executor is None:
+            pool.shutdown(cancel_futures=True)
+
+
+def _collect(
+    pool: Executor,
+    chunks: Iterator[Tuple[int, List[RawRecord]]],
+    context: MarcContext,
+    max_pending: int,
+    ordered: bool,
+) -> Iterator[ParseResult]:
+    pending: Deque[Future] = deque()
+    running: Set[Future] = set()
+
+    def submit() -> bool:
+        chunk = next(chunks, None)
+        if chunk is None:
+            return False
+        future = pool.submit(_parse_chunk, *chunk, context)
+        pending.append(future)
+        running.add(future)
+        return True
+
+    while len(pending) < max_pending and submit():
+        pass
+
+    while pending:
+        if ordered:
+            done = [pending.popleft()]
+        else:
+            completed, _ = wait(running, return_when=FIRST_COMPLETED)
+            done = list(completed)
+            for future in done:
+                pending.remove(future)
+
+        for future in done:
+            running.discard(future)
+            submit()
+            for result in future.result():
+                if result.record is not None:
+                    result.record._context = context
+                yield result
@@ -0,0 +1,191 @@
+import re
+from typing import Any, Callable, List, Tuple
+
+import jq
+from pydantic import BaseModel
+
+#: A single step of a path expression and whether its errors are ignored
+PathStep = Tuple[Callable[[Any], List[Any]], bool]
+
+_STRING = r'"[^"\\]*"'
+_STEP_PATTERN = re.compile(
+    r"""
+    \.(?P<name>[A-Za-z_][A-Za-z0-9_]*)
+    | \.?\[(?P<keys>{string}(?:,{string})*)\]
+    | \.?\[(?P<index>-?\d+)\]
+    | \.?(?P<iterate>\[\])
+    """.format(string=_STRING),
+    re.VERBOSE,
+)
+
+
+class _PathError(Exception):
+    """
+    Raised when a step cannot be applied to a value. The program then
+    falls back to jq, which reports the error with its own message.
+    """
+
+
+def _lookup(value: Any, key: str) -> Any:
+    if value is None:
+        return None
+    if isinstance(value, dict):
+        return value.get(key)
+    if isinstance(value, BaseModel):
+        if key in type(value).model_fields:
+            return getattr(value, key)
+        return None
+    raise _PathError
+
+
+def _key_step(keys: List[str]) -> Callable[[Any], List[Any]]:
+    if len(keys) == 1:
+        key = keys[0]
+        return lambda value: [_lookup(value, key)]
+    return lambda value: [_lookup(value, key) for key in keys]
+
+
+def _index_step(index: int) -> Callable[[Any], List[Any]]:
+    def step(value: Any) -> List[Any]:
+        if value is None:
+            return [None]
+        if isinstance(value, list):
+            if -len(value) <= index < len(value):
+                return [value[index]]
+            return [None]
+        raise _PathError
+
+    return step
+
+
+def _iterate_step(value: Any) -> List[Any]:
+    if isinstance(value, list):
+        return value
+    if isinstance(value, dict):
+        return list(value.values())
+    if isinstance(value, BaseModel):
+        return [getattr(value, name) for name in type(value).model_fields]
+    raise _PathError
+
+
+def to_plain(value: Any) -> Any:
+    """
+    Convert models and containers to the plain JSON-like values that
+    jq produces for the same data.
+    """
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    if isinstance(value, dict):
+        return {key: to_plain(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [to_plain(item) for item in value]
+    return value
+
+
+class PathProgram:
+    """
+    Native evaluation of a simple jq path expression.
+
+    The program runs directly on `VariableFields.root` or on a
+    `VariableField`, without dumping the models into plain dictionaries.
+    Results are converted to plain values, so they are equal to the
+    results of the jq library.
+
+    Parameters
+    ----------
+    jq_filter : str
+        The original filter, used for the jq fallback.
+    steps : list of PathStep
+        The compiled steps of the path.
+    """
+
+    def __init__(self, jq_filter: str, steps: List[PathStep]):
+        self.jq_filter = jq_filter
+        self._steps = steps
+
+    def all(self, value: Any) -> List[Any]:
+        """
+        Evaluate the path on `value` and return all results.
+
+        Raises
+        ------
+        ValueError
+            If a step without `?` is applied to a value of the wrong
+            type (e.g. iterating over null), as jq does.
+        """
+        try:
+            values = [value]
+            for step, optional in self._steps:
+                results: List[Any] = []
+                for item in values:
+                    try:
+                        results.extend(step(item))
+                    except _PathError:
+                        if not optional:
+                            raise
+                values = results
+        except _PathError:
+            # Let jq raise the error with its usual message
+            return jq.compile(self.jq_filter).input(to_plain(value)).all()
+
+        return [to_plain(item) for item in values]
+
+
+def compile_path(jq_filter: str) -> PathProgram | None:
+    """
+    Compile a jq filter consisting only of simple path steps.
+
+    Supported steps are object keys (`.subfields`, `.["245"]`,
+    `.["020","022"]`), array indexes (`[0]`, `[-1]`) and iteration
+    (`[]`), each optionally followed by `?`.
+
+    Parameters
+    ----------
+    jq_filter : str
+        A jq filter string, e.g., '.["020"]?[]?.subfields.a[]?'
+
+    Returns
+    -------
+    PathProgram or None
+        The compiled program, or None if the filter uses any other
+        jq feature.
+    """
+    steps: List[PathStep] = []
+    position = 0
+
+    while position < len(jq_filter):
+        match = _STEP_PATTERN.match(jq_filter, position)
+        # A leading bracket without a dot is an array literal in jq
+        if match is None or (position == 0 and jq_filter[0] != "."):
+            return None
+
+        if match["name"]:
+            step = _key_step([match["name"]])
+        elif match["keys"]:
+            step = _key_step(
+                [key[1:-1] for key in re.findall(_STRING, match["keys"])]
+            )
+        elif match["index"]:
+            step = _index_step(int(match["index"]))
+        else:
+            step = _iterate_step
+
+        position = match.end()
+        optional = jq_filter.startswith("?", position)
+        if optional:
+            position += 1
+
+        steps.append((step, optional))
+
+    if not steps:
+        return None
+
+    return PathProgram(jq_filter, steps)
+
+
+def compile_program(jq_filter: str) -> Any:
+    """
+    Compile a filter to a `PathProgram` when possible,
+    and to a jq program otherwise.
+    """
+    return compile_path(jq_filter) or jq.compile(jq_filter)
@@ -0,0 +1,450 @@
+import re
+from itertools import count
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+
+from .constants import CONTROL_FIELDS
+from .matcher import RecordPredicate, compile_query
+from .query import (
+    MarcBoolQuery,
+    MarcCondition,
+    MarcSearchRequest,
+    MarcTerm,
+    SearchOperator,
+)
+from .record import MarcRecord
+
+#: Field key: field tag and subfield code (None for any subfield)
+FieldKey = Tuple[str, str | None]
+
+#: Relative cost of the conditions used to select candidate queries
+_ANCHOR_COST = {
+    SearchOperator.Exact: 1,
+    SearchOperator.StartsWith: 2,
+    SearchOperator.EndsWith: 2,
+    SearchOperator.Contains: 2,
+    SearchOperator.Regex: 4,
+}
+
+_SUBSTRING_OPERATORS = (
+    SearchOperator.StartsWith,
+    SearchOperator.EndsWith,
+    SearchOperator.Contains,
+)
+
+
+class AhoCorasick:
+    """
+    Aho-Corasick automaton finding all occurrences of many patterns
+    in a single pass over the text.
+
+    Examples
+    --------
+    >>> automaton = AhoCorasick()
+    >>> automaton.add("he")
+    0
+    >>> automaton.add("she")
+    1
+    >>> list(automaton.iter_matches("ushers"))
+    [(4, 1), (4, 0)]
+    """
+
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+        self._merged_output: List[List[int]] = [[]]
+        self._patterns: List[str] = []
+        self._built = True
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+    @property
+    def patterns(self) -> List[str]:
+        return self._patterns
+
+    def add(self, pattern: str) -> int:
+        """
+        Add a non-empty pattern and return its index.
+        """
+        if not pattern:
+            raise ValueError("Cannot add an empty pattern.")
+
+        node = 0
+        for character in pattern:
+            next_node = self._goto[node].get(character)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][character] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            node = next_node
+
+        index = len(self._patterns)
+        self._patterns.append(pattern)
+        self._output[node].append(index)
+        self._built = False
+        return index
+
+    def build(self) -> None:
+        """Compute the failure links, called lazily before searching."""
+        goto = self._goto
+        fail = self._fail
+        # Outputs of the failure chain are merged into each node
+        output = [list(indexes) for indexes in self._output]
+
+        queue = list(goto[0].values())
+        for node in queue:
+            fail[node] = 0
+
+        for node in queue:
+            for character, child in goto[node].items():
+                queue.append(child)
+
+                state = fail[node]
+                while state and character not in goto[state]:
+                    state = fail[state]
+                target = goto[state].get(character, 0)
+                fail[child] = target if target != child else 0
+                output[child].extend(output[fail[child]])
+
+        self._merged_output = output
+        self._built = True
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int]]:
+        """
+        Yield (end, pattern index) for every occurrence of a pattern,
+        where `end` is the position just after the occurrence.
+        """
+        if not self._built:
+            self.build()
+        if not self._patterns:
+            return
+
+        goto = self._goto
+        fail = self._fail
+        output = self._merged_output
+        node = 0
+
+        for position, character in enumerate(text, 1):
+            while node and character not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(character, 0)
+            for index in output[node]:
+                yield position, index
+
+
+class _SubstringConditions:
+    """
+    Substring conditions of a single field, matched with one automaton.
+    """
+
+    def __init__(self):
+        self.automaton = AhoCorasick()
+        self.pattern_indexes: Dict[str, int] = {}
+        # Pattern index -> (query id, operator)
+        self.queries: List[List[Tuple[str, SearchOperator]]] = []
+
+    def add(self, pattern: str, query_id: str, operator: SearchOperator):
+        index = self.pattern_indexes.get(pattern)
+        if index is None:
+            index = self.pattern_indexes[pattern] = self.automaton.add(
+                pattern
+            )
+            self.queries.append([])
+        self.queries[index].append((query_id, operator))
+
+    def match(self, value: str, candidates: Set[str]) -> None:
+        patterns = self.automaton.patterns
+        for end, index in self.automaton.iter_matches(value):
+            length = len(patterns[index])
+            for query_id, operator in self.queries[index]:
+                if operator == SearchOperator.Contains:
+                    candidates.add(query_id)
+                elif operator == SearchOperator.StartsWith:
+                    if end == length:
+                        candidates.add(query_id)
+                elif end == len(value):
+                    candidates.add(query_id)
+
+
+class _RegexConditions:
+    """
+    Regular expression conditions of a single field. A combined
+    alternation rejects values matching none of the expressions before
+    the expressions are tested one by one.
+    """
+
+    def __init__(self):
+        self.expressions: List[Tuple[re.Pattern, str]] = []
+        self._combined: re.Pattern | None = None
+
+    def add(self, pattern: str, query_id: str) -> None:
+        self.expressions.append((re.compile(pattern), query_id))
+        self._combined = None
+
+    def match(self, value: str, candidates: Set[str]) -> None:
+        if self._combined is None:
+            try:
+                self._combined = re.compile(
+                    "|".join(
+                        f"(?:{expression.pattern})"
+                        for expression, _ in self.expressions
+                    )
+                )
+            except re.error:
+                # Group references cannot be combined, skip the prefilter
+                self._combined = re.compile("")
+
+        if self._combined.search(value) is None:
+            return
+
+        for expression, query_id in self.expressions:
+            if expression.search(value) is not None:
+                candidates.add(query_id)
+
+
+def _field_key(condition: MarcCondition) -> FieldKey:
+    # Control fields have no subfields, their whole value is matched
+    if condition.field in CONTROL_FIELDS:
+        return condition.field, None
+    return condition.field, condition.subfield
+
+
+def select_anchors(term: MarcTerm) -> List[MarcCondition] | None:
+    """
+    Select conditions of which at least one matches every record
+    matched by `term`.
+
+    Returns None when no such conditions exist, e.g. for a query with
+    only `must_not` terms.
+    """
+    if isinstance(term, MarcCondition):
+        return [term]
+
+    if term.must:
+        choices = [select_anchors(inner) for inner in term.must]
+        anchors = [choice for choice in choices if choice is not None]
+        if anchors:
+            return min(
+                anchors,
+                key=lambda conditions: sum(
+                    _ANCHOR_COST[condition.operator]
+                    for condition in conditions
+                ),
+            )
+
+    if term.should:
+        anchors = []
+        for inner in term.should:
+            choice = select_anchors(inner)
+            if choice is None:
+                return None
+            anchors.extend(choice)
+        return anchors
+
+    return None
+
+
+class MarcPercolator:
+    """
+    Matches records against many stored queries at once.
+
+    The stored queries are indexed instead of the records. For every
+    query, a set of anchor conditions is selected, at least one of which
+    matches any record matched by the query (see `select_anchors`).
+    The anchors are indexed by field:
+
+    - `Exact` conditions in a hash table keyed by (tag, subfield, value),
+    - `StartsWith`, `EndsWith` and `Contains` conditions in one
+      Aho-Corasick automaton per field,
+    - `Regex` conditions in a combined alternation per field.
+
+    An incoming record is looked up in these structures and only the
+    queries with a matching anchor are evaluated on the record. Queries
+    without anchors (e.g. with only `must_not` terms) are evaluated on
+    every record.
+
+    Examples
+    --------
+    >>> percolator = MarcPercolator()
+    >>> percolator.add("new-chemistry", request)
+    >>> for record in iter_mrc(feed):
+    ...     notify(percolator.percolate(record), record)
+    """
+
+    def __init__(self):
+        self._queries: Dict[str, Tuple[int, RecordPredicate]] = {}
+        self._sequence = count()
+
+        self._exact: Dict[Tuple[str, str | None, str], Set[str]] = {}
+        self._presence: Dict[FieldKey, Set[str]] = {}
+        self._unanchored: Set[str] = set()
+        self._substrings: Dict[FieldKey, _SubstringConditions] = {}
+        self._regexes: Dict[FieldKey, _RegexConditions] = {}
+
+        self._anchors: Dict[str, List[MarcCondition] | None] = {}
+        self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self._queries)
+
+    def __contains__(self, query_id: str) -> bool:
+        return query_id in self._queries
+
+    # --- Stored queries ---
+    def add(
+        self, query_id: str, query: MarcBoolQuery | MarcSearchRequest
+    ) -> None:
+        """
+        Store a query under `query_id`, replacing any previous query
+        with the same identifier.
+        """
+        if isinstance(query, MarcSearchRequest):
+            query = query.query
+
+        if query_id in self._queries:
+            self.remove(query_id)
+
+        self._queries[query_id] = (next(self._sequence), compile_query(query))
+        anchors = self._anchors[query_id] = select_anchors(query)
+
+        if anchors is None:
+            self._unanchored.add(query_id)
+            return
+
+        for condition in anchors:
+            if condition.operator == SearchOperator.Exact:
+                self._exact.setdefault(
+                    (*_field_key(condition), condition.value), set()
+                ).add(query_id)
+            else:
+                self._register(query_id, condition)
+
+    def add_many(
+        self,
+        queries: Iterable[Tuple[str, MarcBoolQuery | MarcSearchRequest]],
+    ) -> None:
+        """Store (query id, query) pairs."""
+        for query_id, query in queries:
+            self.add(query_id, query)
+
+    def remove(self, query_id: str) -> bool:
+        """
+        Remove a stored query.
+
+        Returns
+        -------
+        bool
+            True if the query was stored.
+        """
+        if self._queries.pop(query_id, None) is None:
+            return False
+
+        self._unanchored.discard(query_id)
+        for condition in self._anchors.pop(query_id) or []:
+            key = _field_key(condition)
+            if condition.operator == SearchOperator.Exact:
+                postings = self._exact.get((*key, condition.value))
+                if postings is not None:
+                    postings.discard(query_id)
+                    if not postings:
+                        del self._exact[(*key, condition.value)]
+            else:
+                self._dirty = True
+
+        return True
+
+    def _register(self, query_id: str, condition: MarcCondition) -> None:
+        key = _field_key(condition)
+        operator = condition.operator
+
+        if not condition.value and operator in _SUBSTRING_OPERATORS:
+            # An empty substring matches any value of the field
+            self._presence.setdefault(key, set()).add(query_id)
+        elif operator == SearchOperator.Regex:
+            self._regexes.setdefault(key, _RegexConditions()).add(
+                condition.value, query_id
+            )
+        else:
+            self._substrings.setdefault(key, _SubstringConditions()).add(
+                condition.value, query_id, operator
+            )
+
+    def _rebuild(self) -> None:
+        # Automata do not support removal, they are rebuilt instead
+        self._presence.clear()
+        self._substrings.clear()
+        self._regexes.clear()
+
+        for query_id, conditions in self._anchors.items():
+            for condition in conditions or []:
+                if condition.operator != SearchOperator.Exact:
+                    self._register(query_id, condition)
+
+        self._dirty = False
+
+    # --- Matching ---
+    def candidates(self, record: MarcRecord) -> Set[str]:
+        """
+        Return the identifiers of the stored queries that may match
+        the record.
+        """
+        if self._dirty:
+            self._rebuild()
+
+        candidates = set(self._unanchored)
+        exact = self._exact
+        presence = self._presence
+        substrings = self._substrings
+        regexes = self._regexes
+
+        for key, value in _iter_field_values(record):
+            postings = exact.get((*key, value))
+            if postings:
+                candidates |= postings
+            if presence:
+                queries = presence.get(key)
+                if queries:
+                    candidates |= queries
+            if substrings:
+                conditions = substrings.get(key)
+                if conditions is not None:
+                    conditions.match(value, candidates)
+            if regexes:
+                expressions = regexes.get(key)
+                if expressions is not None:
+                    expressions.match(value, candidates)
+
+        return candidates
+
+    def percolate(self, record: MarcRecord) -> List[str]:
+        """
+        Return the identifiers of the stored queries matching the record,
+        in the order in which the queries were added.
+        """
+        queries = self._queries
+        matching = [
+            query_id
+            for query_id in self.candidates(record)
+            if queries[query_id][1](record)
+        ]
+        matching.sort(key=lambda query_id: queries[query_id][0])
+        return matching
+
+
+def _iter_field_values(record: MarcRecord) -> Iterator[Tuple[FieldKey, str]]:
+    seen: Set[Tuple[FieldKey, str]] = set()
+
+    for tag, value in record.fixed_fields.root.items():
+        seen.add(((tag, None), value))
+
+    for tag, fields in record.variable_fields.root.items():
+        for field in fields:
+            for code, values in field.subfields.items():
+                for value in values:
+                    seen.add(((tag, code), value))
+                    seen.add(((tag, None), value))
+
+    return iter(seen)
@@ -0,0 +1,376 @@
+import math
+from collections import Counter
+from typing import Iterable, List, Mapping, Set, Tuple
+
+from pydantic import BaseModel
+
+from .constants import CONTROL_FIELDS
+from .query import MarcBoolQuery, MarcCondition, MarcTerm, SearchOperator
+
+#: Statistics key: field tag and subfield code (None for any subfield)
+StatisticsKey = Tuple[str, str | None]
+
+#: Assumed fraction of the records with a field matched by an operator
+#: whose selectivity cannot be derived from the value statistics
+DEFAULT_SELECTIVITY = {
+    SearchOperator.StartsWith: 0.1,
+    SearchOperator.EndsWith: 0.1,
+    SearchOperator.Contains: 0.1,
+    SearchOperator.Regex: 0.1,
+}
+
+#: Relative cost of testing one distinct value with a regular expression
+REGEX_COST_FACTOR = 5.0
+
+#: Assumed fraction of field occurrences matching a given indicator
+INDICATOR_SELECTIVITY = 0.5
+
+_MIN_PROBABILITY = 1e-6
+
+
+class IndexStatistics:
+    """
+    Cardinality statistics of the records of a `MarcIndex`.
+
+    For every field tag and subfield code (and for every tag regardless
+    of the subfield), the statistics hold the number of records
+    containing the field and the number of records containing each of
+    its distinct values. The latter are read from the postings of the
+    index, only the per-field record counts are stored.
+
+    Parameters
+    ----------
+    postings : mapping of StatisticsKey to mapping of str to set of int
+        Record identifiers per field key and value, owned by the index.
+    """
+
+    def __init__(
+        self, postings: Mapping[StatisticsKey, Mapping[str, Set[int]]]
+    ):
+        self.record_count = 0
+        self._postings = postings
+        self._field_counts: Counter[StatisticsKey] = Counter()
+
+    def add(self, keys: Iterable[StatisticsKey]) -> None:
+        """Count an indexed record containing the given field keys."""
+        self.record_count += 1
+        self._field_counts.update(keys)
+
+    def field_count(self, key: StatisticsKey) -> int:
+        """Return the number of records containing the field."""
+        return self._field_counts[key]
+
+    def value_count(self, key: StatisticsKey, value: str) -> int:
+        """Return the number of records containing the field value."""
+        values = self._postings.get(key)
+        return len(values.get(value, ())) if values else 0
+
+    def distinct_count(self, key: StatisticsKey) -> int:
+        """Return the number of distinct values of the field."""
+        values = self._postings.get(key)
+        return len(values) if values else 0
+
+
+class PlanNode(BaseModel):
+    """
+    A condition or a boolean query of a `QueryPlan` with its estimates.
+
+    Attributes
+    ----------
+    condition : MarcCondition | None
+        The condition of a leaf node, None for boolean nodes.
+    must, should, must_not : List[PlanNode]
+        Planned terms of a boolean node, in evaluation order.
+    estimate : float
+        Estimated number of matching records.
+    cost : float
+        Estimated cost of the evaluation, roughly the number of values
+        or postings visited.
+    """
+
+    condition: MarcCondition | None = None
+    must: List["PlanNode"] = []
+    should: List["PlanNode"] = []
+    must_not: List["PlanNode"] = []
+    estimate: float
+    cost: float
+
+    def to_term(self) -> MarcTerm:
+        """Return the condition or the rewritten boolean query."""
+        if self.condition is not None:
+            return self.condition
+
+        return MarcBoolQuery(
+            must=[node.to_term() for node in self.must] or None,
+            should=[node.to_term() for node in self.should] or None,
+            must_not=[node.to_term() for node in self.must_not] or None,
+        )
+
+    def explain_lines(self, depth: int = 0) -> List[str]:
+        """Return the indented description of the node and its terms."""
+        indent = "  " * depth
+        estimates = f"(rows={self.estimate:.1f}, cost={self.cost:.1f})"
+
+        if self.condition is not None:
+            description = describe_condition(self.condition)
+            return [f"{indent}{description} {estimates}"]
+
+        lines = [f"{indent}bool {estimates}"]
+        for clause in ("must", "should", "must_not"):
+            nodes: List[PlanNode] = getattr(self, clause)
+            if nodes:
+                lines.append(f"{indent}  {clause}:")
+                for node in nodes:
+                    lines.extend(node.explain_lines(depth + 2))
+        return lines
+
+
+PlanNode.model_rebuild()
+
+
+class QueryPlan(BaseModel):
+    """
+    Rewritten `MarcBoolQuery` together with its estimated costs.
+
+    Attributes
+    ----------
+    root : PlanNode
+        The planned root query.
+    record_count : int
+        Number of records the estimates are based on.
+    """
+
+    root: PlanNode
+    record_count: int
+
+    @property
+    def query(self) -> MarcBoolQuery:
+        """The rewritten query, with its terms in evaluation order."""
+        return self.root.to_term()
+
+    def explain(self) -> str:
+        """Return a human readable description of the plan."""
+        return "\n".join(
+            [f"plan over {self.record_count} records"]
+            + self.root.explain_lines()
+        )
+
+
+def describe_condition(condition: MarcCondition) -> str:
+    """Return a compact description of a condition, e.g. 245$a exact 'X'."""
+    target = condition.field
+    if condition.subfield:
+        target += f"${condition.subfield}"
+    if condition.ind1 or condition.ind2:
+        target += f"[{condition.ind1 or '*'}{condition.ind2 or '*'}]"
+    return f"{target} {condition.operator.value} {condition.value!r}"
+
+
+def _term_key(term: MarcTerm) -> str:
+    return f"{type(term).__name__}:{term.model_dump_json()}"
+
+
+def _unique(terms: List[MarcTerm]) -> List[MarcTerm]:
+    seen: Set[str] = set()
+    unique: List[MarcTerm] = []
+    for term in terms:
+        key = _term_key(term)
+        if key not in seen:
+            seen.add(key)
+            unique.append(term)
+    return unique
+
+
+def flatten_query(query: MarcBoolQuery) -> MarcBoolQuery:
+    """
+    Rewrite a query into an equivalent one with fewer nesting levels
+    and without duplicate terms.
+
+    Notes
+    -----
+    - Nested queries without `should` terms are merged into the `must`
+      and `must_not` terms of a parent `must`.
+    - Nested queries with only `should` terms are merged into
+      the parent `should` and `must_not` terms.
+    - Nested queries with a single `must` term are replaced by the term.
+    - Empty nested queries, which match every record, are dropped from
+      `must`; in `should` they make the whole clause always true.
+    """
+    must: List[MarcTerm] = []
+    should: List[MarcTerm] = []
+    must_not: List[MarcTerm] = []
+    should_always = False
+
+    def single(term: MarcBoolQuery) -> MarcTerm | None:
+        if term.must and len(term.must) == 1 and not (
+            term.should or term.must_not
+        ):
+            return term.must[0]
+        return None
+
+    pending = [(term, "must") for term in query.must or []]
+    pending += [(term, "should") for term in query.should or []]
+    pending += [(term, "must_not") for term in query.must_not or []]
+
+    while pending:
+        term, clause = pending.pop(0)
+        if isinstance(term, MarcCondition):
+            {"must": must, "should": should, "must_not": must_not}[
+                clause
+            ].append(term)
+            continue
+
+        term = flatten_query(term)
+        only_should = bool(term.should) and not (term.must or term.must_not)
+        inner = single(term)
+
+        if not (term.must or term.should or term.must_not):
+            if clause == "should":
+                should_always = True
+            elif clause == "must_not":
+                must_not.append(term)
+        elif inner is not None:
+            pending.append((inner, clause))
+        elif clause == "must" and not term.should:
+            pending += [(inner, "must") for inner in term.must or []]
+            pending += [(inner, "must_not") for inner in term.must_not or []]
+        elif clause in ("should", "must_not") and only_should:
+            pending += [(inner, clause) for inner in term.should]
+        else:
+            {"must": must, "should": should, "must_not": must_not}[
+                clause
+            ].append(term)
+
+    return MarcBoolQuery(
+        must=_unique(must) or None,
+        should=None if should_always else _unique(should) or None,
+        must_not=_unique(must_not) or None,
+    )
+
+
+def _probability(node: PlanNode, record_count: int) -> float:
+    probability = node.estimate / max(record_count, 1)
+    return min(max(probability, _MIN_PROBABILITY), 1 - _MIN_PROBABILITY)
+
+
+class QueryPlanner:
+    """
+    Cost based planner of `MarcBoolQuery` evaluation.
+
+    The planner flattens the query (see `flatten_query`), estimates
+    the number of matching records and the evaluation cost of every
+    term from `IndexStatistics`, and orders the terms of each clause:
+
+    - `must` terms by cost / (1 - p), so cheap and selective terms run
+      first and empty intermediate results stop the evaluation early,
+    - `should` and `must_not` terms by cost / p, so cheap terms likely
+      to decide the clause run first,
+
+    where p is the estimated probability that a record matches the term.
+    `must_not` terms are evaluated by the indexes only after `must` and
+    `should` have narrowed the candidates.
+
+    Parameters
+    ----------
+    statistics : IndexStatistics
+        Statistics of the searched records.
+
+    Examples
+    --------
+    >>> plan = QueryPlanner(index.statistics).plan(request.query)
+    >>> print(plan.explain())
+    """
+
+    def __init__(self, statistics: IndexStatistics):
+        self._statistics = statistics
+
+    def plan(self, query: MarcBoolQuery) -> QueryPlan:
+        """Return the evaluation plan of the query."""
+        return QueryPlan(
+            root=self._plan_query(flatten_query(query)),
+            record_count=self._statistics.record_count,
+        )
+
+    def _plan_term(self, term: MarcTerm) -> PlanNode:
+        if isinstance(term, MarcCondition):
+            return self._plan_condition(term)
+        return self._plan_query(term)
+
+    def _plan_condition(self, condition: MarcCondition) -> PlanNode:
+        statistics = self._statistics
+        # Control fields have no subfields, their whole value is matched
+        key = (
+            condition.field,
+            None if condition.field in CONTROL_FIELDS else condition.subfield,
+        )
+        operator = condition.operator
+
+        if operator == SearchOperator.Exact:
+            estimate = float(statistics.value_count(key, condition.value))
+            cost = 1.0 + estimate
+        else:
+            distinct = statistics.distinct_count(key)
+            estimate = statistics.field_count(key) * DEFAULT_SELECTIVITY[
+                operator
+            ]
+            if operator == SearchOperator.StartsWith:
+                # Bisection, then a scan of the matching values only
+                cost = (
+                    math.log2(distinct + 1)
+                    + distinct * DEFAULT_SELECTIVITY[operator]
+                    + estimate
+                )
+            elif operator == SearchOperator.Regex:
+                cost = distinct * REGEX_COST_FACTOR + estimate
+            else:
+                cost = distinct + estimate
+
+        # Indicators are ignored on control fields, see `compile_condition`
+        for indicator in (condition.ind1, condition.ind2):
+            if indicator and condition.field not in CONTROL_FIELDS:
+                # Candidates are verified against the records
+                cost += estimate
+                estimate *= INDICATOR_SELECTIVITY
+
+        return PlanNode(condition=condition, estimate=estimate, cost=cost)
+
+    def _plan_query(self, query: MarcBoolQuery) -> PlanNode:
+        record_count = self._statistics.record_count
+
+        must = [self._plan_term(term) for term in query.must or []]
+        should = [self._plan_term(term) for term in query.should or []]
+        must_not = [self._plan_term(term) for term in query.must_not or []]
+
+        must.sort(
+            key=lambda node: node.cost
+            / (1 - _probability(node, record_count))
+        )
+        should.sort(
+            key=lambda node: node.cost / _probability(node, record_count)
+        )
+        must_not.sort(
+            key=lambda node: node.cost / _probability(node, record_count)
+        )
+
+        # Terms are assumed to be independent
+        probability = 1.0
+        for node in must:
+            probability *= _probability(node, record_count)
+        if should:
+            missing = 1.0
+            for node in should:
+                missing *= 1 - _probability(node, record_count)
+            probability *= 1 - missing
+        for node in must_not:
+            probability *= 1 - _probability(node, record_count)
+
+        if not (must or should or must_not):
+            probability = 1.0
+
+        return PlanNode(
+            must=must,
+            should=should,
+            must_not=must_not,
+            estimate=probability * record_count,
+            cost=sum(node.cost for node in must + should + must_not),
+        )
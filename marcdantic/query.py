@@ -3,6 +3,8 @@ from typing import List, Union
 
 from pydantic import BaseModel, Field
 
+from .record import MarcRecord
+
 
 class SearchOperator(str, Enum):
     """
@@ -123,3 +125,28 @@ class MarcSearchRequest(BaseModel):
     page_size: int = Field(
         default=10, ge=1, le=1000, description="Results per page (max 1000)"
     )
+
+
+class MarcSearchResult(BaseModel):
+    """
+    Represents one page of records matching a `MarcSearchRequest`.
+
+    Attributes
+    ----------
+    total : int
+        Number of records matching the query across all pages.
+
+    page : int
+        The 1-based page number of the returned records.
+
+    page_size : int
+        The requested number of results per page.
+
+    records : List[MarcRecord]
+        The matching records of the requested page.
+    """
+
+    total: int
+    page: int
+    page_size: int
+    records: List[MarcRecord]
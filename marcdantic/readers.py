@@ -0,0 +1,346 @@
+import bz2
+import gzip
+import io
+import lzma
+import mmap
+import os
+from typing import BinaryIO, Callable, Dict, Iterator, Tuple
+
+from lxml import etree
+from lxml.etree import _Element
+
+from .constants import LEADER_LENGTH, MARC_NS, RECORD_TERMINATOR
+from .context import MarcContext
+from .record import MarcRecord
+
+#: Number of bytes requested from the underlying stream per read
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+#: Bytes tolerated between two records (e.g. newline separated dumps)
+RECORD_SEPARATORS = b"\r\n\t \x00"
+
+#: Clark notation of the MARCXML record element
+MARC_RECORD_TAG = f"{{{MARC_NS['marc']}}}record"
+
+#: Size of the read buffer of decompressed streams
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+
+#: Compression formats detected by `open_input`: leading magic bytes
+#: and the function opening a file name or a binary stream
+COMPRESSION_FORMATS: Dict[str, Tuple[bytes, Callable[..., BinaryIO]]] = {
+    "gzip": (b"\x1f\x8b", gzip.open),
+    "bz2": (b"BZh", bz2.open),
+    "xz": (b"\xfd7zXZ\x00", lzma.open),
+}
+
+_MAGIC_LENGTH = max(
+    len(magic) for magic, _ in COMPRESSION_FORMATS.values()
+)
+
+
+def _peek(stream: BinaryIO, size: int) -> bytes:
+    if hasattr(stream, "peek"):
+        return stream.peek(size)[:size]
+    seekable = getattr(stream, "seekable", None)
+    if seekable is not None and seekable():
+        position = stream.tell()
+        header = stream.read(size)
+        stream.seek(position)
+        return header
+    # The header cannot be read without consuming it
+    return b""
+
+
+def detect_compression(stream: BinaryIO) -> str | None:
+    """
+    Return the name of the compression format of a binary stream
+    ('gzip', 'bz2' or 'xz') from its magic bytes, without consuming
+    them, or None for uncompressed (or undetectable) data.
+    """
+    header = _peek(stream, _MAGIC_LENGTH)
+    for name, (magic, _) in COMPRESSION_FORMATS.items():
+        if header.startswith(magic):
+            return name
+    return None
+
+
+def open_input(
+    source: str | os.PathLike | BinaryIO,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+) -> BinaryIO:
+    """
+    Open a file name or wrap a binary stream for reading, decompressing
+    gzip, bz2 and xz data on the fly.
+
+    The compression is detected from the magic bytes, regardless of
+    the file name. Decompressed data is read through a buffer of
+    `buffer_size` bytes, so consumers issuing small reads (such as
+    the XML parser) do not call the decompressor for each of them.
+
+    Parameters
+    ----------
+    source : str, os.PathLike or BinaryIO
+        A file name or a binary file object. Streams without `peek`
+        must be seekable for their compression to be detected; other
+        streams, e.g. objects providing only `read`, are read as
+        uncompressed data.
+    buffer_size : int
+        Size of the read buffer.
+
+    Returns
+    -------
+    BinaryIO
+        A binary file object with the decompressed data. Uncompressed
+        streams are returned unchanged. Closing the object returned for
+        a file name closes the file; closing a decompressing wrapper of
+        a stream leaves the stream open.
+
+    Examples
+    --------
+    >>> with open_input("dump.mrc.gz") as stream:
+    ...     for record in iter_mrc(stream):
+    ...         ...
+    """
+    if isinstance(source, (str, os.PathLike)):
+        stream: BinaryIO = open(source, "rb", buffering=buffer_size)
+        compression = detect_compression(stream)
+        if compression is None:
+            return stream
+        stream.close()
+    else:
+        compression = detect_compression(source)
+        if compression is None:
+            return source
+
+    _, decompress = COMPRESSION_FORMATS[compression]
+    return io.BufferedReader(decompress(source, "rb"), buffer_size)
+
+
+def find_record_end(
+    data: bytes | bytearray | mmap.mmap, start: int, complete: bool = True
+) -> int:
+    """
+    Return the offset just past the record terminator of the ISO 2709
+    record starting at `start` of `data`.
+
+    The record length stored in the first five bytes of the leader is
+    used when it is consistent with the position of the record
+    terminator. Otherwise (e.g. a missing length or a wrong one, as
+    produced by some exports of records longer than 99,999 bytes), the
+    record ends at the next record terminator.
+
+    Parameters
+    ----------
+    data : bytes, bytearray or mmap.mmap
+        Buffer holding the record.
+    start : int
+        Offset of the leader of the record.
+    complete : bool
+        False if more data may follow the end of `data`. The leader
+        length is then trusted to point past the buffer instead of
+        falling back to the record terminator.
+
+    Returns
+    -------
+    int
+        The end offset of the record, or -1 if `data` does not hold
+        the whole record.
+    """
+    length_digits = data[start : start + 5]
+    record_length = int(length_digits) if length_digits.isdigit() else 0
+    end = start + record_length
+
+    if record_length > LEADER_LENGTH:
+        if end > len(data):
+            if not complete:
+                return -1
+        elif data[end - 1] == RECORD_TERMINATOR[0]:
+            return end
+
+    terminator = data.find(RECORD_TERMINATOR, start + LEADER_LENGTH)
+    return -1 if terminator == -1 else terminator + 1
+
+
+def iter_mrc_data(
+    stream: BinaryIO, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """
+    Split a stream of concatenated ISO 2709 records into raw records.
+
+    The stream is consumed in chunks of `chunk_size` bytes, so only
+    the records currently being split are held in memory.
+
+    Parameters
+    ----------
+    stream : BinaryIO
+        Any binary file object providing a `read(size)` method, plain
+        or compressed with gzip, bz2 or xz (see `open_input`).
+    chunk_size : int
+        Number of bytes requested from the stream per read.
+
+    Yields
+    ------
+    bytes
+        The raw bytes of a single record, including the record
+        terminator (0x1D).
+
+    Raises
+    ------
+    ValueError
+        If the stream ends in the middle of a record.
+
+    Notes
+    -----
+    - Records are cut by `find_record_end`, from their leader length or
+      their record terminator.
+    - Whitespace and NUL bytes between records are skipped.
+    """
+    opened = open_input(stream)
+    try:
+        yield from _split_mrc(opened, chunk_size)
+    finally:
+        if opened is not stream:
+            opened.close()
+
+
+def _split_mrc(stream: BinaryIO, chunk_size: int) -> Iterator[bytes]:
+    buffer = bytearray()
+    position = 0
+    exhausted = False
+
+    def fill(size: int) -> bool:
+        nonlocal position, exhausted
+
+        while len(buffer) - position < size and not exhausted:
+            if position > chunk_size:
+                del buffer[:position]
+                position = 0
+
+            chunk = stream.read(chunk_size)
+            if not chunk:
+                exhausted = True
+                break
+            buffer.extend(chunk)
+
+        return len(buffer) - position >= size
+
+    while True:
+        # Skip separators between records
+        while True:
+            if not fill(1):
+                return
+            if buffer[position] not in RECORD_SEPARATORS:
+                break
+            position += 1
+
+        if not fill(LEADER_LENGTH):
+            raise ValueError("Unexpected end of stream inside MARC leader.")
+
+        while True:
+            end = find_record_end(buffer, position, complete=exhausted)
+            if end != -1:
+                break
+            if exhausted:
+                raise ValueError(
+                    "Unexpected end of stream: missing record terminator."
+                )
+            fill(len(buffer) - position + 1)
+
+        yield bytes(buffer[position:end])
+        position = end
+
+
+def iter_mrc(
+    stream: BinaryIO,
+    context: MarcContext = MarcContext(),
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[MarcRecord]:
+    """
+    Iterate over the records of a multi-record ISO 2709 stream.
+
+    Parameters
+    ----------
+    stream : BinaryIO
+        Binary file object with concatenated MARC21 records.
+    context : MarcContext
+        Parsing context passed to `MarcRecord.from_mrc`.
+    chunk_size : int
+        Number of bytes requested from the stream per read.
+
+    Yields
+    ------
+    MarcRecord
+        Parsed records in stream order.
+    """
+    for data in iter_mrc_data(stream, chunk_size):
+        yield MarcRecord.from_mrc(data, context)
+
+
+def iter_xml_elements(source: str | BinaryIO) -> Iterator[_Element]:
+    """
+    Iterate over the `marc:record` elements of a MARCXML document.
+
+    The document is parsed incrementally with `lxml.etree.iterparse`.
+    Once the consumer advances the iterator, the previous record element
+    is cleared and detached together with its preceding siblings, so
+    the memory used does not grow with the size of the collection.
+
+    Parameters
+    ----------
+    source : str or BinaryIO
+        A file name or a binary file object with a MARCXML
+        `<collection>` (or a single `<record>`), plain or compressed
+        with gzip, bz2 or xz (see `open_input`).
+
+    Yields
+    ------
+    lxml.etree._Element
+        A fully parsed `marc:record` element. It is only valid until
+        the next element is requested.
+    """
+    stream = open_input(source)
+    try:
+        for _, element in etree.iterparse(
+            stream, events=("end",), tag=MARC_RECORD_TAG
+        ):
+            yield element
+
+            element.clear(keep_tail=True)
+            parent = element.getparent()
+            if parent is not None:
+                while element.getprevious() is not None:
+                    del parent[0]
+    finally:
+        if stream is not source:
+            stream.close()
+
+
+def iter_xml_data(source: str | BinaryIO) -> Iterator[bytes]:
+    """
+    Iterate over the `marc:record` elements of a MARCXML document
+    serialized as standalone XML fragments, e.g. for `parse_many`.
+    """
+    for element in iter_xml_elements(source):
+        yield etree.tostring(element)
+
+
+def iter_xml(
+    source: str | BinaryIO, context: MarcContext = MarcContext()
+) -> Iterator[MarcRecord]:
+    """
+    Iterate over the records of a MARCXML collection with flat memory.
+
+    Parameters
+    ----------
+    source : str or BinaryIO
+        A file name or a binary file object with a MARCXML collection.
+    context : MarcContext
+        Parsing context passed to `MarcRecord.from_xml`.
+
+    Yields
+    ------
+    MarcRecord
+        Parsed records in document order.
+    """
+    for element in iter_xml_elements(source):
+        yield MarcRecord.from_xml(element, context)
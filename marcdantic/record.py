@@ -1,5 +1,8 @@
+from time import perf_counter
+from typing import Any, Dict
+
 from lxml.etree import _Element
-from pydantic import BaseModel, PrivateAttr, model_validator
+from pydantic import BaseModel, PrivateAttr, ValidationInfo, model_validator
 
 from marcdantic.selectors import (
     ControlFieldsSelector,
@@ -8,9 +11,18 @@ from marcdantic.selectors import (
 )
 
 from .context import MarcContext
-from .fields import FixedFields, VariableFields
+from .fields import (
+    FixedFields,
+    LazyVariableFieldsDict,
+    VariableFields,
+    construct_model,
+    construct_variable_field,
+)
 from .from_mrc import from_mrc
 from .from_xml import from_xml
+from .instrumentation import get_instrumentation
+from .to_mrc import to_mrc
+from .to_xml import to_xml
 
 
 class MarcRecord(BaseModel):
@@ -57,13 +69,27 @@ class MarcRecord(BaseModel):
     -------------
     from_mrc(data: bytes, encoding: str = "utf-8") -> MarcRecord
         Create a `MarcRecord` instance from raw MRC (ISO 2709) binary data.
+        With `MarcContext.lazy_fields` enabled, variable fields are
+        decoded and validated per tag on first access. With
+        `MarcContext.trusted` enabled, validation is skipped entirely.
 
     from_xml(data: _Element) -> MarcRecord
         Create a `MarcRecord` instance from a parsed MARCXML `_Element`.
+
+    Methods
+    -------
+    to_mrc(encoding: str | None = None) -> bytes
+        Serialize the current fields to ISO 2709 bytes. Unlike `marc`,
+        which holds the parsed input, the result reflects changes made
+        to the fields.
+
+    to_xml() -> bytes
+        Serialize the current fields to a MARCXML `record` element.
     """
 
     # --- Private attributes (not part of serialization) ---
     _marc: bytes | None = PrivateAttr(default=None)
+    _encoding: str | None = PrivateAttr(default=None)
     _context: MarcContext = PrivateAttr(default_factory=MarcContext)
 
     # --- Public fields (serialized/deserialized) ---
@@ -72,6 +98,15 @@ class MarcRecord(BaseModel):
     variable_fields: VariableFields
 
     # --- Properties ---
+    @property
+    def encoding(self) -> str | None:
+        """
+        Codec of the raw ISO 2709 bytes of the record: the one used by
+        `from_mrc` (e.g. chosen from the leader with
+        `mrc_encoding="auto"`), 'utf-8' for records built by `from_xml`.
+        """
+        return self._encoding
+
     @property
     def leader_selector(self) -> LeaderSelector:
         return LeaderSelector(self.leader)
@@ -88,35 +123,140 @@ class MarcRecord(BaseModel):
     def from_json(
         cls, data: dict, context: MarcContext = MarcContext()
     ) -> "MarcRecord":
-        record = cls.model_validate(data)
+        record = cls.model_validate(data, context={"marc_context": context})
         record._context = context
         return record
 
     @classmethod
     def from_mrc(
-        cls, data: bytes, context: MarcContext = MarcContext()
+        cls,
+        data: bytes | bytearray | memoryview,
+        context: MarcContext = MarcContext(),
     ) -> "MarcRecord":
-        record = cls.model_validate(from_mrc(data, context))
-        record._marc = data
-        record._context = context
-        return record
+        return cls._from_parsed(from_mrc(data, context), context)
 
     @classmethod
     def from_xml(
         cls, data: _Element, context: MarcContext = MarcContext()
     ) -> "MarcRecord":
-        parsed_data = from_xml(data, context)
-        record = cls.model_validate(parsed_data)
-        record._marc = parsed_data["marc"]
-        record._context = context
+        return cls._from_parsed(from_xml(data, context), context)
+
+    @classmethod
+    def _from_parsed(
+        cls, parsed_data: Dict[str, Any], context: MarcContext
+    ) -> "MarcRecord":
+        instrumentation = get_instrumentation(context)
+        if instrumentation is None:
+            return cls._build_parsed(parsed_data, context)
+
+        started = perf_counter()
+        try:
+            return cls._build_parsed(parsed_data, context)
+        finally:
+            instrumentation.add_time("validation", perf_counter() - started)
+
+    @classmethod
+    def _build_parsed(
+        cls, parsed_data: Dict[str, Any], context: MarcContext
+    ) -> "MarcRecord":
+        """
+        Create a record from the output of `from_mrc` or `from_xml`.
+
+        Trusted contexts construct all models without validation and
+        lazy records validate their variable fields on first access;
+        otherwise (including `from_xml` output in lazy contexts, which
+        is never lazy) the whole record is validated. Mandatory fields are
+        checked against `context` in every mode.
+        """
+        private = {
+            "_marc": parsed_data["marc"],
+            "_encoding": parsed_data.get("encoding"),
+            "_context": context,
+        }
+        variable_fields = parsed_data["variable_fields"]
+
+        if context.trusted:
+            fixed_fields = construct_model(
+                FixedFields, {"root": parsed_data["fixed_fields"]}
+            )
+            if not isinstance(variable_fields, LazyVariableFieldsDict):
+                variable_fields = {
+                    tag: [construct_variable_field(field) for field in fields]
+                    for tag, fields in variable_fields.items()
+                }
+        elif isinstance(variable_fields, LazyVariableFieldsDict):
+            # Lazy `from_mrc` output validates its fields on first access
+            fixed_fields = FixedFields.model_validate(
+                parsed_data["fixed_fields"]
+            )
+        else:
+            record = cls.model_validate(
+                parsed_data, context={"marc_context": context}
+            )
+            record._marc = parsed_data["marc"]
+            record._encoding = parsed_data.get("encoding")
+            record._context = context
+            return record
+
+        record = construct_model(
+            cls,
+            {
+                "leader": parsed_data["leader"],
+                "fixed_fields": fixed_fields,
+                "variable_fields": construct_model(
+                    VariableFields,
+                    {"root": variable_fields},
+                    {"_plain_root": None},
+                ),
+            },
+            private,
+        )
+        cls._check_mandatory_fields(record, context)
         return record
 
+    # --- Serialization ---
+    def to_mrc(self, encoding: str | None = None) -> bytes:
+        """
+        Serialize the record to ISO 2709 bytes (see `to_mrc.to_mrc`).
+
+        Parameters
+        ----------
+        encoding : str or None
+            Codec of the field data, by default the encoding the record
+            was parsed with, or 'utf-8'.
+        """
+        return to_mrc(
+            self.leader,
+            self.fixed_fields.root,
+            self.variable_fields.root,
+            encoding or self._encoding or "utf-8",
+        )
+
+    def to_xml(self) -> bytes:
+        """
+        Serialize the record to a UTF-8 encoded MARCXML `record` element
+        (see `to_xml.to_xml`).
+        """
+        return to_xml(
+            self.leader, self.fixed_fields.root, self.variable_fields.root
+        )
+
     # --- Validation ---
     @model_validator(mode="after")
-    def check_mandatory_fields(cls, model: "MarcRecord") -> "MarcRecord":
+    def check_mandatory_fields(
+        cls, model: "MarcRecord", info: ValidationInfo
+    ) -> "MarcRecord":
+        context = (info.context or {}).get("marc_context", model._context)
+        cls._check_mandatory_fields(model, context)
+        return model
+
+    @staticmethod
+    def _check_mandatory_fields(
+        model: "MarcRecord", context: MarcContext
+    ) -> None:
         missing = []
 
-        for tag in model._context.mandatory_fields:
+        for tag in context.mandatory_fields:
             if tag in model.fixed_fields.root:
                 continue
             if tag in model.variable_fields.root:
@@ -128,5 +268,3 @@ class MarcRecord(BaseModel):
             raise ValueError(
                 f"Missing mandatory MARC field(s): {', '.join(missing)}"
             )
-
-        return model
@@ -158,15 +158,21 @@ class MarcIssuesSelector:
         tag = self._context.issue_mapping.tag
         code = self._context.issue_mapping.barcode
 
-        query = (
-            f'.["{tag}"][] | select(.subfields["{code}"][0] == "{barcode}")'
+        # The filter does not depend on the barcode, so its compiled
+        # program is shared by all lookups through the jq cache
+        fields = self._variable_fields.query(f'.["{tag}"][]')
+
+        field_data = next(
+            (
+                field
+                for field in fields
+                if (field["subfields"].get(code) or [None])[0] == barcode
+            ),
+            None,
         )
-
-        result = self._variable_fields.query(query)
-        if not result:
+        if field_data is None:
             return None
 
-        field_data = result[0] if isinstance(result, list) else result
         field = VariableField.model_validate(field_data)
 
         return self._create_issue(field)
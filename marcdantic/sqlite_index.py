@@ -0,0 +1,405 @@
+import json
+import re
+import sqlite3
+from functools import lru_cache
+from typing import Any, Iterable, List, Set, Tuple
+
+from .constants import CONTROL_FIELDS
+from .context import MarcContext
+from .matcher import normalize_indicator
+from .query import (
+    MarcBoolQuery,
+    MarcCondition,
+    MarcSearchRequest,
+    MarcSearchResult,
+    MarcTerm,
+    SearchOperator,
+)
+from .record import MarcRecord
+
+#: SQL statement together with its parameters
+SqlQuery = Tuple[str, List[Any]]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    id INTEGER PRIMARY KEY,
+    control_number TEXT NOT NULL UNIQUE,
+    data TEXT NOT NULL,
+    marc BLOB,
+    encoding TEXT
+);
+CREATE TABLE IF NOT EXISTS fields (
+    id INTEGER PRIMARY KEY,
+    record_id INTEGER NOT NULL,
+    tag TEXT NOT NULL,
+    ind1 TEXT,
+    ind2 TEXT,
+    code TEXT,
+    value TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS fields_tag_value ON fields (tag, value);
+CREATE INDEX IF NOT EXISTS fields_tag_code_value ON fields (tag, code, value);
+CREATE INDEX IF NOT EXISTS fields_record ON fields (record_id);
+"""
+
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS fields_fts USING fts5(
+    value,
+    content='fields',
+    content_rowid='id',
+    tokenize='trigram case_sensitive 1'
+);
+CREATE TRIGGER IF NOT EXISTS fields_fts_insert AFTER INSERT ON fields BEGIN
+    INSERT INTO fields_fts (rowid, value) VALUES (new.id, new.value);
+END;
+CREATE TRIGGER IF NOT EXISTS fields_fts_delete AFTER DELETE ON fields BEGIN
+    INSERT INTO fields_fts (fields_fts, rowid, value)
+    VALUES ('delete', old.id, old.value);
+END;
+"""
+
+#: Minimal length of a searched value for the trigram index to apply
+_TRIGRAM_LENGTH = 3
+
+
+@lru_cache(maxsize=256)
+def _compile_regex(pattern: str) -> re.Pattern:
+    return re.compile(pattern)
+
+
+def _regexp(pattern: str, value: str | None) -> bool:
+    if value is None:
+        return False
+    return _compile_regex(pattern).search(value) is not None
+
+
+class SqliteMarcIndex:
+    """
+    Persistent search index of `MarcRecord` instances stored in SQLite.
+
+    Every field value is stored as a normalized row
+    (record id, tag, ind1, ind2, subfield code, value) with B-tree
+    indexes on (tag, value) and (tag, code, value). When the SQLite build
+    provides FTS5, a trigram full-text index speeds up `Contains` and
+    `EndsWith` conditions. Records themselves are stored as JSON next to
+    their raw MARC data, so search results never need to be reparsed
+    from MARC.
+
+    Records are identified by their control number (001): adding a
+    record with an existing control number replaces it in place.
+
+    Parameters
+    ----------
+    path : str
+        Path of the database file, ':memory:' for a temporary index.
+    context : MarcContext
+        Context attached to the records loaded from the index.
+    use_fts : bool
+        Whether to maintain the trigram full-text index, if supported.
+
+    Examples
+    --------
+    >>> with SqliteMarcIndex("catalogue.sqlite") as index:
+    ...     index.add_many(iter_mrc(stream))
+    ...     result = index.search(request)
+    """
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        context: MarcContext = MarcContext(),
+        use_fts: bool = True,
+    ):
+        self._context = context
+        self._connection = sqlite3.connect(path)
+        self._connection.create_function(
+            "regexp", 2, _regexp, deterministic=True
+        )
+        self._connection.executescript(_SCHEMA)
+
+        self._fts = False
+        if use_fts:
+            try:
+                self._connection.executescript(_FTS_SCHEMA)
+                self._fts = True
+            except sqlite3.OperationalError:
+                # FTS5 or the trigram tokenizer is not available
+                pass
+
+    # --- Context manager ---
+    def __enter__(self) -> "SqliteMarcIndex":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._connection.close()
+
+    def __len__(self) -> int:
+        return self._connection.execute(
+            "SELECT count(*) FROM records"
+        ).fetchone()[0]
+
+    # --- Updates ---
+    def add(self, record: MarcRecord) -> int:
+        """
+        Add a record, replacing any record with the same control number.
+
+        Returns
+        -------
+        int
+            The identifier of the record within the index.
+
+        Raises
+        ------
+        ValueError
+            If the record has no control number (001).
+        """
+        with self._connection:
+            return self._add(record)
+
+    def add_many(self, records: Iterable[MarcRecord]) -> int:
+        """
+        Add records in a single transaction.
+
+        Returns
+        -------
+        int
+            The number of added or replaced records.
+        """
+        count = 0
+        with self._connection:
+            for record in records:
+                self._add(record)
+                count += 1
+        return count
+
+    def remove(self, control_number: str) -> bool:
+        """
+        Remove the record with the given control number.
+
+        Returns
+        -------
+        bool
+            True if a record was removed.
+        """
+        with self._connection:
+            row = self._connection.execute(
+                "SELECT id FROM records WHERE control_number = ?",
+                (control_number,),
+            ).fetchone()
+            if row is None:
+                return False
+
+            self._connection.execute(
+                "DELETE FROM fields WHERE record_id = ?", row
+            )
+            self._connection.execute("DELETE FROM records WHERE id = ?", row)
+            return True
+
+    def _add(self, record: MarcRecord) -> int:
+        control_number = record.fixed_fields.root.get("001")
+        if not control_number:
+            raise ValueError("Cannot index a record without field 001.")
+
+        (record_id,) = self._connection.execute(
+            "INSERT INTO records (control_number, data, marc, encoding) "
+            "VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (control_number) DO UPDATE "
+            "SET data = excluded.data, marc = excluded.marc, "
+            "encoding = excluded.encoding "
+            "RETURNING id",
+            (
+                control_number,
+                record.model_dump_json(),
+                record._marc,
+                record.encoding,
+            ),
+        ).fetchone()
+
+        self._connection.execute(
+            "DELETE FROM fields WHERE record_id = ?", (record_id,)
+        )
+        self._connection.executemany(
+            "INSERT INTO fields (record_id, tag, ind1, ind2, code, value) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            self._field_rows(record_id, record),
+        )
+        return record_id
+
+    @staticmethod
+    def _field_rows(record_id: int, record: MarcRecord) -> Iterable[tuple]:
+        for tag, value in record.fixed_fields.root.items():
+            yield (record_id, tag, None, None, None, value)
+
+        for tag, fields in record.variable_fields.root.items():
+            for field in fields:
+                for code, values in field.subfields.items():
+                    for value in values:
+                        yield (
+                            record_id,
+                            tag,
+                            normalize_indicator(field.ind1),
+                            normalize_indicator(field.ind2),
+                            code,
+                            value,
+                        )
+
+    # --- Search ---
+    def get(self, control_number: str) -> MarcRecord | None:
+        """Return the record with the given control number, if any."""
+        row = self._connection.execute(
+            "SELECT data, marc, encoding FROM records "
+            "WHERE control_number = ?",
+            (control_number,),
+        ).fetchone()
+        return None if row is None else self._load_record(*row)
+
+    def search(self, request: MarcSearchRequest) -> MarcSearchResult:
+        """
+        Return the requested page of records matching the query.
+
+        Records are ordered by their identifier, i.e. by the order in
+        which they were first added.
+        """
+        sql, parameters = self.compile(request.query)
+
+        (total,) = self._connection.execute(
+            f"SELECT count(*) FROM ({sql})", parameters
+        ).fetchone()
+
+        rows = self._connection.execute(
+            f"SELECT data, marc, encoding FROM records WHERE id IN ({sql}) "
+            "ORDER BY id LIMIT ? OFFSET ?",
+            parameters
+            + [request.page_size, (request.page - 1) * request.page_size],
+        ).fetchall()
+
+        return MarcSearchResult(
+            total=total,
+            page=request.page,
+            page_size=request.page_size,
+            records=[self._load_record(*row) for row in rows],
+        )
+
+    def evaluate(self, query: MarcBoolQuery) -> Set[int]:
+        """
+        Return the identifiers of all records matching the query.
+        """
+        sql, parameters = self.compile(query)
+        return {
+            record_id
+            for (record_id,) in self._connection.execute(sql, parameters)
+        }
+
+    def _load_record(
+        self, data: str, marc: bytes | None, encoding: str | None
+    ) -> MarcRecord:
+        record = MarcRecord.from_json(json.loads(data), self._context)
+        record._marc = marc
+        record._encoding = encoding
+        return record
+
+    # --- Query translation ---
+    def compile(self, query: MarcBoolQuery) -> SqlQuery:
+        """
+        Translate a `MarcBoolQuery` into a SQL query selecting
+        the identifiers of the matching records (`record_id` column).
+        """
+        must = [self._compile_term(term) for term in query.must or []]
+        should = [self._compile_term(term) for term in query.should or []]
+        must_not = [self._compile_term(term) for term in query.must_not or []]
+
+        parts: List[SqlQuery] = []
+        if must:
+            parts.append(self._compound("INTERSECT", must))
+        if should:
+            parts.append(self._compound("UNION", should))
+        if not parts:
+            parts.append(("SELECT id AS record_id FROM records", []))
+
+        sql, parameters = self._compound("INTERSECT", parts)
+        if must_not:
+            excluded, excluded_parameters = self._compound("UNION", must_not)
+            sql = f"SELECT * FROM ({sql}) EXCEPT SELECT * FROM ({excluded})"
+            parameters = parameters + excluded_parameters
+
+        return sql, parameters
+
+    @staticmethod
+    def _compound(operator: str, queries: List[SqlQuery]) -> SqlQuery:
+        if len(queries) == 1:
+            return queries[0]
+
+        sql = f" {operator} ".join(
+            f"SELECT * FROM ({query})" for query, _ in queries
+        )
+        parameters = [
+            parameter for _, query_parameters in queries
+            for parameter in query_parameters
+        ]
+        return sql, parameters
+
+    def _compile_term(self, term: MarcTerm) -> SqlQuery:
+        if isinstance(term, MarcCondition):
+            return self._compile_condition(term)
+        return self.compile(term)
+
+    def _compile_condition(self, condition: MarcCondition) -> SqlQuery:
+        clauses = ["tag = ?"]
+        parameters: List[Any] = [condition.field]
+
+        # Control fields have no subfields nor indicators, their whole
+        # value is matched
+        if condition.field not in CONTROL_FIELDS:
+            if condition.subfield:
+                clauses.append("code = ?")
+                parameters.append(condition.subfield)
+
+            for column, indicator in (
+                ("ind1", condition.ind1),
+                ("ind2", condition.ind2),
+            ):
+                if indicator:
+                    clauses.append(f"{column} IS ?")
+                    parameters.append(normalize_indicator(indicator))
+
+        value = condition.value
+        operator = condition.operator
+
+        if operator == SearchOperator.Exact:
+            clauses.append("value = ?")
+            parameters.append(value)
+        elif operator == SearchOperator.StartsWith:
+            # Range on the (tag, value) index, UTF-8 preserves code points
+            clauses.append("value >= ?")
+            parameters.append(value)
+            if value and ord(value[-1]) < 0x10FFFF:
+                clauses.append("value < ?")
+                parameters.append(value[:-1] + chr(ord(value[-1]) + 1))
+        elif operator == SearchOperator.Regex:
+            clauses.append("value REGEXP ?")
+            parameters.append(value)
+        else:
+            if self._fts and len(value) >= _TRIGRAM_LENGTH:
+                clauses.append(
+                    "id IN (SELECT rowid FROM fields_fts "
+                    "WHERE fields_fts MATCH ?)"
+                )
+                parameters.append('"' + value.replace('"', '""') + '"')
+
+            if operator == SearchOperator.Contains:
+                clauses.append("instr(value, ?) > 0")
+                parameters.append(value)
+            elif value:
+                clauses.append("substr(value, -?) = ?")
+                parameters.extend([len(value), value])
+            # Every value ends with '', as in `str.endswith`; substr with
+            # a zero start would select nothing
+
+        return (
+            "SELECT record_id FROM fields WHERE " + " AND ".join(clauses),
+            parameters,
+        )
@@ -0,0 +1,156 @@
+import codecs
+from typing import Iterable, List, Mapping, Tuple
+
+from .constants import (
+    DIRECTORY_ENTRY_LENGTH,
+    FIELD_TERMINATOR,
+    LEADER_LENGTH,
+    MAX_RECORD_LENGTH,
+    RECORD_TERMINATOR,
+)
+from .fields import VariableField
+from .marc8 import MARC8_CODEC_NAME
+
+#: Position of the character coding scheme in the leader
+CODING_SCHEME_POSITION = 9
+
+#: Character coding scheme of the leader per codec name
+_CODING_SCHEMES = {"utf-8": "a", MARC8_CODEC_NAME: " "}
+
+
+def to_mrc(
+    leader: str,
+    fixed_fields: Mapping[str, str],
+    variable_fields: Mapping[str, Iterable[VariableField]],
+    encoding: str = "utf-8",
+) -> bytes:
+    """
+    Serializes the fields of a record to ISO 2709 bytes.
+
+    Parameters
+    ----------
+    leader : str
+        The record leader. The record length and the base address of
+        data are recomputed; for UTF-8 and MARC-8 the character coding
+        scheme (position 9) is set to match `encoding`.
+    fixed_fields : mapping of str to str
+        Control fields keyed by tag.
+    variable_fields : mapping of str to iterable of VariableField
+        Data fields keyed by tag.
+    encoding : str
+        Codec of the field data, e.g. 'utf-8' or 'marc8'.
+
+    Returns
+    -------
+    bytes
+        The raw record, with its directory and terminators.
+
+    Raises
+    ------
+    ValueError
+        If the leader is not LEADER_LENGTH characters long, an indicator
+        is not a single ASCII character or the record exceeds
+        MAX_RECORD_LENGTH.
+    UnicodeEncodeError
+        If the data cannot be encoded with `encoding`.
+
+    Notes
+    -----
+    - Control fields precede data fields; both keep the order of their
+      mappings, i.e. the order of the parsed record.
+    - Subfields are written grouped by code, in the order of the codes
+      in `VariableField.subfields`, so the relative order of repeated
+      codes (e.g. $a $b $a) is not preserved.
+    - Blank (None) indicators are written as spaces.
+    """
+    if len(leader) != LEADER_LENGTH:
+        raise ValueError(
+            f"Invalid leader length: {len(leader)} "
+            f"(expected {LEADER_LENGTH})"
+        )
+
+    coding_scheme = _CODING_SCHEMES.get(codecs.lookup(encoding).name)
+    if coding_scheme is not None:
+        leader = (
+            leader[:CODING_SCHEME_POSITION]
+            + coding_scheme
+            + leader[CODING_SCHEME_POSITION + 1 :]
+        )
+
+    fields: List[Tuple[str, bytes]] = [
+        (tag, value.encode(encoding)) for tag, value in fixed_fields.items()
+    ]
+
+    for tag, tag_fields in variable_fields.items():
+        for field in tag_fields:
+            indicators = (field.ind1 or " ") + (field.ind2 or " ")
+            if len(indicators) != 2 or not indicators.isascii():
+                raise ValueError(
+                    f"Invalid MARC indicators '{indicators}' in field {tag}."
+                )
+
+            parts = [indicators]
+            for code, values in field.subfields.items():
+                for value in values:
+                    parts.append("\x1f")
+                    parts.append(code)
+                    parts.append(value or "")
+            fields.append((tag, "".join(parts).encode(encoding)))
+
+    return build_marc(leader, fields)
+
+
+def build_marc(leader: str, fields: List[Tuple[str, bytes]]) -> bytes:
+    """
+    Builds the raw ISO 2709 bytes of a record.
+
+    Parameters
+    ----------
+    leader : str
+        The record leader; the record length (positions 0-4) and
+        the base address of data (positions 12-16) are recomputed.
+    fields : list of (str, bytes)
+        Tags and encoded data of the fields, without field terminators.
+
+    Returns
+    -------
+    bytes
+        The record with its directory and terminators.
+
+    Raises
+    ------
+    ValueError
+        If the record exceeds MAX_RECORD_LENGTH.
+
+    Notes
+    -----
+    The directory is formatted as a single string and the record is
+    assembled with one `bytes.join`, which allocates the result once.
+    """
+    directory: List[str] = []
+    parts: List[bytes] = [b"", b""]
+    offset = 0
+
+    for tag, data in fields:
+        length = len(data) + 1
+        directory.append(f"{tag}{length:04d}{offset:05d}")
+        parts.append(data)
+        parts.append(FIELD_TERMINATOR)
+        offset += length
+
+    base_address = (
+        LEADER_LENGTH + len(directory) * DIRECTORY_ENTRY_LENGTH + 1
+    )
+    record_length = base_address + offset + 1
+
+    if record_length > MAX_RECORD_LENGTH:
+        raise ValueError(
+            "MARC record exceeds maximum allowed length of 99,999 bytes."
+        )
+
+    parts[0] = (
+        f"{record_length:05d}{leader[5:12]}{base_address:05d}{leader[17:]}"
+    ).encode("ascii")
+    parts[1] = "".join(directory).encode("ascii") + FIELD_TERMINATOR
+    parts.append(RECORD_TERMINATOR)
+    return b"".join(parts)
@@ -0,0 +1,98 @@
+import io
+from typing import Any, Iterable, Mapping
+
+from lxml import etree
+
+from .constants import LEADER_LENGTH, MARC_NS
+from .fields import VariableField
+
+_RECORD = f"{{{MARC_NS['marc']}}}record"
+_LEADER = f"{{{MARC_NS['marc']}}}leader"
+_CONTROLFIELD = f"{{{MARC_NS['marc']}}}controlfield"
+_DATAFIELD = f"{{{MARC_NS['marc']}}}datafield"
+_SUBFIELD = f"{{{MARC_NS['marc']}}}subfield"
+
+#: Namespace map of the written documents, MARCXML as default namespace
+XML_NSMAP = {None: MARC_NS["marc"]}
+
+
+def write_xml_record(
+    xf: Any,
+    leader: str,
+    fixed_fields: Mapping[str, str],
+    variable_fields: Mapping[str, Iterable[VariableField]],
+    nsmap: Mapping[str | None, str] | None = XML_NSMAP,
+) -> None:
+    """
+    Writes a `record` element to an incremental `lxml.etree.xmlfile`
+    writer.
+
+    Parameters
+    ----------
+    xf : lxml.etree.xmlfile
+        The writer, entered as a context manager.
+    leader : str
+        The record leader.
+    fixed_fields : mapping of str to str
+        Control fields keyed by tag.
+    variable_fields : mapping of str to iterable of VariableField
+        Data fields keyed by tag.
+    nsmap : mapping of str or None to str, or None
+        Namespaces declared on the record element. None inside an
+        element already declaring the MARCXML namespace, such as
+        a `collection`.
+
+    Raises
+    ------
+    ValueError
+        If the leader is not LEADER_LENGTH characters long.
+
+    Notes
+    -----
+    Elements are streamed to the writer as they are created, no tree of
+    the record is built. Control fields precede data fields and
+    subfields are grouped by code, as in `to_mrc.to_mrc`.
+    """
+    if len(leader) != LEADER_LENGTH:
+        raise ValueError(
+            f"Invalid leader length: {len(leader)} "
+            f"(expected {LEADER_LENGTH})"
+        )
+
+    with xf.element(_RECORD, nsmap=nsmap):
+        with xf.element(_LEADER):
+            xf.write(leader)
+
+        for tag, value in fixed_fields.items():
+            with xf.element(_CONTROLFIELD, {"tag": tag}):
+                xf.write(value)
+
+        for tag, fields in variable_fields.items():
+            for field in fields:
+                with xf.element(
+                    _DATAFIELD,
+                    {
+                        "tag": tag,
+                        "ind1": field.ind1 or " ",
+                        "ind2": field.ind2 or " ",
+                    },
+                ):
+                    for code, values in field.subfields.items():
+                        for value in values:
+                            with xf.element(_SUBFIELD, {"code": code}):
+                                xf.write(value or "")
+
+
+def to_xml(
+    leader: str,
+    fixed_fields: Mapping[str, str],
+    variable_fields: Mapping[str, Iterable[VariableField]],
+) -> bytes:
+    """
+    Serializes the fields of a record to a UTF-8 encoded MARCXML
+    `record` element (see `write_xml_record`).
+    """
+    output = io.BytesIO()
+    with etree.xmlfile(output, encoding="utf-8") as xf:
+        write_xml_record(xf, leader, fixed_fields, variable_fields)
+    return output.getvalue()
@@ -0,0 +1,132 @@
+import os
+from abc import ABC, abstractmethod
+from contextlib import ExitStack
+from typing import BinaryIO, Iterable, Self
+
+from lxml import etree
+
+from .constants import MARC_NS
+from .readers import DEFAULT_BUFFER_SIZE
+from .record import MarcRecord
+from .to_xml import XML_NSMAP, write_xml_record
+
+_COLLECTION = f"{{{MARC_NS['marc']}}}collection"
+
+
+class _RecordWriter(ABC):
+    """
+    Base of the streaming writers: owns the output file opened for
+    a file name and counts the written records.
+    """
+
+    def __init__(self, target: str | os.PathLike | BinaryIO):
+        self._stack = ExitStack()
+        if isinstance(target, (str, os.PathLike)):
+            self._file: BinaryIO = self._stack.enter_context(
+                open(target, "wb", buffering=DEFAULT_BUFFER_SIZE)
+            )
+        else:
+            self._file = target
+        self.record_count = 0
+
+    @abstractmethod
+    def write(self, record: MarcRecord) -> None:
+        """Serialize a record and write it to the output."""
+
+    def write_all(self, records: Iterable[MarcRecord]) -> None:
+        """Write the records one by one, e.g. from `iter_mrc`."""
+        for record in records:
+            self.write(record)
+
+    def close(self) -> None:
+        """
+        Finish the output; a file opened for a file name is closed,
+        a file object is only flushed.
+        """
+        self._stack.close()
+        if not self._file.closed:
+            self._file.flush()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+class MrcWriter(_RecordWriter):
+    """
+    Streaming writer of multi-record ISO 2709 files.
+
+    Every record is serialized with `MarcRecord.to_mrc` and written
+    right away, so the memory used does not depend on the number of
+    records.
+
+    Parameters
+    ----------
+    target : str, os.PathLike or BinaryIO
+        A file name or a binary file object, e.g. `gzip.open(path, "wb")`
+        for compressed output.
+    encoding : str or None
+        Codec of the field data, by default the encoding each record
+        was parsed with (see `MarcRecord.to_mrc`).
+
+    Examples
+    --------
+    >>> with open("dump.mrc", "rb") as stream, MrcWriter("out.mrc") as out:
+    ...     out.write_all(iter_mrc(stream))
+    """
+
+    def __init__(
+        self,
+        target: str | os.PathLike | BinaryIO,
+        encoding: str | None = None,
+    ):
+        super().__init__(target)
+        self._encoding = encoding
+
+    def write(self, record: MarcRecord) -> None:
+        self._file.write(record.to_mrc(self._encoding))
+        self.record_count += 1
+
+
+class XmlWriter(_RecordWriter):
+    """
+    Streaming writer of MARCXML collections.
+
+    The document is written incrementally with `lxml.etree.xmlfile`:
+    the `collection` element is opened on creation, every record is
+    streamed into it by `to_xml.write_xml_record` without building
+    a tree, and the element is closed by `close`.
+
+    Parameters
+    ----------
+    target : str, os.PathLike or BinaryIO
+        A file name or a binary file object.
+
+    Examples
+    --------
+    >>> with XmlWriter("out.xml") as out:
+    ...     for record in iter_xml("dump.xml"):
+    ...         out.write(record)
+    """
+
+    def __init__(self, target: str | os.PathLike | BinaryIO):
+        super().__init__(target)
+        self._xf = self._stack.enter_context(
+            etree.xmlfile(self._file, encoding="utf-8")
+        )
+        self._xf.write_declaration()
+        self._stack.enter_context(
+            self._xf.element(_COLLECTION, nsmap=XML_NSMAP)
+        )
+
+    def write(self, record: MarcRecord) -> None:
+        write_xml_record(
+            self._xf,
+            record.leader,
+            record.fixed_fields.root,
+            record.variable_fields.root,
+            nsmap=None,
+        )
+        self.record_count += 1
@@ -0,0 +1,70 @@
+from typing import Tuple
+from xml.sax.saxutils import escape
+
+from lxml import etree
+
+from marcdantic.context import MarcContext
+from marcdantic.from_xml import from_xml
+from marcdantic.record import MarcRecord
+
+FIXED_LENGTH_DATA = "240101s2024    xr            000 0 cze d"
+
+TOPICS = ["history", "chemistry", "poetry", "music"]
+
+#: Context of the test records, which are not required to have 005/008
+CONTEXT = MarcContext(mandatory_fields=[])
+
+
+def datafield(tag: str, indicators: str, *subfields: Tuple[str, str]) -> str:
+    """Return a MARCXML `datafield` element with (code, value) subfields."""
+    return (
+        f'<datafield tag="{tag}" ind1="{indicators[0]}" '
+        f'ind2="{indicators[1]}">'
+        + "".join(
+            f'<subfield code="{code}">{escape(value)}</subfield>'
+            for code, value in subfields
+        )
+        + "</datafield>"
+    )
+
+
+def build_xml(
+    control_number: str,
+    title: str,
+    *datafields: str,
+    title_indicators: str = "10",
+) -> str:
+    """
+    Return a MARCXML record with the 001, 005 and 008 control fields,
+    a 245 $a title and the given data fields.
+    """
+    return f"""
+    <record xmlns="http://www.loc.gov/MARC21/slim">
+      <leader>00000nam a2200000   4500</leader>
+      <controlfield tag="001">{control_number}</controlfield>
+      <controlfield tag="005">20240101120000.0</controlfield>
+      <controlfield tag="008">{FIXED_LENGTH_DATA}</controlfield>
+      {datafield("245", title_indicators, ("a", title))}
+      {"".join(datafields)}
+    </record>
+    """
+
+
+def build_mrc(control_number: str, title: str, *datafields: str) -> bytes:
+    """Return the ISO 2709 bytes of a `build_xml` record."""
+    xml = build_xml(control_number, title, *datafields)
+    return from_xml(etree.fromstring(xml), CONTEXT)["marc"]
+
+
+def build_topic_record(number: int, *datafields: str) -> MarcRecord:
+    """
+    Return a record numbered `number` titled after one of the `TOPICS`,
+    with the given data fields.
+    """
+    xml = build_xml(
+        f"{number:06d}",
+        f"Volume {number} of {TOPICS[number % 4]}",
+        *datafields,
+        title_indicators=f"{number % 2}0",
+    )
+    return MarcRecord.from_xml(etree.fromstring(xml), CONTEXT)
@@ -0,0 +1,50 @@
+import io
+import unittest
+
+from benchmarks.corpus import CorpusConfig, CorpusGenerator
+from benchmarks.run import compare, run
+from marcdantic.context import MarcContext
+from marcdantic.readers import iter_mrc, iter_xml
+
+
+class TestBenchmarks(unittest.TestCase):
+    def test_corpus_is_deterministic(self):
+        config = CorpusConfig(records=5, seed=7, holdings=4)
+        first = CorpusGenerator(config)
+        second = CorpusGenerator(config)
+
+        self.assertEqual(first.mrc(), second.mrc())
+        self.assertEqual(first.xml(), second.xml())
+        self.assertNotEqual(
+            first.mrc(),
+            CorpusGenerator(CorpusConfig(records=5, seed=8)).mrc(),
+        )
+
+    def test_corpus_parses(self):
+        generator = CorpusGenerator(
+            CorpusConfig(records=10, tag_mix={"245": 1, "650": 2})
+        )
+        context = MarcContext()
+        mrc_records = list(iter_mrc(io.BytesIO(generator.mrc()), context))
+        xml_records = list(iter_xml(io.BytesIO(generator.xml()), context))
+
+        self.assertEqual(len(mrc_records), 10)
+        self.assertEqual(
+            [record.model_dump() for record in mrc_records],
+            [record.model_dump() for record in xml_records],
+        )
+        self.assertEqual(
+            set(mrc_records[0].variable_fields.root) - {"996"},
+            {"245", "650"},
+        )
+
+    def test_run(self):
+        results = run(
+            CorpusConfig(records=5), repeat=1, only=["from_mrc", "query_jq"]
+        )
+        self.assertEqual(set(results["results"]), {"from_mrc", "query_jq"})
+        self.assertEqual(results["results"]["from_mrc"]["records"], 5)
+        self.assertGreater(
+            results["results"]["from_mrc"]["peak_memory_bytes"], 0
+        )
+        self.assertEqual(len(compare(results, results)), 2)
@@ -0,0 +1,123 @@
+import gzip
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+
+from helpers import build_mrc, build_xml
+
+from marcdantic.__main__ import main, process
+
+
+class TestCli(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        root = self.directory.name
+
+        mrc = b"".join(
+            build_mrc(f"{number:06d}", f"Title {number}")
+            for number in range(3)
+        )
+        with open(os.path.join(root, "dump.mrc"), "wb") as file:
+            file.write(mrc + b"00010broken")
+
+        os.mkdir(os.path.join(root, "nested"))
+        with open(os.path.join(root, "nested", "dump.xml"), "w") as file:
+            file.write(
+                '<collection xmlns="http://www.loc.gov/MARC21/slim">'
+                + build_xml("000003", "Title 3")
+                + build_xml("000004", "Title 4")
+                + "</collection>"
+            )
+
+        compressed = os.path.join(root, "nested", "more.mrc.gz")
+        with gzip.open(compressed, "wb") as file:
+            file.write(build_mrc("000005", "Title 5"))
+
+        with open(os.path.join(root, "notes.txt"), "w") as file:
+            file.write("ignored")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def run_main(self, *argv: str):
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            status = main(list(argv))
+        return status, stdout.getvalue(), stderr.getvalue()
+
+    def test_ndjson_directory(self):
+        status, stdout, stderr = self.run_main(
+            "-d", self.directory.name, "--output", "ndjson"
+        )
+        lines = stdout.splitlines()
+
+        self.assertEqual(status, 1)
+        self.assertEqual(
+            [json.loads(line)["fixed_fields"]["001"] for line in lines],
+            [f"{number:06d}" for number in range(6)],
+        )
+        self.assertIn("Error processing file", stderr)
+        self.assertIn("Processed 6 records, 1 errors", stderr)
+        self.assertNotIn("notes.txt", stderr)
+
+    def test_output_file_with_jobs(self):
+        output_path = os.path.join(self.directory.name, "out.ndjson")
+        status, stdout, _ = self.run_main(
+            "-f",
+            os.path.join(self.directory.name, "nested", "dump.xml"),
+            "--output",
+            "ndjson",
+            "-o",
+            output_path,
+            "--jobs",
+            "2",
+            "--chunk-size",
+            "1",
+        )
+        self.assertEqual(status, 0)
+        self.assertEqual(stdout, "")
+        with open(output_path, encoding="utf-8") as file:
+            records = [json.loads(line) for line in file]
+        self.assertEqual(len(records), 2)
+
+    def test_malformed_xml_file(self):
+        truncated = os.path.join(self.directory.name, "truncated.xml")
+        with open(truncated, "w") as file:
+            file.write(
+                '<collection xmlns="http://www.loc.gov/MARC21/slim">'
+                "<record><leader>"
+            )
+
+        status, stdout, stderr = self.run_main(
+            "-f",
+            truncated,
+            os.path.join(self.directory.name, "nested", "dump.xml"),
+            "--output",
+            "ndjson",
+        )
+        lines = stdout.splitlines()
+
+        self.assertEqual(status, 1)
+        self.assertEqual(
+            [json.loads(line)["fixed_fields"]["001"] for line in lines],
+            ["000003", "000004"],
+        )
+        self.assertIn(f"Error processing file {truncated}", stderr)
+        self.assertIn("Processed 2 records, 1 errors", stderr)
+
+    def test_record_errors(self):
+        path = os.path.join(self.directory.name, "record.json")
+        with open(path, "w") as file:
+            file.write('{"leader": "x"}')
+
+        output = io.StringIO()
+        log = io.StringIO()
+        errors = process([path], output, log)
+
+        self.assertEqual(errors, 1)
+        self.assertEqual(output.getvalue(), "")
+        self.assertIn(f"Error processing record 0 of {path}", log.getvalue())
@@ -0,0 +1,92 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from helpers import build_mrc
+
+from marcdantic.collection import MrcCollection
+
+
+class TestMrcCollection(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "records.mrc")
+        self.records = [
+            build_mrc(f"cn{number:04d}", f"Title {number}")
+            for number in range(50)
+        ]
+        with open(self.path, "wb") as file:
+            file.write(b"\n".join(self.records))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_positional_access(self):
+        with MrcCollection(self.path) as collection:
+            self.assertEqual(len(collection), 50)
+            self.assertEqual(collection.get_data(7), self.records[7])
+            self.assertEqual(collection.get_data(-1), self.records[-1])
+            record = collection[42]
+            self.assertEqual(
+                record.control_fields_selector.control_number, "cn0042"
+            )
+            with self.assertRaises(IndexError):
+                collection.get_data(50)
+
+    def test_control_number_access(self):
+        with MrcCollection(self.path) as collection:
+            self.assertIn("cn0013", collection)
+            self.assertEqual(collection.position_of("cn0013"), 13)
+            record = collection.get("cn0013")
+            self.assertEqual(
+                record.variable_fields.query_subfield_value(
+                    '.["245"][0].subfields.a[0]'
+                ),
+                "Title 13",
+            )
+            self.assertIsNone(collection.get("missing"))
+
+    def test_saved_index(self):
+        with MrcCollection(self.path) as collection:
+            index_path = collection.save_index()
+
+        self.assertEqual(index_path, self.path + ".idx")
+
+        with MrcCollection(self.path) as collection:
+            # Offsets come from the stored index, not from a new scan
+            self.assertTrue(collection._load_index())
+            self.assertEqual(len(collection), 50)
+            self.assertEqual(collection.position_of("cn0049"), 49)
+            self.assertEqual(collection.get_data(20), self.records[20])
+
+    def test_stale_index_is_rebuilt(self):
+        with MrcCollection(self.path) as collection:
+            collection.save_index()
+
+        with open(self.path, "ab") as file:
+            file.write(build_mrc("cn9999", "Appended"))
+
+        with MrcCollection(self.path) as collection:
+            self.assertEqual(len(collection), 51)
+            self.assertEqual(collection.position_of("cn9999"), 50)
+
+    def test_truncated_file_is_closed(self):
+        with open(self.path, "wb") as file:
+            file.write(self.records[0] + self.records[1][:-10])
+
+        opened = []
+
+        def tracking_open(*args, **kwargs):
+            file = open(*args, **kwargs)
+            opened.append(file)
+            return file
+
+        with mock.patch(
+            "marcdantic.collection.open", tracking_open, create=True
+        ):
+            with self.assertRaises(ValueError):
+                MrcCollection(self.path)
+
+        self.assertTrue(opened)
+        self.assertTrue(all(file.closed for file in opened))
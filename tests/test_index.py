@@ -0,0 +1,130 @@
+import unittest
+
+from helpers import TOPICS, build_topic_record, datafield
+
+from marcdantic.index import MarcIndex
+from marcdantic.matcher import compile_query
+from marcdantic.query import (
+    MarcBoolQuery,
+    MarcCondition,
+    MarcSearchRequest,
+    SearchOperator,
+)
+from marcdantic.record import MarcRecord
+
+
+def build_record(number: int) -> MarcRecord:
+    return build_topic_record(
+        number,
+        datafield("650", f" {number % 3}", ("a", TOPICS[number % 4])),
+        datafield("650", " 7", ("a", TOPICS[(number + 1) % 4])),
+    )
+
+
+class TestMarcIndex(unittest.TestCase):
+    def setUp(self):
+        self.records = [build_record(number) for number in range(60)]
+        self.index = MarcIndex(self.records)
+
+    def assertSameAsScan(self, query: MarcBoolQuery):
+        predicate = compile_query(query)
+        expected = {
+            number
+            for number, record in enumerate(self.records)
+            if predicate(record)
+        }
+        self.assertEqual(self.index.evaluate(query), expected)
+
+    def test_conditions(self):
+        conditions = [
+            MarcCondition(field="001", value="000007"),
+            MarcCondition(field="001", subfield="a", value="000007"),
+            MarcCondition(field="001", value="000007", ind1="1", ind2="_"),
+            MarcCondition(field="650", subfield="a", value="poetry"),
+            MarcCondition(field="650", value="poetry", ind2="7"),
+            MarcCondition(field="650", value="poetry", ind2="0"),
+            MarcCondition(field="650", value="music", ind1="_", ind2="1"),
+            MarcCondition(field="245", value="Volume 1", ind1="1"),
+            MarcCondition(
+                field="245",
+                subfield="a",
+                value="Volume 1",
+                operator=SearchOperator.StartsWith,
+            ),
+            MarcCondition(
+                field="245",
+                value="of music",
+                operator=SearchOperator.EndsWith,
+            ),
+            MarcCondition(
+                field="245",
+                value="5 of",
+                operator=SearchOperator.Contains,
+            ),
+            MarcCondition(
+                field="245",
+                subfield="a",
+                value=r"^Volume \d{2} of (poetry|music)$",
+                operator=SearchOperator.Regex,
+            ),
+            MarcCondition(field="100", value="missing"),
+            MarcCondition(
+                field="650", value="", operator=SearchOperator.EndsWith
+            ),
+            MarcCondition(
+                field="650", value="", operator=SearchOperator.Contains
+            ),
+        ]
+        for condition in conditions:
+            self.assertSameAsScan(MarcBoolQuery(must=[condition]))
+
+    def test_bool_queries(self):
+        poetry = MarcCondition(field="650", subfield="a", value="poetry")
+        music = MarcCondition(field="650", subfield="a", value="music")
+        odd = MarcCondition(
+            field="245", value="Volume", operator="startswith", ind1="1"
+        )
+
+        for query in [
+            MarcBoolQuery(),
+            MarcBoolQuery(must=[poetry, music]),
+            MarcBoolQuery(should=[poetry, music]),
+            MarcBoolQuery(must=[odd], must_not=[poetry]),
+            MarcBoolQuery(must_not=[poetry, music]),
+            MarcBoolQuery(
+                must=[MarcBoolQuery(should=[poetry, odd])],
+                must_not=[MarcBoolQuery(must=[music, odd])],
+            ),
+        ]:
+            self.assertSameAsScan(query)
+
+    def test_search_pagination(self):
+        query = MarcBoolQuery(
+            must=[MarcCondition(field="650", subfield="a", value="poetry")]
+        )
+        expected = sorted(self.index.evaluate(query))
+
+        result = self.index.search(
+            MarcSearchRequest(query=query, page=2, page_size=10)
+        )
+        self.assertEqual(result.total, len(expected))
+        self.assertEqual(result.page, 2)
+        self.assertEqual(
+            result.records,
+            [self.records[number] for number in expected[10:20]],
+        )
+
+        result = self.index.search(
+            MarcSearchRequest(query=query, page=100, page_size=10)
+        )
+        self.assertEqual(result.records, [])
+
+    def test_incremental_add(self):
+        condition = MarcCondition(
+            field="245", value="Volume 6", operator="startswith"
+        )
+        query = MarcBoolQuery(must=[condition])
+        before = self.index.evaluate(query)
+
+        record_id = self.index.add(build_record(600))
+        self.assertEqual(self.index.evaluate(query), before | {record_id})
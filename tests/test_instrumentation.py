@@ -0,0 +1,112 @@
+import unittest
+
+from lxml import etree
+
+from marcdantic.context import MarcContext
+from marcdantic.from_xml import from_xml
+from marcdantic.instrumentation import Instrumentation, get_instrumentation
+from marcdantic.jq_cache import jq_cache
+from marcdantic.record import MarcRecord
+
+XML = """
+<record xmlns="http://www.loc.gov/MARC21/slim">
+  <leader>00000nam a2200000   4500</leader>
+  <controlfield tag="001">000001</controlfield>
+  <controlfield tag="LDR">ignored</controlfield>
+  <datafield tag="245" ind1="1" ind2="0">
+    <subfield code="a">Title</subfield>
+  </datafield>
+  <datafield tag="650" ind1=" " ind2="7">
+    <subfield code="a">Subject</subfield>
+  </datafield>
+  <datafield tag="FMT" ind1=" " ind2=" ">BK</datafield>
+  <datafield tag="ABC" ind1=" " ind2=" ">
+    <subfield code="a">Unknown</subfield>
+  </datafield>
+</record>
+"""
+
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        self.context = MarcContext(mandatory_fields=[], exclude_tags=["650"])
+        self.element = etree.fromstring(XML)
+        self.data = from_xml(self.element, MarcContext(mandatory_fields=[]))[
+            "marc"
+        ]
+
+    def test_context_hook(self):
+        instrumentation = Instrumentation()
+        context = self.context.model_copy(
+            update={"instrumentation": instrumentation}
+        )
+
+        MarcRecord.from_mrc(self.data, context)
+        MarcRecord.from_xml(self.element, context)
+        snapshot = instrumentation.snapshot()
+
+        self.assertEqual(
+            snapshot["counters"],
+            {
+                "records": 2,
+                "fields": 6,
+                "skipped_tags": 1,
+                # The raw record already stores FMT as 990
+                "aliased_tags": 1,
+                "unknown_tags": 1,
+                "excluded_tags": 2,
+                "bytes_decoded": len(self.data),
+            },
+        )
+        for stage in (
+            "mrc.directory",
+            "mrc.decode",
+            "xml.fields",
+            "xml.marc",
+        ):
+            self.assertEqual(snapshot["calls"][stage], 1)
+            self.assertGreaterEqual(snapshot["timings"][stage], 0)
+        self.assertEqual(snapshot["calls"]["validation"], 2)
+        self.assertNotIn("instrumentation", context.model_dump())
+
+    def test_lazy_loads(self):
+        instrumentation = Instrumentation()
+        context = MarcContext(
+            mandatory_fields=[],
+            lazy_fields=True,
+            instrumentation=instrumentation,
+        )
+
+        record = MarcRecord.from_mrc(self.data, context)
+        record.variable_fields.root.get("245")
+        counters = instrumentation.snapshot()["counters"]
+
+        self.assertEqual(counters["lazy_loads"], 1)
+        self.assertLess(counters["bytes_decoded"], len(self.data))
+        self.assertEqual(instrumentation.calls["mrc.decode"], 2)
+
+    def test_with_statement(self):
+        record = MarcRecord.from_mrc(self.data, self.context)
+        jq_cache.clear()
+
+        with Instrumentation() as instrumentation:
+            self.assertIs(get_instrumentation(), instrumentation)
+            MarcRecord.from_mrc(self.data, self.context)
+            record.variable_fields.query('.["245"] | length')
+            record.variable_fields.query('.["245"] | length')
+
+        self.assertIsNone(get_instrumentation())
+        self.assertEqual(instrumentation.counters["records"], 1)
+        self.assertEqual(instrumentation.counters["jq_compiles"], 1)
+        self.assertIn("jq.compile", instrumentation.timings)
+
+        instrumentation.reset()
+        self.assertEqual(
+            instrumentation.snapshot(),
+            {"timings": {}, "calls": {}, "counters": {}},
+        )
+
+    def test_disabled(self):
+        instrumentation = Instrumentation()
+        MarcRecord.from_mrc(self.data, self.context)
+        self.assertEqual(instrumentation.snapshot()["counters"], {})
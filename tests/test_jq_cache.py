@@ -0,0 +1,78 @@
+import threading
+import unittest
+
+from marcdantic.jq_cache import JqProgramCache
+
+
+class TestJqProgramCache(unittest.TestCase):
+    def test_hits_and_misses(self):
+        cache = JqProgramCache(maxsize=4)
+        program = cache.compile(".a")
+        self.assertIs(cache.compile(".a"), program)
+        self.assertEqual(program.input({"a": 1}).all(), [1])
+
+        info = cache.cache_info()
+        self.assertEqual(info.hits, 1)
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.size, 1)
+        self.assertEqual(info.maxsize, 4)
+
+    def test_lru_eviction(self):
+        cache = JqProgramCache(maxsize=2)
+        cache.compile(".a")
+        cache.compile(".b")
+        cache.compile(".a")
+        cache.compile(".c")
+
+        info = cache.cache_info()
+        self.assertEqual(info.evictions, 1)
+        self.assertEqual(info.size, 2)
+
+        # '.b' was the least recently used program
+        cache.compile(".a")
+        cache.compile(".b")
+        info = cache.cache_info()
+        self.assertEqual(info.hits, 2)
+        self.assertEqual(info.misses, 4)
+
+    def test_resize_and_clear(self):
+        cache = JqProgramCache(maxsize=8)
+        for key in "abcdef":
+            cache.compile(f".{key}")
+
+        cache.resize(3)
+        info = cache.cache_info()
+        self.assertEqual(info.size, 3)
+        self.assertEqual(info.evictions, 3)
+
+        cache.clear()
+        info = cache.cache_info()
+        self.assertEqual((info.size, info.hits, info.misses), (0, 0, 0))
+
+        with self.assertRaises(ValueError):
+            cache.resize(0)
+
+    def test_invalid_filter(self):
+        cache = JqProgramCache()
+        with self.assertRaises(ValueError):
+            cache.compile(".[")
+        self.assertEqual(cache.cache_info().size, 0)
+
+    def test_threads(self):
+        cache = JqProgramCache(maxsize=16)
+        filters = [f".f{number}" for number in range(8)]
+
+        def worker():
+            for _ in range(50):
+                for jq_filter in filters:
+                    cache.compile(jq_filter)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        info = cache.cache_info()
+        self.assertEqual(info.size, 8)
+        self.assertEqual(info.hits + info.misses, 4 * 50 * 8)
@@ -0,0 +1,65 @@
+import codecs
+import unittest
+
+from marcdantic.context import MarcContext
+from marcdantic.from_mrc import from_mrc
+from marcdantic.marc8 import decode, encode
+from marcdantic.to_mrc import build_marc
+
+
+class TestMarc8(unittest.TestCase):
+    def test_codec_registered(self):
+        self.assertEqual(codecs.lookup("marc8").name, "marc8")
+        self.assertEqual(codecs.lookup("MARC-8").name, "marc8")
+
+    def test_decode_ascii(self):
+        self.assertEqual(b"Plain text".decode("marc8"), "Plain text")
+        self.assertEqual(decode(b""), ("", 0))
+
+    def test_decode_combining_marks(self):
+        # Diacritics precede the base character in MARC-8
+        data = b"Dvo\xe9r\xe2ak, Anton\xe2in \xb1\xe9"
+        self.assertEqual(data.decode("marc8"), "Dvořák, Antonín ł̌")
+        # Ligature halves of a double diacritic
+        self.assertEqual(b"\xebt\xecs".decode("marc8"), "t︠s︡")
+
+    def test_decode_escape_sequences(self):
+        self.assertEqual(
+            b"\x1b(NLEV\x1b(B Tolstoj".decode("marc8"), "леж Tolstoj"
+        )
+        self.assertEqual(b"H\x1bb2\x1bsO".decode("marc8"), "H₂O")
+        self.assertEqual(b"\x1b(S\x61\x1b(B".decode("marc8"), "α")
+        # Extended Latin designated explicitly as G1
+        self.assertEqual(b"\x1b)!E\xe2e".decode("marc8"), "é")
+
+    def test_decode_errors(self):
+        with self.assertRaises(UnicodeDecodeError) as raised:
+            b"ab\xff".decode("marc8")
+        self.assertEqual(raised.exception.start, 2)
+
+        self.assertEqual(b"ab\xff".decode("marc8", "replace"), "ab�")
+        self.assertEqual(b"ab\xff".decode("marc8", "ignore"), "ab")
+        # East Asian sets are not supported
+        self.assertEqual(
+            b"\x1b$1!0!\x1b(Bx".decode("marc8", "ignore"), "x"
+        )
+
+    def test_encode_round_trip(self):
+        text = "Dvořák, Antonín Ćwikła"
+        self.assertEqual(encode(text)[0].decode("marc8"), text)
+        self.assertEqual("Žluť".encode("marc8"), b"\xe9Zlu\xe9t")
+
+        with self.assertRaises(UnicodeEncodeError):
+            "Толстой".encode("marc8")
+        self.assertEqual("aЖb".encode("marc8", "replace"), b"a?b")
+
+    def test_from_mrc(self):
+        data = build_marc(
+            "00000nam  2200000   4500",
+            [("001", b"1"), ("100", b"1 \x1faDvo\xe9r\xe2ak, Anton\xe2in")],
+        )
+        record = from_mrc(data, MarcContext(mrc_encoding="marc8"))
+        self.assertEqual(
+            record["variable_fields"]["100"][0]["subfields"]["a"],
+            ["Dvořák, Antonín"],
+        )
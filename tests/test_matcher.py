@@ -0,0 +1,124 @@
+import unittest
+
+from lxml import etree
+
+from marcdantic.context import MarcContext
+from marcdantic.matcher import compile_condition, compile_query
+from marcdantic.query import MarcBoolQuery, MarcCondition, SearchOperator
+from marcdantic.record import MarcRecord
+
+
+class TestMatcher(unittest.TestCase):
+    def setUp(self):
+        xml = """
+        <record xmlns="http://www.loc.gov/MARC21/slim">
+          <leader>00000nam a2200000   4500</leader>
+          <controlfield tag="001">000123</controlfield>
+          <datafield tag="020" ind1=" " ind2=" ">
+            <subfield code="a">978-80-7051-000-1</subfield>
+          </datafield>
+          <datafield tag="245" ind1="1" ind2="0">
+            <subfield code="a">Python for librarians</subfield>
+            <subfield code="c">John Doe</subfield>
+          </datafield>
+          <datafield tag="650" ind1=" " ind2="7">
+            <subfield code="a">programming</subfield>
+          </datafield>
+        </record>
+        """
+        self.record = MarcRecord.from_xml(
+            etree.fromstring(xml), MarcContext(mandatory_fields=[])
+        )
+
+    def matches(self, **kwargs) -> bool:
+        return compile_condition(MarcCondition(**kwargs))(self.record)
+
+    def test_operators(self):
+        self.assertTrue(self.matches(field="001", value="000123"))
+        self.assertFalse(self.matches(field="001", value="123"))
+        self.assertTrue(
+            self.matches(field="001", value="000123", ind1="1", ind2="_")
+        )
+        self.assertTrue(
+            self.matches(
+                field="245",
+                subfield="a",
+                value="Python",
+                operator=SearchOperator.StartsWith,
+            )
+        )
+        self.assertTrue(
+            self.matches(
+                field="245",
+                subfield="a",
+                value="librarians",
+                operator=SearchOperator.EndsWith,
+            )
+        )
+        self.assertTrue(
+            self.matches(
+                field="245",
+                value="Doe",
+                operator=SearchOperator.Contains,
+            )
+        )
+        self.assertFalse(
+            self.matches(
+                field="245",
+                subfield="a",
+                value="Doe",
+                operator=SearchOperator.Contains,
+            )
+        )
+        self.assertTrue(
+            self.matches(
+                field="020",
+                subfield="a",
+                value=r"^978-\d+",
+                operator=SearchOperator.Regex,
+            )
+        )
+        self.assertFalse(self.matches(field="100", value="John Doe"))
+
+    def test_indicators(self):
+        self.assertTrue(self.matches(field="245", value="John Doe", ind1="1"))
+        self.assertFalse(self.matches(field="245", value="John Doe", ind1="0"))
+        self.assertFalse(
+            self.matches(field="650", value="programming", ind1="1")
+        )
+        for blank in ("\\", "_", " "):
+            self.assertTrue(
+                self.matches(
+                    field="650", value="programming", ind1=blank, ind2="7"
+                )
+            )
+            self.assertFalse(
+                self.matches(field="245", value="John Doe", ind2=blank)
+            )
+
+    def test_bool_query(self):
+        python = MarcCondition(
+            field="245", value="Python", operator=SearchOperator.Contains
+        )
+        java = MarcCondition(
+            field="245", value="Java", operator=SearchOperator.Contains
+        )
+
+        cases = [
+            (MarcBoolQuery(), True),
+            (MarcBoolQuery(must=[python]), True),
+            (MarcBoolQuery(must=[python, java]), False),
+            (MarcBoolQuery(must_not=[java]), True),
+            (MarcBoolQuery(must=[python], must_not=[python]), False),
+            (MarcBoolQuery(should=[java, python]), True),
+            (MarcBoolQuery(should=[java]), False),
+            (
+                MarcBoolQuery(
+                    must=[MarcBoolQuery(should=[java, python])],
+                    must_not=[MarcBoolQuery(must=[java])],
+                ),
+                True,
+            ),
+        ]
+        for query, expected in cases:
+            self.assertEqual(compile_query(query)(self.record), expected)
@@ -0,0 +1,136 @@
+import gzip
+import io
+import os
+import tempfile
+import unittest
+
+from helpers import build_xml
+
+from marcdantic.context import MarcContext
+from marcdantic.oai import OaiListRecords
+
+
+def build_record(number: int, deleted: bool = False) -> str:
+    identifier = f"oai:example.org:{number:06d}"
+    if deleted:
+        return f"""
+        <record>
+          <header status="deleted">
+            <identifier>{identifier}</identifier>
+            <datestamp>2024-01-0{number}</datestamp>
+          </header>
+        </record>
+        """
+    return f"""
+    <record>
+      <header>
+        <identifier>{identifier}</identifier>
+        <datestamp>2024-01-0{number}</datestamp>
+        <setSpec>books</setSpec>
+      </header>
+      <metadata>{build_xml(f"{number:06d}", f"Title {number}")}</metadata>
+    </record>
+    """
+
+
+def build_response(body: str) -> bytes:
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<OAI-PMH xmlns="http://www.openarchives.org/OAI/2.0/">'
+        "<responseDate>2024-01-10T00:00:00Z</responseDate>"
+        '<request verb="ListRecords">https://example.org/oai</request>'
+        f"{body}</OAI-PMH>"
+    ).encode("utf-8")
+
+
+class TestOai(unittest.TestCase):
+    def setUp(self):
+        self.first = build_response(
+            "<ListRecords>"
+            + build_record(1)
+            + build_record(2, deleted=True)
+            + '<resumptionToken completeListSize="3" cursor="0">'
+            "page-2</resumptionToken></ListRecords>"
+        )
+        self.last = build_response(
+            "<ListRecords>"
+            + build_record(3)
+            + '<resumptionToken completeListSize="3" cursor="2"/>'
+            "</ListRecords>"
+        )
+
+    def test_list_records(self):
+        harvest = OaiListRecords(
+            [io.BytesIO(self.first), io.BytesIO(self.last)], MarcContext()
+        )
+        iterator = iter(harvest)
+
+        identifier, datestamp, deleted, record = next(iterator)
+        self.assertEqual(identifier, "oai:example.org:000001")
+        self.assertEqual(datestamp, "2024-01-01")
+        self.assertFalse(deleted)
+        self.assertEqual(
+            record.control_fields_selector.control_number, "000001"
+        )
+        self.assertIsNone(harvest.resumption_token)
+
+        self.assertEqual(
+            next(iterator),
+            ("oai:example.org:000002", "2024-01-02", True, None),
+        )
+        identifier, _, deleted, record = next(iterator)
+        self.assertEqual(harvest.resumption_token, "page-2")
+        self.assertEqual(harvest.complete_list_size, 3)
+        self.assertFalse(deleted)
+        self.assertEqual(
+            record.variable_fields.query_subfield_value(
+                '.["245"][0].subfields.a[0]'
+            ),
+            "Title 3",
+        )
+
+        self.assertEqual(list(iterator), [])
+        self.assertIsNone(harvest.resumption_token)
+
+    def test_resumption_token_drives_sources(self):
+        pages = {None: self.first, "page-2": self.last}
+        requested = []
+
+        def responses():
+            token = None
+            while True:
+                requested.append(token)
+                yield io.BytesIO(pages[token])
+                token = harvest.resumption_token
+                if token is None:
+                    return
+
+        harvest = OaiListRecords(responses())
+        self.assertEqual(len(list(harvest)), 3)
+        self.assertEqual(requested, [None, "page-2"])
+
+    def test_compressed_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "response.xml.gz")
+            with gzip.open(path, "wb") as file:
+                file.write(self.first)
+
+            harvest = OaiListRecords([path])
+            identifiers = [identifier for identifier, *_ in harvest]
+
+        self.assertEqual(
+            identifiers, ["oai:example.org:000001", "oai:example.org:000002"]
+        )
+        self.assertEqual(harvest.resumption_token, "page-2")
+
+    def test_errors(self):
+        empty = build_response(
+            '<error code="noRecordsMatch">No matching records</error>'
+        )
+        self.assertEqual(list(OaiListRecords([io.BytesIO(empty)])), [])
+
+        failed = build_response(
+            '<error code="badResumptionToken">Expired</error>'
+        )
+        with self.assertRaises(ValueError):
+            list(OaiListRecords([io.BytesIO(failed)]))
@@ -0,0 +1,89 @@
+import io
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from helpers import CONTEXT, build_mrc, build_xml
+
+from marcdantic.parallel import parse_many, parse_record
+from marcdantic.readers import iter_xml_data
+from marcdantic.record import MarcRecord
+
+
+class TestParseMany(unittest.TestCase):
+    def setUp(self):
+        self.xml = [
+            build_xml(f"{number:06d}", f"Title {number}")
+            for number in range(30)
+        ]
+        self.mrc = [
+            build_mrc(f"{number:06d}", f"Title {number}")
+            for number in range(30)
+        ]
+        self.expected = [
+            MarcRecord.from_mrc(data, CONTEXT) for data in self.mrc
+        ]
+
+    def test_ordered_processes(self):
+        results = list(
+            parse_many(self.mrc, CONTEXT, jobs=2, chunk_size=4)
+        )
+        self.assertEqual([result.index for result in results], list(range(30)))
+        self.assertEqual(
+            [result.record for result in results], self.expected
+        )
+        self.assertTrue(
+            all(result.record._context is CONTEXT for result in results)
+        )
+
+    def test_unordered(self):
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            results = list(
+                parse_many(
+                    self.mrc,
+                    CONTEXT,
+                    jobs=3,
+                    chunk_size=5,
+                    ordered=False,
+                    executor=executor,
+                )
+            )
+        results.sort(key=lambda result: result.index)
+        self.assertEqual(
+            [result.record for result in results], self.expected
+        )
+
+    def test_xml_fragments_and_errors(self):
+        collection = (
+            '<collection xmlns="http://www.loc.gov/MARC21/slim">'
+            + "".join(self.xml[:3])
+            + "</collection>"
+        )
+        items = list(iter_xml_data(io.BytesIO(collection.encode("utf-8"))))
+        items.insert(1, b"00000 broken record")
+        items.append(self.xml[3])
+
+        results = list(parse_many(items, CONTEXT, jobs=1, chunk_size=2))
+
+        self.assertEqual([result.ok for result in results], [
+            True, False, True, True, True
+        ])
+        self.assertIsNone(results[1].record)
+        self.assertIsInstance(results[1].error, str)
+        self.assertEqual(
+            [result.record for result in results if result.ok],
+            self.expected[:4],
+        )
+
+    def test_parse_record_leading_whitespace(self):
+        xml = " \r\n\t" * 10 + self.xml[0]
+        self.assertEqual(parse_record(xml, CONTEXT), self.expected[0])
+
+        data = " " * 20 + self.expected[0].model_dump_json()
+        self.assertEqual(
+            parse_record(data, CONTEXT).model_dump(),
+            self.expected[0].model_dump(),
+        )
+
+    def test_invalid_chunk_size(self):
+        with self.assertRaises(ValueError):
+            list(parse_many(self.mrc, CONTEXT, chunk_size=0))
@@ -1,10 +1,16 @@
+import mmap
+import tempfile
 import unittest
 
 from lxml import etree
 
-from marcdantic.context import MarcContext
+from marcdantic.context import MarcContext, TagAlias
+from marcdantic.fields import LazyVariableFieldsDict, VariableFields
 from marcdantic.from_mrc import from_mrc
 from marcdantic.from_xml import from_xml
+from marcdantic.instrumentation import Instrumentation
+from marcdantic.record import MarcRecord
+from marcdantic.to_mrc import build_marc
 
 
 class TestParsers(unittest.TestCase):
@@ -22,6 +28,22 @@ class TestParsers(unittest.TestCase):
         """
         self.xml_root = etree.fromstring(self.sample_xml)
 
+        # Record with a local field, for tag projection and indicators
+        self.local_xml_root = etree.fromstring(
+            """
+            <record xmlns="http://www.loc.gov/MARC21/slim">
+              <leader>00000nam  2200000   4500</leader>
+              <controlfield tag="001">123456</controlfield>
+              <datafield tag="245" ind1="1" ind2="0">
+                <subfield code="a">Test Title</subfield>
+              </datafield>
+              <datafield tag="910" ind1=" " ind2=" ">
+                <subfield code="a">Local</subfield>
+              </datafield>
+            </record>
+            """
+        )
+
         # Sample minimal MARC record bytes for testing from_mrc
         # Using ASCII encoding, leader 24 bytes + directory + field data
         # This is a simplified and contrived example just for test purpose
@@ -55,6 +77,49 @@ class TestParsers(unittest.TestCase):
             "Test Subtitle",
         )
 
+    def test_from_xml_marc_round_trip(self):
+        marc = from_xml(self.local_xml_root, MarcContext())["marc"]
+        self.assertTrue(marc.endswith(b"\x1e\x1d"))
+        self.assertEqual(int(marc[:5]), len(marc))
+
+        record = from_mrc(marc, MarcContext())
+        self.assertEqual(record["fixed_fields"], {"001": "123456"})
+        self.assertEqual(
+            record["variable_fields"]["910"][0]["subfields"],
+            {"a": ["Local"]},
+        )
+
+        leader = self.xml_root[0]
+        self.xml_root.remove(leader)
+        with self.assertRaises(ValueError):
+            from_xml(self.xml_root, MarcContext())
+
+    def test_from_xml_single_record_collection(self):
+        collection = etree.fromstring(
+            '<collection xmlns="http://www.loc.gov/MARC21/slim">'
+            f"{self.sample_xml}</collection>"
+        )
+        self.assertEqual(
+            from_xml(collection, MarcContext()),
+            from_xml(self.xml_root, MarcContext()),
+        )
+
+        collection.append(etree.fromstring(self.sample_xml))
+        with self.assertRaises(ValueError):
+            from_xml(collection, MarcContext())
+
+    def test_build_marc(self):
+        marc = build_marc(
+            "00000nam  2200000   4500",
+            [("001", b"1234"), ("245", b"10\x1faTitle")],
+        )
+        self.assertEqual(
+            marc,
+            b"00065nam  2200049   4500"
+            b"001000500000245001000005\x1e"
+            b"1234\x1e10\x1faTitle\x1e\x1d",
+        )
+
     def test_from_mrc(self):
         record = from_mrc(self.sample_mrc, MarcContext())
         self.assertIn("leader", record)
@@ -73,3 +138,267 @@ class TestParsers(unittest.TestCase):
             record["variable_fields"]["245"][0]["subfields"]["b"][0],
             "Test Subtitle",
         )
+
+    def test_from_mrc_buffers(self):
+        expected = from_mrc(self.sample_mrc, MarcContext())
+        padded = b"\x00" * 7 + self.sample_mrc
+
+        with tempfile.TemporaryFile() as file:
+            file.write(padded)
+            file.flush()
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                view = memoryview(mm)
+                try:
+                    record = from_mrc(view[7:], MarcContext())
+                finally:
+                    view.release()
+
+        self.assertEqual(record, expected)
+        self.assertIsInstance(record["marc"], bytes)
+        self.assertEqual(
+            from_mrc(bytearray(self.sample_mrc), MarcContext()), expected
+        )
+
+    def test_from_mrc_multibyte_subfields(self):
+        value = "Žluťoučký kůň".encode("utf-8")
+        field = b"10\x1fa" + value + b"\x1fb\xc3\xa9\x1e"
+        data = (
+            f"{24 + 13 + len(field) + 1:05d}nam  22{24 + 13:05d}   4500"
+            f"245{len(field):04d}00000"
+        ).encode("ascii") + b"\x1e" + field + b"\x1d"
+
+        record = from_mrc(data, MarcContext())
+        self.assertEqual(
+            record["variable_fields"]["245"][0]["subfields"],
+            {"a": ["Žluťoučký kůň"], "b": ["é"]},
+        )
+
+        with self.assertRaises(ValueError):
+            from_mrc(data.replace(b"\x1e10", b"\x1e\xc3\xa9"), MarcContext())
+
+    def test_from_mrc_auto_encoding(self):
+        fields = [("001", b"1"), ("005", b"2"), ("008", b"3")]
+        utf8 = build_marc(
+            "00000nam a2200000   4500",
+            fields + [("100", "1 \x1faDvořák".encode("utf-8"))],
+        )
+        marc8 = build_marc(
+            "00000nam  2200000   4500",
+            fields + [("100", b"1 \x1faDvo\xe9r\xe2ak")],
+        )
+
+        with Instrumentation() as instrumentation:
+            for lazy_fields in (False, True):
+                context = MarcContext(
+                    mrc_encoding="auto", lazy_fields=lazy_fields
+                )
+                for data, encoding in ((utf8, "utf-8"), (marc8, "marc8")):
+                    record = MarcRecord.from_mrc(data, context)
+                    self.assertEqual(record.encoding, encoding)
+                    self.assertEqual(
+                        record.variable_fields.root["100"][0].subfields,
+                        {"a": ["Dvořák"]},
+                    )
+
+        counters = instrumentation.snapshot()["counters"]
+        self.assertEqual(counters["encoding.utf-8"], 2)
+        self.assertEqual(counters["encoding.marc8"], 2)
+        self.assertEqual(
+            MarcRecord.from_xml(
+                self.xml_root, MarcContext(mandatory_fields=[])
+            ).encoding,
+            "utf-8",
+        )
+
+    def test_from_mrc_lazy(self):
+        context = MarcContext(lazy_fields=True)
+        record = from_mrc(self.sample_mrc, context)
+        variable_fields = record["variable_fields"]
+
+        self.assertIsInstance(variable_fields, LazyVariableFieldsDict)
+        self.assertEqual(record["fixed_fields"]["001"], "1234")
+        self.assertEqual(variable_fields.pending_tags, ["245"])
+        self.assertIn("245", variable_fields)
+        self.assertEqual(len(variable_fields), 1)
+
+        fields = variable_fields["245"]
+        self.assertEqual(variable_fields.pending_tags, [])
+        self.assertEqual(fields[0].subfields["b"], ["Test Subtitle"])
+        self.assertIsNone(variable_fields.get("100"))
+
+    def test_marc_record_lazy_matches_eager(self):
+        context = MarcContext(lazy_fields=True, mandatory_fields=[])
+        lazy = MarcRecord.from_mrc(self.sample_mrc, context)
+        eager = VariableFields.model_validate(
+            from_mrc(self.sample_mrc, MarcContext())["variable_fields"]
+        )
+
+        self.assertEqual(lazy.variable_fields.root.pending_tags, ["245"])
+        self.assertEqual(
+            lazy.model_dump()["variable_fields"], eager.model_dump()
+        )
+        self.assertEqual(lazy.variable_fields, eager)
+        self.assertEqual(
+            lazy.variable_fields.query_subfield_values(
+                '.["245"][].subfields.a[]'
+            ),
+            ["Test Title"],
+        )
+
+    def test_marc_record_lazy_blank_alias(self):
+        marc = build_marc(
+            "00000nam a2200000   4500",
+            [
+                ("001", b"1234"),
+                ("FMT", b"   "),
+                ("245", b"10\x1faTitle"),
+            ],
+        )
+        eager = MarcRecord.from_mrc(marc, MarcContext(mandatory_fields=[]))
+        lazy = MarcRecord.from_mrc(
+            marc, MarcContext(lazy_fields=True, mandatory_fields=[])
+        )
+
+        self.assertNotIn("990", lazy.variable_fields.root)
+        self.assertEqual(len(lazy.variable_fields.root), 1)
+        self.assertEqual(list(lazy.variable_fields.root), ["245"])
+        self.assertEqual(lazy.variable_fields, eager.variable_fields)
+        self.assertEqual(lazy.model_dump(), eager.model_dump())
+
+        for lazy_fields in (False, True):
+            with self.assertRaises(ValueError):
+                MarcRecord.from_mrc(
+                    marc,
+                    MarcContext(
+                        lazy_fields=lazy_fields, mandatory_fields=["990"]
+                    ),
+                )
+
+    def test_marc_record_lazy_xml_is_validated(self):
+        context = MarcContext(lazy_fields=True, mandatory_fields=[])
+        record = MarcRecord.from_xml(self.xml_root, context)
+        self.assertEqual(
+            record.variable_fields.root["245"][0].subfields["a"],
+            ["Test Title"],
+        )
+        self.assertEqual(
+            MarcRecord.from_mrc(record.to_mrc(), context).variable_fields,
+            record.variable_fields,
+        )
+
+        self.xml_root[2][0].set("code", "?!")
+        with self.assertRaises(ValueError):
+            MarcRecord.from_xml(self.xml_root, context)
+
+    def test_context_selected_tags(self):
+        context = MarcContext(
+            include_tags=["0XX", "245"], exclude_tags=["05X"]
+        )
+        self.assertIn("001", context.selected_tags)
+        self.assertIn("245", context.selected_tags)
+        self.assertNotIn("050", context.selected_tags)
+        self.assertNotIn("246", context.selected_tags)
+
+        context.exclude_tags = ["001"]
+        self.assertNotIn("001", context.selected_tags)
+        self.assertIn("050", context.selected_tags)
+
+    def test_context_compiled(self):
+        context = MarcContext(
+            tag_aliases=[
+                TagAlias(from_tag="FMT", tag="990", code="a"),
+                TagAlias(from_tag="FMT", tag="991"),
+            ]
+        )
+        compiled = context.compiled
+        self.assertIs(context.compiled, compiled)
+        self.assertEqual(compiled.aliases["FMT"].tag, "990")
+        self.assertIn("LDR", compiled.skip_tags)
+        self.assertIn("001", compiled.control_fields)
+        self.assertIn("245", compiled.valid_tags)
+        self.assertNotIn("FMT", compiled.valid_tags)
+
+        context.skip_tags = ["245"]
+        self.assertIsNot(context.compiled, compiled)
+        self.assertEqual(context.compiled.skip_tags, frozenset(["245"]))
+
+    def test_context_copy_compiled(self):
+        context = MarcContext()
+        compiled = context.compiled
+
+        for deep in (False, True):
+            copied = context.model_copy(
+                update={"include_tags": ["245"], "skip_tags": ["001"]},
+                deep=deep,
+            )
+            self.assertEqual(copied.selected_tags, frozenset(["245"]))
+            self.assertEqual(copied.compiled.skip_tags, frozenset(["001"]))
+            self.assertIs(context.compiled, compiled)
+
+    def test_parsers_aliases_and_skip_tags(self):
+        context = MarcContext(
+            skip_tags=["001"],
+            tag_aliases=[TagAlias(from_tag="245", tag="246", code="x")],
+        )
+        for record in (
+            from_xml(self.xml_root, context),
+            from_mrc(self.sample_mrc, context),
+        ):
+            self.assertEqual(record["fixed_fields"], {})
+            self.assertNotIn("245", record["variable_fields"])
+            self.assertIn("246", record["variable_fields"])
+
+    def test_from_xml_tag_projection(self):
+        root = self.local_xml_root
+        record = from_xml(root, MarcContext(exclude_tags=["9XX"]))
+        self.assertIn("245", record["variable_fields"])
+        self.assertNotIn("910", record["variable_fields"])
+        self.assertNotIn(b"Local", record["marc"])
+
+        record = from_xml(root, MarcContext(include_tags=["9XX"]))
+        self.assertEqual(record["fixed_fields"], {})
+        self.assertEqual(list(record["variable_fields"]), ["910"])
+
+        # Mandatory fields are checked on the projected record
+        with self.assertRaises(ValueError):
+            MarcRecord.from_xml(root, MarcContext(include_tags=["245"]))
+        record = MarcRecord.from_xml(
+            root, MarcContext(include_tags=["245"], mandatory_fields=[])
+        )
+        self.assertEqual(list(record.variable_fields.root), ["245"])
+
+    def test_from_mrc_tag_projection(self):
+        record = from_mrc(self.sample_mrc, MarcContext(include_tags=["001"]))
+        self.assertEqual(record["fixed_fields"], {"001": "1234"})
+        self.assertEqual(record["variable_fields"], {})
+
+        record = from_mrc(self.sample_mrc, MarcContext(exclude_tags=["00X"]))
+        self.assertEqual(record["fixed_fields"], {})
+        self.assertIn("245", record["variable_fields"])
+
+    def test_marc_record_trusted_matches_validated(self):
+        validated_context = MarcContext(mandatory_fields=["001"])
+        trusted_context = MarcContext(mandatory_fields=["001"], trusted=True)
+
+        for parse, data in (
+            (MarcRecord.from_mrc, self.sample_mrc),
+            (MarcRecord.from_xml, self.xml_root),
+        ):
+            validated = parse(data, validated_context)
+            trusted = parse(data, trusted_context)
+
+            self.assertEqual(trusted.model_dump(), validated.model_dump())
+            self.assertEqual(
+                trusted.variable_fields, validated.variable_fields
+            )
+            self.assertEqual(trusted._marc, validated._marc)
+
+        trusted = MarcRecord.from_xml(self.local_xml_root, trusted_context)
+        self.assertIsNone(trusted.variable_fields.root["910"][0].ind1)
+        self.assertIsNone(trusted.variable_fields.root["910"][0].ind2)
+
+    def test_marc_record_mandatory_fields_from_context(self):
+        for trusted in (False, True):
+            context = MarcContext(mandatory_fields=["020"], trusted=trusted)
+            with self.assertRaises(ValueError):
+                MarcRecord.from_xml(self.xml_root, context)
@@ -0,0 +1,100 @@
+import unittest
+
+import jq
+
+from marcdantic.fields import VariableFields
+from marcdantic.paths import PathProgram, compile_path, to_plain
+from marcdantic.selectors import IsbnActiveJq, IsxnActiveJq, TitleJq
+
+
+class TestPaths(unittest.TestCase):
+    def setUp(self):
+        self.variable_fields = VariableFields.model_validate(
+            {
+                "020": [
+                    {
+                        "ind1": " ",
+                        "ind2": " ",
+                        "subfields": {"a": ["978-80-1"], "c": ["100 CZK"]},
+                    },
+                    {"ind1": "1", "ind2": " ", "subfields": {"z": ["x"]}},
+                    {"ind1": " ", "ind2": " ", "subfields": {"a": ["2", "3"]}},
+                ],
+                "245": [
+                    {
+                        "ind1": "1",
+                        "ind2": "0",
+                        "subfields": {"a": ["Title"], "b": ["Subtitle"]},
+                    }
+                ],
+            }
+        )
+        self.plain = to_plain(self.variable_fields.root)
+
+    def assertSameAsJq(self, jq_filter: str):
+        program = compile_path(jq_filter)
+        self.assertIsInstance(program, PathProgram, jq_filter)
+
+        try:
+            expected = jq.compile(jq_filter).input(self.plain).all()
+        except ValueError as error:
+            with self.assertRaises(ValueError) as context:
+                program.all(self.variable_fields.root)
+            self.assertEqual(str(context.exception), str(error))
+            return
+
+        self.assertEqual(
+            program.all(self.variable_fields.root), expected, jq_filter
+        )
+
+    def test_selector_filters(self):
+        for jq_filter in (IsbnActiveJq, IsxnActiveJq, TitleJq):
+            self.assertSameAsJq(jq_filter)
+
+    def test_path_semantics(self):
+        for jq_filter in (
+            '.["020"][].subfields.a[]?',
+            '.["020"][].subfields.a[]',
+            '.["021"][]',
+            '.["021"]?[]?',
+            '.["245"][0]',
+            '.["245"][0].subfields',
+            '.["245"][0].subfields.a[0]',
+            '.["020"][-1].ind1',
+            '.["020"][-9]',
+            '.["245"][0].subfields.a.x',
+            '.["245"][0].subfields.a.x?',
+            '.["245"][0].ind1[]?',
+            '.["245"][0][]',
+            '.["245"][0][0]',
+            ".[][]?.ind2",
+            ".missing.key",
+        ):
+            self.assertSameAsJq(jq_filter)
+
+    def test_unsupported_filters(self):
+        for jq_filter in (
+            '.["996"][] | select(.subfields.b[0] == "1")',
+            "[.a]",
+            '["a"]',
+            ".[1:2]",
+            "..",
+            ".a, .b",
+            "",
+        ):
+            self.assertIsNone(compile_path(jq_filter), jq_filter)
+
+    def test_query_methods(self):
+        self.assertEqual(
+            self.variable_fields.query(IsbnActiveJq), ["978-80-1", "2", "3"]
+        )
+        self.assertEqual(
+            self.variable_fields.query_subfield('.["245"][0].subfields'),
+            {"a": ["Title"], "b": ["Subtitle"]},
+        )
+        field = self.variable_fields.query_field('.["245"][0]')
+        self.assertEqual(field.ind1, "1")
+        self.assertEqual(
+            self.variable_fields.root["245"][0].query(".subfields.b[]"),
+            ["Subtitle"],
+        )
@@ -0,0 +1,237 @@
+import random
+import unittest
+
+from helpers import CONTEXT, TOPICS, build_topic_record, datafield
+
+from marcdantic.index import MarcIndex
+from marcdantic.matcher import compile_query
+from marcdantic.percolator import AhoCorasick, MarcPercolator, select_anchors
+from marcdantic.query import (
+    MarcBoolQuery,
+    MarcCondition,
+    MarcSearchRequest,
+    SearchOperator,
+)
+from marcdantic.record import MarcRecord
+from marcdantic.sqlite_index import SqliteMarcIndex
+
+
+def build_record(number: int) -> MarcRecord:
+    return build_topic_record(
+        number, datafield("650", " 7", ("a", TOPICS[number % 4]))
+    )
+
+
+class TestAhoCorasick(unittest.TestCase):
+    def test_matches(self):
+        patterns = ["he", "she", "his", "hers", "s"]
+        automaton = AhoCorasick()
+        for pattern in patterns:
+            automaton.add(pattern)
+
+        text = "ushers and his sheep"
+        expected = sorted(
+            (start + len(pattern), index)
+            for index, pattern in enumerate(patterns)
+            for start in range(len(text))
+            if text.startswith(pattern, start)
+        )
+        self.assertEqual(sorted(automaton.iter_matches(text)), expected)
+
+    def test_empty(self):
+        automaton = AhoCorasick()
+        self.assertEqual(list(automaton.iter_matches("text")), [])
+        with self.assertRaises(ValueError):
+            automaton.add("")
+
+
+class TestMarcPercolator(unittest.TestCase):
+    def setUp(self):
+        self.records = [build_record(number) for number in range(20)]
+
+    def random_query(self, generator: random.Random) -> MarcBoolQuery:
+        def condition() -> MarcCondition:
+            operator = generator.choice(list(SearchOperator))
+            topic = generator.choice(TOPICS)
+            value = {
+                SearchOperator.Exact: topic,
+                SearchOperator.Contains: topic[1:4],
+                SearchOperator.StartsWith: "Volume 1",
+                SearchOperator.EndsWith: topic[-3:],
+                SearchOperator.Regex: rf"\d of {topic[:3]}",
+            }[operator]
+            field = "650" if operator == SearchOperator.Exact else "245"
+            return MarcCondition(
+                field=field,
+                subfield=generator.choice(["a", None]),
+                value=value,
+                operator=operator,
+                ind1=generator.choice([None, "1"]),
+            )
+
+        return MarcBoolQuery(
+            must=[condition() for _ in range(generator.randint(0, 2))]
+            or None,
+            should=[condition() for _ in range(generator.randint(0, 2))]
+            or None,
+            must_not=[condition() for _ in range(generator.randint(0, 1))]
+            or None,
+        )
+
+    def test_same_as_evaluation(self):
+        generator = random.Random(42)
+        queries = {
+            f"query-{number}": self.random_query(generator)
+            for number in range(200)
+        }
+        percolator = MarcPercolator()
+        percolator.add_many(queries.items())
+        self.assertEqual(len(percolator), 200)
+
+        predicates = {
+            query_id: compile_query(query)
+            for query_id, query in queries.items()
+        }
+        for record in self.records:
+            self.assertEqual(
+                percolator.percolate(record),
+                [
+                    query_id
+                    for query_id, predicate in predicates.items()
+                    if predicate(record)
+                ],
+            )
+
+    def test_candidates(self):
+        percolator = MarcPercolator()
+        percolator.add(
+            "poetry",
+            MarcSearchRequest(
+                query=MarcBoolQuery(
+                    must=[
+                        MarcCondition(field="650", value="poetry"),
+                        MarcCondition(
+                            field="245", value="Vol", operator="regex"
+                        ),
+                    ]
+                )
+            ),
+        )
+        percolator.add(
+            "not-music",
+            MarcBoolQuery(
+                must_not=[MarcCondition(field="650", value="music")]
+            ),
+        )
+
+        self.assertEqual(
+            percolator.candidates(self.records[1]), {"not-music"}
+        )
+        self.assertEqual(
+            percolator.candidates(self.records[2]), {"poetry", "not-music"}
+        )
+        self.assertEqual(percolator.percolate(self.records[3]), [])
+
+    def test_replace_and_remove(self):
+        percolator = MarcPercolator()
+        percolator.add(
+            "alert",
+            MarcBoolQuery(
+                must=[
+                    MarcCondition(
+                        field="245", value="poetry", operator="endswith"
+                    )
+                ]
+            ),
+        )
+        self.assertEqual(percolator.percolate(self.records[2]), ["alert"])
+
+        percolator.add(
+            "alert",
+            MarcBoolQuery(
+                must=[
+                    MarcCondition(
+                        field="245", value="music", operator="endswith"
+                    )
+                ]
+            ),
+        )
+        self.assertEqual(percolator.percolate(self.records[2]), [])
+        self.assertEqual(percolator.percolate(self.records[3]), ["alert"])
+
+        self.assertTrue(percolator.remove("alert"))
+        self.assertFalse(percolator.remove("alert"))
+        self.assertNotIn("alert", percolator)
+        self.assertEqual(percolator.percolate(self.records[3]), [])
+
+    def test_select_anchors(self):
+        exact = MarcCondition(field="650", value="poetry")
+        regex = MarcCondition(field="245", value="x", operator="regex")
+
+        self.assertEqual(
+            select_anchors(MarcBoolQuery(must=[regex, exact])), [exact]
+        )
+        self.assertEqual(
+            select_anchors(MarcBoolQuery(should=[regex, exact])),
+            [regex, exact],
+        )
+        self.assertIsNone(
+            select_anchors(
+                MarcBoolQuery(
+                    should=[exact, MarcBoolQuery(must_not=[regex])]
+                )
+            )
+        )
+
+    def test_control_field_indicators(self):
+        values = {
+            SearchOperator.Exact: "000003",
+            SearchOperator.Contains: "1",
+            SearchOperator.StartsWith: "00001",
+            SearchOperator.EndsWith: "3",
+            SearchOperator.Regex: r"^0+1\d$",
+        }
+        index = MarcIndex(self.records)
+        sqlite_index = SqliteMarcIndex(context=CONTEXT)
+        self.addCleanup(sqlite_index.close)
+        ids = [sqlite_index.add(record) for record in self.records]
+
+        queries = {
+            f"{operator.value}-{indicators}": MarcBoolQuery(
+                must=[
+                    MarcCondition(
+                        field="001",
+                        value=value,
+                        operator=operator,
+                        ind1=indicators[0],
+                        ind2=indicators[1],
+                    )
+                ]
+            )
+            for operator, value in values.items()
+            for indicators in ("1_", "_7", "10")
+        }
+        percolator = MarcPercolator()
+        percolator.add_many(queries.items())
+
+        for query_id, query in queries.items():
+            predicate = compile_query(query)
+            expected = {
+                number
+                for number, record in enumerate(self.records)
+                if predicate(record)
+            }
+            self.assertTrue(expected)
+            self.assertEqual(index.evaluate(query), expected)
+            self.assertEqual(
+                sqlite_index.evaluate(query),
+                {ids[number] for number in expected},
+            )
+            self.assertEqual(
+                {
+                    number
+                    for number, record in enumerate(self.records)
+                    if query_id in percolator.percolate(record)
+                },
+                expected,
+            )
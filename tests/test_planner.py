@@ -0,0 +1,137 @@
+import unittest
+
+from helpers import TOPICS, build_topic_record, datafield
+
+from marcdantic.index import MarcIndex
+from marcdantic.matcher import compile_query
+from marcdantic.planner import QueryPlanner, flatten_query
+from marcdantic.query import MarcBoolQuery, MarcCondition, SearchOperator
+from marcdantic.record import MarcRecord
+
+
+def build_record(number: int) -> MarcRecord:
+    return build_topic_record(
+        number,
+        datafield("500", "  ", ("a", f"Note {number}")),
+        datafield("650", " 7", ("a", TOPICS[number % 4])),
+    )
+
+
+class TestQueryPlanner(unittest.TestCase):
+    def setUp(self):
+        self.records = [build_record(number) for number in range(40)]
+        self.index = MarcIndex(self.records)
+        self.planner = QueryPlanner(self.index.statistics)
+
+        self.control = MarcCondition(field="001", value="000012")
+        self.poetry = MarcCondition(field="650", subfield="a", value="poetry")
+        self.music = MarcCondition(field="650", subfield="a", value="music")
+        self.note = MarcCondition(
+            field="500",
+            subfield="a",
+            value=r"Note \d+",
+            operator=SearchOperator.Regex,
+        )
+
+    def assertEquivalent(self, first: MarcBoolQuery, second: MarcBoolQuery):
+        first_predicate = compile_query(first)
+        second_predicate = compile_query(second)
+        for record in self.records:
+            self.assertEqual(first_predicate(record), second_predicate(record))
+
+    def test_statistics(self):
+        statistics = self.index.statistics
+        self.assertEqual(statistics.record_count, 40)
+        self.assertEqual(statistics.field_count(("650", "a")), 40)
+        self.assertEqual(statistics.value_count(("650", "a"), "poetry"), 10)
+        self.assertEqual(statistics.value_count(("650", None), "poetry"), 10)
+        self.assertEqual(statistics.distinct_count(("650", "a")), 4)
+        self.assertEqual(statistics.value_count(("100", "a"), "x"), 0)
+
+    def test_flatten(self):
+        query = MarcBoolQuery(
+            must=[
+                MarcBoolQuery(
+                    must=[self.poetry, self.note],
+                    must_not=[self.control],
+                ),
+                MarcBoolQuery(must=[self.poetry]),
+                MarcBoolQuery(),
+            ],
+            should=[MarcBoolQuery(should=[self.music, self.poetry])],
+            must_not=[MarcBoolQuery(should=[self.music, self.control])],
+        )
+        flat = flatten_query(query)
+
+        self.assertEqual(flat.must, [self.poetry, self.note])
+        self.assertEqual(flat.should, [self.music, self.poetry])
+        self.assertEqual(flat.must_not, [self.control, self.music])
+        self.assertEquivalent(query, flat)
+
+    def test_flatten_keeps_semantics(self):
+        queries = [
+            MarcBoolQuery(
+                should=[MarcBoolQuery(must=[self.poetry, self.note])],
+                must_not=[MarcBoolQuery(must=[self.music, self.note])],
+            ),
+            MarcBoolQuery(
+                must=[MarcBoolQuery(should=[self.poetry, self.music])],
+                should=[self.control, MarcBoolQuery()],
+            ),
+            MarcBoolQuery(must_not=[MarcBoolQuery(must=[self.control])]),
+        ]
+        for query in queries:
+            self.assertEquivalent(query, flatten_query(query))
+
+    def test_order(self):
+        plan = self.planner.plan(
+            MarcBoolQuery(
+                must=[self.note, self.poetry, self.control],
+                must_not=[self.note, self.music],
+            )
+        )
+        self.assertEqual(
+            plan.query.must, [self.control, self.poetry, self.note]
+        )
+        self.assertEqual(plan.query.must_not, [self.music, self.note])
+        self.assertEqual(plan.root.must[0].estimate, 1)
+
+    def test_control_field_indicators(self):
+        query = MarcBoolQuery(
+            must=[self.control.model_copy(update={"ind1": "1"})]
+        )
+        node = self.planner.plan(query).root.must[0]
+        expected = self.planner.plan(
+            MarcBoolQuery(must=[self.control])
+        ).root.must[0]
+        self.assertEqual(
+            (node.estimate, node.cost), (expected.estimate, expected.cost)
+        )
+        self.assertEqual(self.index.evaluate(query), {12})
+
+    def test_explain(self):
+        explanation = self.index.explain(
+            MarcBoolQuery(must=[self.note, self.control])
+        )
+        lines = explanation.splitlines()
+
+        self.assertEqual(lines[0], "plan over 40 records")
+        self.assertTrue(lines[1].startswith("bool (rows="))
+        self.assertEqual(lines[2], "  must:")
+        self.assertTrue(lines[3].startswith("    001 exact '000012' (rows=1"))
+        self.assertIn("500$a regex", lines[4])
+
+    def test_index_evaluation(self):
+        query = MarcBoolQuery(
+            must=[MarcBoolQuery(should=[self.poetry, self.music])],
+            must_not=[self.note, self.control],
+        )
+        predicate = compile_query(query)
+        self.assertEqual(
+            self.index.evaluate(query),
+            {
+                number
+                for number, record in enumerate(self.records)
+                if predicate(record)
+            },
+        )
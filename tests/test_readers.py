@@ -0,0 +1,164 @@
+import bz2
+import gzip
+import io
+import lzma
+import os
+import tempfile
+import unittest
+
+from helpers import build_mrc, build_xml
+
+from marcdantic.context import MarcContext
+from marcdantic.readers import (
+    detect_compression,
+    find_record_end,
+    iter_mrc,
+    iter_mrc_data,
+    iter_xml,
+    iter_xml_elements,
+    open_input,
+)
+
+
+class TestReaders(unittest.TestCase):
+    def setUp(self):
+        self.context = MarcContext()
+        self.records = [
+            build_mrc(f"{number:06d}", f"Title {number} " + "x" * number)
+            for number in range(25)
+        ]
+
+    def test_iter_mrc_data_small_chunks(self):
+        stream = io.BytesIO(b"".join(self.records))
+        result = list(iter_mrc_data(stream, chunk_size=7))
+        self.assertEqual(result, self.records)
+
+    def test_iter_mrc_data_separators(self):
+        stream = io.BytesIO(b"\n".join(self.records) + b"\r\n")
+        result = list(iter_mrc_data(stream, chunk_size=64))
+        self.assertEqual(result, self.records)
+
+    def test_iter_mrc_data_invalid_leader_length(self):
+        broken = b"99999" + self.records[0][5:]
+        stream = io.BytesIO(broken + self.records[1])
+        result = list(iter_mrc_data(stream, chunk_size=16))
+        self.assertEqual(result, [broken, self.records[1]])
+
+    def test_find_record_end(self):
+        first, second = self.records[:2]
+        data = first + second
+        self.assertEqual(find_record_end(data, 0), len(first))
+        self.assertEqual(find_record_end(data, len(first)), len(data))
+
+        broken = b"00030" + first[5:]
+        self.assertEqual(find_record_end(broken, 0), len(first))
+        self.assertEqual(find_record_end(first[:-1], 0), -1)
+        self.assertEqual(
+            find_record_end(b"99999" + first[5:], 0, complete=False), -1
+        )
+
+    def test_iter_mrc_data_truncated(self):
+        stream = io.BytesIO(self.records[0][:-10])
+        with self.assertRaises(ValueError):
+            list(iter_mrc_data(stream))
+
+    def test_iter_mrc(self):
+        stream = io.BytesIO(b"".join(self.records))
+        records = list(iter_mrc(stream, self.context, chunk_size=100))
+        self.assertEqual(len(records), 25)
+        self.assertEqual(
+            records[3].control_fields_selector.control_number, "000003"
+        )
+        self.assertEqual(
+            records[3].variable_fields.query_subfield_value(
+                '.["245"][0].subfields.a[0]'
+            ),
+            "Title 3 xxx",
+        )
+
+    def test_iter_xml(self):
+        collection = (
+            '<collection xmlns="http://www.loc.gov/MARC21/slim">'
+            + "".join(
+                build_xml(f"{number:06d}", f"Title {number}")
+                for number in range(30)
+            )
+            + "</collection>"
+        )
+        records = list(iter_xml(io.BytesIO(collection.encode("utf-8"))))
+        self.assertEqual(len(records), 30)
+        self.assertEqual(
+            records[29].control_fields_selector.control_number, "000029"
+        )
+        self.assertEqual(
+            records[29].variable_fields.query_subfield_value(
+                '.["245"][0].subfields.a[0]'
+            ),
+            "Title 29",
+        )
+
+    def test_iter_xml_elements_clears_processed_records(self):
+        collection = (
+            '<collection xmlns="http://www.loc.gov/MARC21/slim">'
+            + "".join(build_xml(str(number), "T") for number in range(10))
+            + "</collection>"
+        )
+        stream = io.BytesIO(collection.encode("utf-8"))
+        for element in iter_xml_elements(stream):
+            self.assertLessEqual(element.getparent().index(element), 1)
+            previous = element.getprevious()
+            if previous is not None:
+                self.assertEqual(len(previous), 0)
+
+    def test_compressed_input(self):
+        data = b"".join(self.records)
+        for name, compress in (
+            ("gzip", gzip.compress),
+            ("bz2", bz2.compress),
+            ("xz", lzma.compress),
+        ):
+            stream = io.BytesIO(compress(data))
+            self.assertEqual(detect_compression(stream), name)
+            self.assertEqual(stream.tell(), 0)
+            self.assertEqual(
+                list(iter_mrc_data(stream, chunk_size=50)), self.records
+            )
+            self.assertFalse(stream.closed)
+
+        plain = io.BytesIO(data)
+        self.assertIsNone(detect_compression(plain))
+        self.assertIs(open_input(plain), plain)
+
+    def test_read_only_stream(self):
+        class ReadOnly:
+            def __init__(self, data: bytes):
+                self.read = io.BytesIO(data).read
+
+        stream = ReadOnly(b"".join(self.records))
+        self.assertIsNone(detect_compression(stream))
+        self.assertIs(open_input(stream), stream)
+        self.assertEqual(
+            list(iter_mrc_data(stream, chunk_size=50)), self.records
+        )
+
+    def test_compressed_files(self):
+        collection = (
+            '<collection xmlns="http://www.loc.gov/MARC21/slim">'
+            + build_xml("000001", "Title")
+            + "</collection>"
+        ).encode("utf-8")
+
+        with tempfile.TemporaryDirectory() as directory:
+            mrc_path = os.path.join(directory, "dump.mrc.gz")
+            with gzip.open(mrc_path, "wb") as file:
+                file.write(b"".join(self.records))
+            xml_path = os.path.join(directory, "dump.xml.xz")
+            with lzma.open(xml_path, "wb") as file:
+                file.write(collection)
+
+            with open_input(mrc_path, buffer_size=64) as stream:
+                self.assertEqual(len(list(iter_mrc(stream))), 25)
+            records = list(iter_xml(xml_path))
+            self.assertEqual(
+                records[0].control_fields_selector.control_number, "000001"
+            )
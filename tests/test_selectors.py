@@ -1,8 +1,10 @@
 import unittest
 from datetime import datetime
 
-from marcdantic.fields import VariableField
+from marcdantic.context import MarcContext
+from marcdantic.fields import VariableField, VariableFields
 from marcdantic.record import MarcRecord
+from marcdantic.selectors import MarcIssuesSelector
 
 
 class TestSelectors(unittest.TestCase):
@@ -184,3 +186,22 @@ class TestSelectors(unittest.TestCase):
         field: VariableField = variable_fields.root["015"][0]
         result = field.query(".subfields.a[]")
         self.assertEqual(result, ["nbn:cz:mzk2023-00001"])
+
+    def test_issues_selector_find_by_barcode_shared_filter(self):
+        variable_fields = VariableFields.model_validate(
+            {
+                "996": [
+                    {"ind1": " ", "ind2": " ", "subfields": {"s": ["m"]}},
+                    {
+                        "ind1": " ",
+                        "ind2": " ",
+                        "subfields": {"b": ['12"34'], "s": ["m"]},
+                    },
+                ]
+            }
+        )
+        issues_selector = MarcIssuesSelector(variable_fields, MarcContext())
+        issue = issues_selector.find_by_barcode('12"34')
+        self.assertIsNotNone(issue)
+        self.assertEqual(issue.barcode, '12"34')
+        self.assertIsNone(issues_selector.find_by_barcode("000000000"))
@@ -0,0 +1,187 @@
+import os
+import tempfile
+import unittest
+
+from helpers import CONTEXT, TOPICS, build_topic_record, datafield
+
+from marcdantic.matcher import compile_query
+from marcdantic.query import (
+    MarcBoolQuery,
+    MarcCondition,
+    MarcSearchRequest,
+    SearchOperator,
+)
+from marcdantic.record import MarcRecord
+from marcdantic.sqlite_index import SqliteMarcIndex
+
+
+def build_record(number: int) -> MarcRecord:
+    return build_topic_record(
+        number,
+        datafield("650", f" {number % 3}", ("a", TOPICS[number % 4])),
+        datafield("650", " 7", ("a", TOPICS[(number + 1) % 4])),
+    )
+
+
+class TestSqliteMarcIndex(unittest.TestCase):
+    def setUp(self):
+        self.records = [build_record(number) for number in range(60)]
+        self.index = SqliteMarcIndex(context=CONTEXT)
+        self.ids = [self.index.add(record) for record in self.records]
+
+    def tearDown(self):
+        self.index.close()
+
+    def assertSameAsScan(self, query: MarcBoolQuery):
+        predicate = compile_query(query)
+        expected = {
+            record_id
+            for record_id, record in zip(self.ids, self.records)
+            if predicate(record)
+        }
+        self.assertEqual(self.index.evaluate(query), expected)
+
+    def test_conditions(self):
+        conditions = [
+            MarcCondition(field="001", value="000007"),
+            MarcCondition(field="001", subfield="a", value="000007"),
+            MarcCondition(field="001", value="000007", ind1="1", ind2="_"),
+            MarcCondition(field="650", subfield="a", value="poetry"),
+            MarcCondition(field="650", value="poetry", ind2="7"),
+            MarcCondition(field="650", value="music", ind1="_", ind2="1"),
+            MarcCondition(field="245", value="Volume 1", ind1="1"),
+            MarcCondition(
+                field="245",
+                subfield="a",
+                value="Volume 1",
+                operator=SearchOperator.StartsWith,
+            ),
+            MarcCondition(
+                field="245",
+                value="of music",
+                operator=SearchOperator.EndsWith,
+            ),
+            MarcCondition(
+                field="245", value="5 of", operator=SearchOperator.Contains
+            ),
+            MarcCondition(
+                field="245", value="y", operator=SearchOperator.Contains
+            ),
+            MarcCondition(
+                field="245",
+                subfield="a",
+                value=r"^Volume \d{2} of (poetry|music)$",
+                operator=SearchOperator.Regex,
+            ),
+            MarcCondition(field="100", value="missing"),
+            MarcCondition(
+                field="650", value="", operator=SearchOperator.EndsWith
+            ),
+            MarcCondition(
+                field="650", value="", operator=SearchOperator.Contains
+            ),
+        ]
+        for condition in conditions:
+            self.assertSameAsScan(MarcBoolQuery(must=[condition]))
+
+    def test_conditions_without_fts(self):
+        self.index.close()
+        self.index = SqliteMarcIndex(context=CONTEXT, use_fts=False)
+        self.ids = [self.index.add(record) for record in self.records]
+
+        self.assertSameAsScan(
+            MarcBoolQuery(
+                must=[
+                    MarcCondition(
+                        field="245", value="of poetry", operator="contains"
+                    )
+                ]
+            )
+        )
+
+    def test_bool_queries(self):
+        poetry = MarcCondition(field="650", subfield="a", value="poetry")
+        music = MarcCondition(field="650", subfield="a", value="music")
+        odd = MarcCondition(
+            field="245", value="Volume", operator="startswith", ind1="1"
+        )
+
+        for query in [
+            MarcBoolQuery(),
+            MarcBoolQuery(must=[poetry, music]),
+            MarcBoolQuery(should=[poetry, music]),
+            MarcBoolQuery(must=[odd], must_not=[poetry]),
+            MarcBoolQuery(must_not=[poetry, music]),
+            MarcBoolQuery(
+                must=[MarcBoolQuery(should=[poetry, odd])],
+                must_not=[MarcBoolQuery(must=[music, odd])],
+            ),
+        ]:
+            self.assertSameAsScan(query)
+
+    def test_search_pagination(self):
+        query = MarcBoolQuery(
+            must=[MarcCondition(field="650", subfield="a", value="poetry")]
+        )
+        predicate = compile_query(query)
+        expected = [record for record in self.records if predicate(record)]
+
+        result = self.index.search(
+            MarcSearchRequest(query=query, page=2, page_size=10)
+        )
+        self.assertEqual(result.total, len(expected))
+        self.assertEqual(result.page, 2)
+        self.assertEqual(result.records, expected[10:20])
+
+        result = self.index.search(
+            MarcSearchRequest(query=query, page=100, page_size=10)
+        )
+        self.assertEqual(result.records, [])
+
+    def test_replace_and_remove(self):
+        query = MarcBoolQuery(
+            must=[MarcCondition(field="001", value="000600")]
+        )
+        replacement = build_record(600)
+        replacement.fixed_fields.root["001"] = "000007"
+
+        record_id = self.index.add(replacement)
+        self.assertEqual(record_id, self.ids[7])
+        self.assertEqual(len(self.index), 60)
+        self.assertEqual(self.index.get("000007"), replacement)
+        self.assertEqual(
+            self.index.evaluate(
+                MarcBoolQuery(
+                    must=[
+                        MarcCondition(
+                            field="245",
+                            value="Volume 7 ",
+                            operator="startswith",
+                        )
+                    ]
+                )
+            ),
+            set(),
+        )
+        self.assertEqual(self.index.evaluate(query), set())
+
+        self.assertTrue(self.index.remove("000007"))
+        self.assertFalse(self.index.remove("000007"))
+        self.assertIsNone(self.index.get("000007"))
+        self.assertEqual(len(self.index), 59)
+
+    def test_persistence(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "index.sqlite")
+            with SqliteMarcIndex(path, CONTEXT) as index:
+                index.add_many(self.records)
+
+            with SqliteMarcIndex(path, CONTEXT) as index:
+                self.assertEqual(len(index), 60)
+                self.assertEqual(index.get("000042"), self.records[42])
+
+    def test_record_without_control_number(self):
+        record = build_record(1)
+        del record.fixed_fields.root["001"]
+        with self.assertRaises(ValueError):
+            self.index.add(record)
@@ -0,0 +1,106 @@
+import io
+import os
+import tempfile
+import unittest
+
+from helpers import build_xml, datafield
+from lxml import etree
+
+from marcdantic.context import MarcContext
+from marcdantic.fields import VariableField
+from marcdantic.readers import iter_mrc, iter_xml
+from marcdantic.record import MarcRecord
+from marcdantic.to_mrc import to_mrc
+from marcdantic.writers import MrcWriter, XmlWriter
+
+
+class TestWriters(unittest.TestCase):
+    def setUp(self):
+        self.context = MarcContext()
+        self.records = [
+            MarcRecord.from_xml(
+                etree.fromstring(
+                    build_xml(
+                        f"{number:06d}",
+                        f"Dvořák & {number}",
+                        datafield(
+                            "100",
+                            "1 ",
+                            ("a", "Smetana, Bedřich"),
+                            ("d", "1824-1884"),
+                        ),
+                        datafield("650", " 7", ("a", "Hudba")),
+                        datafield("650", " 7", ("a", "Opera")),
+                        title_indicators="1 ",
+                    )
+                )
+            )
+            for number in range(5)
+        ]
+
+    def test_to_mrc_matches_parsed_input(self):
+        for record in self.records:
+            self.assertEqual(record.to_mrc(), record._marc)
+
+        lazy = MarcRecord.from_mrc(
+            self.records[0]._marc, MarcContext(lazy_fields=True)
+        )
+        self.assertEqual(lazy.to_mrc(), self.records[0]._marc)
+
+    def test_to_mrc_reflects_changes(self):
+        record = self.records[0]
+        record.fixed_fields.root["001"] = "changed"
+        record.variable_fields.root["500"] = [
+            VariableField(ind1=None, ind2=None, subfields={"a": ["Note"]})
+        ]
+
+        parsed = MarcRecord.from_mrc(record.to_mrc())
+        self.assertEqual(parsed.fixed_fields.root["001"], "changed")
+        self.assertEqual(
+            parsed.variable_fields.root["500"][0].subfields, {"a": ["Note"]}
+        )
+        self.assertEqual(parsed.variable_fields, record.variable_fields)
+
+    def test_to_mrc_encoding(self):
+        data = self.records[0].to_mrc("marc8")
+        self.assertEqual(data[9:10], b" ")
+        self.assertIn(b"Dvo\xe9r\xe2ak", data)
+
+        record = MarcRecord.from_mrc(data, MarcContext(mrc_encoding="auto"))
+        self.assertEqual(record.encoding, "marc8")
+        self.assertEqual(record.to_mrc(), data)
+        self.assertEqual(record.to_mrc("utf-8"), self.records[0].to_mrc())
+
+        with self.assertRaises(ValueError):
+            to_mrc("short", {}, {})
+
+    def test_to_xml(self):
+        record = self.records[1]
+        element = etree.fromstring(record.to_xml())
+        self.assertEqual(etree.QName(element).localname, "record")
+        self.assertEqual(MarcRecord.from_xml(element), record)
+
+    def test_mrc_writer(self):
+        output = io.BytesIO()
+        with MrcWriter(output) as writer:
+            writer.write_all(self.records)
+        self.assertEqual(writer.record_count, 5)
+        self.assertFalse(output.closed)
+
+        output.seek(0)
+        self.assertEqual(list(iter_mrc(output)), self.records)
+
+    def test_xml_writer(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "out.xml")
+            with XmlWriter(path) as writer:
+                for record in self.records:
+                    writer.write(record)
+
+            with open(path, "rb") as file:
+                document = file.read()
+            records = list(iter_xml(path))
+
+        self.assertTrue(document.startswith(b"<?xml"))
+        self.assertEqual(document.count(b"xmlns="), 1)
+        self.assertEqual(records, self.records)